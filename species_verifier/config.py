@@ -30,6 +30,11 @@ class AppConfig:
     LARGE_FILE_WARNING_THRESHOLD = 100  # 100개 이상 시 경고 표시
     CRITICAL_FILE_WARNING_THRESHOLD = 300  # 300개 이상 시 강력 경고 표시
     
+    # 프로세스 내 L1 메모리 캐시 (LRU + TTL)
+    MEMORY_CACHE_MAX_ENTRIES = int(os.getenv("MEMORY_CACHE_MAX_ENTRIES", "5000"))  # 최대 항목 수
+    MEMORY_CACHE_TTL = int(os.getenv("MEMORY_CACHE_TTL", str(6 * 3600)))  # 항목 유지 시간 (초)
+    MEMORY_NEGATIVE_CACHE_TTL = int(os.getenv("MEMORY_NEGATIVE_CACHE_TTL", str(30 * 60)))  # 찾지 못함 결과 유지 시간 (초)
+    
     # 로깅 설정
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_FILE = os.getenv("LOG_FILE", "species_verifier.log")
@@ -43,6 +48,7 @@ class APIConfig:
     # WoRMS API 설정
     WORMS_API_URL = os.getenv("WORMS_API_URL", "https://www.marinespecies.org/rest")
     WORMS_REQUEST_DELAY = float(os.getenv("WORMS_REQUEST_DELAY", "1.0"))  # 연속 요청 시 딜레이 (초)
+    WORMS_MATCH_BATCH_SIZE = int(os.getenv("WORMS_MATCH_BATCH_SIZE", "50"))  # AphiaRecordsByMatchNames 1회 요청당 학명 수 (WoRMS 최대 50)
     
     # LPSN 관련 설정 
     LPSN_BASE_URL = "https://lpsn.dsmz.de/species"
@@ -92,6 +98,60 @@ class APIConfig:
     CONNECTION_POOL_SIZE = int(os.getenv("CONNECTION_POOL_SIZE", "10"))
     CONNECTION_POOL_MAXSIZE = int(os.getenv("CONNECTION_POOL_MAXSIZE", "20"))
 
+    # 업스트림별 속도 제한 (토큰 버킷: rate=초당 요청 수, burst=순간 허용 요청 수)
+    RATE_LIMITS = {
+        "worms": {
+            "rate": float(os.getenv("WORMS_RATE_LIMIT", str(1.0 / WORMS_REQUEST_DELAY))),
+            "burst": int(os.getenv("WORMS_RATE_BURST", "3")),
+            "min_rate": 0.1,
+            "max_rate": float(os.getenv("WORMS_RATE_MAX", "5.0")),
+        },
+        "col": {
+            "rate": float(os.getenv("COL_RATE_LIMIT", "1.0")),
+            "burst": int(os.getenv("COL_RATE_BURST", "3")),
+            "min_rate": 0.1,
+            "max_rate": float(os.getenv("COL_RATE_MAX", "5.0")),
+        },
+        "lpsn": {
+            "rate": float(os.getenv("LPSN_RATE_LIMIT", str(1.0 / LPSN_REQUEST_DELAY))),  # 계정 차단 위험이 가장 높음
+            "burst": int(os.getenv("LPSN_RATE_BURST", "1")),
+            "min_rate": 0.05,
+            "max_rate": float(os.getenv("LPSN_RATE_MAX", "1.0")),
+        },
+        "wikipedia": {
+            "rate": float(os.getenv("WIKIPEDIA_RATE_LIMIT", "1.0")),
+            "burst": int(os.getenv("WIKIPEDIA_RATE_BURST", "2")),
+            "min_rate": 0.1,
+            "max_rate": float(os.getenv("WIKIPEDIA_RATE_MAX", "3.0")),
+        },
+    }
+    # 적응형 속도 조절 (정상 응답 시 조금씩 증가, 429/503 시 배수로 감소 + Retry-After 준수)
+    ADAPTIVE_RATE_CONFIG = {
+        "enabled": os.getenv("ADAPTIVE_RATE_ENABLED", "true").lower() == "true",
+        "increase_step": float(os.getenv("ADAPTIVE_RATE_INCREASE", "0.05")),  # 정상 응답마다 늘릴 초당 요청 수
+        "decrease_factor": float(os.getenv("ADAPTIVE_RATE_DECREASE", "0.5")),  # 429/503 응답 시 곱할 비율
+        "max_retry_after": int(os.getenv("ADAPTIVE_MAX_RETRY_AFTER", "120")),  # Retry-After 최대 대기(초)
+    }
+    # 동시 검증 파이프라인의 소스별 최대 작업자 수 (호출 간격은 위 속도 제한이 지킴)
+    PIPELINE_WORKERS = {
+        "marine": int(os.getenv("PIPELINE_MARINE_WORKERS", "2")),
+        "microbe": int(os.getenv("PIPELINE_MICROBE_WORKERS", "1")),
+        "col": int(os.getenv("PIPELINE_COL_WORKERS", "3")),
+    }
+    # 비동기(httpx) 클라이언트의 소스별 최대 동시 요청 수
+    ASYNC_CONCURRENCY = {
+        "worms": int(os.getenv("ASYNC_WORMS_CONCURRENCY", "4")),
+        "col": int(os.getenv("ASYNC_COL_CONCURRENCY", "8")),
+        "lpsn": int(os.getenv("ASYNC_LPSN_CONCURRENCY", "2")),
+    }
+    # 호스트명 → 속도 제한 source 매핑
+    RATE_LIMIT_HOSTS = {
+        "www.marinespecies.org": "worms",
+        "api.catalogueoflife.org": "col",
+        "lpsn.dsmz.de": "lpsn",
+        "api.lpsn.dsmz.de": "lpsn",
+    }
+
 class UIConfig:
     """사용자 인터페이스 관련 설정"""
     # 창 크기
@@ -110,7 +170,8 @@ SSL_CONFIG = {
     "allow_insecure_fallback": True,  # 기업 환경 지원 (False로 설정하면 SSL 우회 비활성화)
     "log_ssl_bypass": True,  # SSL 우회 사용 시 로깅
     "prefer_secure": True,   # 항상 SSL 검증을 먼저 시도
-    "bypass_warning": True   # SSL 우회 시 사용자 알림 표시
+    "bypass_warning": True,  # SSL 우회 시 사용자 알림 표시
+    "policy_ttl_seconds": int(os.getenv("SSL_POLICY_TTL", "3600"))  # 호스트별 SSL 검증 결정 유지 시간(초)
 }
 
 # 기본 설정 인스턴스 생성
@@ -144,7 +205,7 @@ ENTERPRISE_CONFIG = {
     # 재시도 전략 (네트워크 불안정 대응)
     "enhanced_retry": {
         "backoff_factor": 2.0,  # 표준 지수 백오프
-        "status_forcelist": [429, 500, 502, 503, 504],  # 일반적인 재시도 상태 코드
+        "status_forcelist": [500, 502, 504],  # 429/503은 적응형 속도 조절(rate_limiter)이 처리
         "allowed_methods": ["GET", "POST"]  # 표준 HTTP 메서드만
     }
 } 
\ No newline at end of file
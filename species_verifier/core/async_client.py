@@ -0,0 +1,359 @@
+"""
+비동기(asyncio/httpx) 검증 클라이언트 모듈
+
+WoRMS, COL, LPSN 요청을 하나의 이벤트 루프에서 겹쳐 처리합니다.
+- httpx.AsyncClient 연결 풀(keep-alive) 재사용
+- 소스별 세마포어로 동시 요청 수 제한
+- 호출 간격은 core.rate_limiter 토큰 버킷(429/503 적응형 조절 포함)을 공유
+- 작업(Task) 취소로 진행 중인 검증을 중단
+
+httpx가 설치되지 않은 환경에서는 기존 동기 함수를 스레드로 실행하여 같은 인터페이스를 제공합니다.
+"""
+import asyncio
+import ssl
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    httpx = None
+    HAS_HTTPX = False
+
+from species_verifier.core.rate_limiter import THROTTLE_STATUS_CODES, get_rate_limiter
+from species_verifier.core.memory_cache import get_memory_cache
+from species_verifier.core.single_flight import AsyncSingleFlight, _copy_for_caller
+from species_verifier.utils.text_processor import normalize_lookup_key
+from species_verifier.core.tls_policy import get_tls_policy_cache
+
+try:
+    from species_verifier.config import api_config
+    WORMS_BASE_URL = api_config.WORMS_API_URL
+    REQUEST_TIMEOUT = api_config.REQUEST_TIMEOUT
+    COL_REQUEST_TIMEOUT = api_config.COL_REQUEST_TIMEOUT
+    DEFAULT_HEADERS = api_config.DEFAULT_HEADERS
+    POOL_CONNECTIONS = api_config.CONNECTION_POOL_SIZE
+    POOL_MAXSIZE = api_config.CONNECTION_POOL_MAXSIZE
+    MAX_RETRIES = api_config.MAX_RETRIES
+    MATCH_BATCH_SIZE = api_config.WORMS_MATCH_BATCH_SIZE
+    ASYNC_CONCURRENCY = api_config.ASYNC_CONCURRENCY
+except ImportError:
+    # 설정 파일이 없는 경우 기본값 사용
+    WORMS_BASE_URL = "https://www.marinespecies.org/rest"
+    REQUEST_TIMEOUT = 20
+    COL_REQUEST_TIMEOUT = 20
+    DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    MAX_RETRIES = 3
+    MATCH_BATCH_SIZE = 50
+    ASYNC_CONCURRENCY = {"worms": 4, "col": 8, "lpsn": 2}
+
+# GUI 탭 타입 → 속도 제한 source 이름
+SOURCE_ALIASES = {"marine": "worms", "microbe": "lpsn", "col": "col", "worms": "worms", "lpsn": "lpsn"}
+
+
+def _is_ssl_error(error: BaseException) -> bool:
+    """예외 체인에 SSL 인증서 오류가 있는지 확인"""
+    current = error
+    while current is not None:
+        if isinstance(current, ssl.SSLError) or "CERTIFICATE_VERIFY_FAILED" in str(current):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+class AsyncVerificationClient:
+    """WoRMS/COL/LPSN 비동기 검증 클라이언트 (async with 사용 권장)"""
+
+    def __init__(self, concurrency: Optional[Dict[str, int]] = None, timeout: Optional[float] = None):
+        """
+        초기화 함수
+
+        Args:
+            concurrency: 소스별 최대 동시 요청 수 (기본값: APIConfig.ASYNC_CONCURRENCY)
+            timeout: 요청 타임아웃(초) (기본값: APIConfig.REQUEST_TIMEOUT)
+        """
+        self.concurrency = dict(ASYNC_CONCURRENCY)
+        if concurrency:
+            self.concurrency.update(concurrency)
+        self.timeout = timeout or REQUEST_TIMEOUT
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._clients: Dict[bool, Any] = {}
+        self._flight = AsyncSingleFlight()  # 같은 학명 동시 요청 병합
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """연결 풀을 닫습니다."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception:
+                pass  # 종료 중 오류는 무시
+
+    def _get_client(self, verify: bool):
+        """SSL 검증 여부별 공유 AsyncClient 반환 (없으면 생성)"""
+        client = self._clients.get(verify)
+        if client is None:
+            headers = dict(DEFAULT_HEADERS)
+            headers['Accept-Encoding'] = 'gzip, deflate'
+            client = httpx.AsyncClient(
+                headers=headers,
+                timeout=self.timeout,
+                verify=verify,
+                follow_redirects=True,
+                trust_env=True,  # 시스템 프록시 설정 사용 (보안 정책 준수)
+                limits=httpx.Limits(
+                    max_connections=POOL_MAXSIZE,
+                    max_keepalive_connections=POOL_CONNECTIONS
+                )
+            )
+            self._clients[verify] = client
+        return client
+
+    def _semaphore(self, source: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(source)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, int(self.concurrency.get(source, 1))))
+            self._semaphores[source] = semaphore
+        return semaphore
+
+    async def request(self, source: str, method: str, url: str, **kwargs):
+        """
+        속도 제한, 동시 요청 제한, 호스트별 TLS 정책을 적용해 요청합니다.
+        429/503 응답은 Retry-After를 지켜 최대 MAX_RETRIES번 다시 요청합니다.
+        """
+        rate_limiter = get_rate_limiter()
+        bucket = rate_limiter.get(source)
+        policy = get_tls_policy_cache()
+        host = urlparse(url).hostname or ""
+
+        async with self._semaphore(source):
+            response = None
+            for attempt in range(MAX_RETRIES + 1):
+                wait = bucket.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                verify = policy.get_verify(host) is not False
+                try:
+                    response = await self._get_client(verify).request(method, url, **kwargs)
+                    if verify:
+                        policy.record(host, True)
+                except httpx.ConnectError as e:
+                    if not (verify and _is_ssl_error(e) and policy.allow_insecure_fallback):
+                        raise
+                    policy.record(host, False)
+                    response = await self._get_client(False).request(method, url, **kwargs)
+
+                rate_limiter.record_response(source, response.status_code, response.headers.get('Retry-After'))
+                if response.status_code not in THROTTLE_STATUS_CODES:
+                    break
+                if attempt < MAX_RETRIES:
+                    print(f"[Info Async] {source} 요청 제한 응답({response.status_code}) - 재시도 {attempt + 1}/{MAX_RETRIES}")
+            return response
+
+    async def verify_worms_batch(self, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        WoRMS 일괄 매칭(최대 MATCH_BATCH_SIZE개)으로 해양생물 학명을 검증합니다.
+        L1 메모리 캐시에 있는 학명은 바로 사용하고, 다른 일괄 매칭에서 진행 중인 학명은 그 결과를 공유합니다.
+        """
+        from species_verifier.core.worms_api import verify_species_list
+
+        names = list(names)
+        if not HAS_HTTPX:
+            return await asyncio.to_thread(verify_species_list, names)
+
+        # L1 메모리 캐시 우선 조회
+        memory_cache = get_memory_cache()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(names)
+        pending = []
+        for index, name in enumerate(names):
+            cached = memory_cache.get("worms", name) if isinstance(name, str) else None
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.append(index)
+        if not pending:
+            return results
+
+        pending_names = [names[index] for index in pending]
+        # 정규화할 수 없는 이름은 병합하지 않음 (고유 키 사용)
+        keys = [("worms", normalize_lookup_key(name) if isinstance(name, str) else None) for name in pending_names]
+        keys = [key if key[1] else object() for key in keys]
+
+        async def fetch(positions: List[int]) -> List[Dict[str, Any]]:
+            chunk = [pending_names[position] for position in positions]
+            chunk_results = await self._match_worms_names(chunk)
+            for name, result in zip(chunk, chunk_results):
+                memory_cache.set("worms", name, result)
+            return chunk_results
+
+        for index, (result, shared) in zip(pending, await self._flight.do_many(keys, fetch)):
+            results[index] = _copy_for_caller(result, names[index]) if shared else result
+        return results
+
+    async def _match_worms_names(self, names: List[str]) -> List[Dict[str, Any]]:
+        """AphiaRecordsByMatchNames 요청 1회로 학명 목록을 검증합니다 (입력 순서 결과)."""
+        from species_verifier.core.worms_api import _build_match_results, _normalize_match_records
+
+        try:
+            response = await self.request(
+                "worms", "GET", f"{WORMS_BASE_URL}/AphiaRecordsByMatchNames",
+                params={"scientificnames[]": list(names), "marine_only": "false"}
+            )
+            response.raise_for_status()
+            if not response.content or response.status_code == 204:
+                matches = [[] for _ in names]
+            else:
+                matches = _normalize_match_records(names, response.json())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"[Error Async] WoRMS 일괄 매칭 실패: {e}")
+            matches = {"error": f"WoRMS 네트워크 오류 (AphiaRecordsByMatchNames): {e}"}
+
+        return _build_match_results(list(names), matches)
+
+    async def _coalesced(self, source: str, name: str, coro_factory) -> Dict[str, Any]:
+        """L1 메모리 캐시를 먼저 확인하고, 같은 (source, 정규화 학명)의 진행 중인 검증이 있으면 그 결과를 공유합니다."""
+        key = normalize_lookup_key(name)
+        if not key:
+            return await coro_factory()
+        memory_cache = get_memory_cache()
+        cached = memory_cache.get(source, name)
+        if cached is not None:
+            return cached
+        result, shared = await self._flight.do((source, key), coro_factory)
+        if not shared:
+            memory_cache.set(source, name, result)
+        return _copy_for_caller(result, name)
+
+    async def verify_col(self, name: str) -> Dict[str, Any]:
+        """COL에서 학명 하나를 검증합니다 (같은 학명 동시 요청은 병합)."""
+        return await self._coalesced("col", name, lambda: self._verify_col(name))
+
+    async def verify_lpsn(self, name: str) -> Dict[str, Any]:
+        """LPSN 검색 페이지로 미생물 학명 하나를 검증합니다 (같은 학명 동시 요청은 병합)."""
+        return await self._coalesced("lpsn", name, lambda: self._verify_lpsn(name))
+
+    async def _verify_col(self, name: str) -> Dict[str, Any]:
+        """COL에서 학명 하나를 검증합니다."""
+        from species_verifier.core.col_api import (
+            COL_SEARCH_URL, build_col_result, create_col_error_result, verify_col_species
+        )
+
+        if not HAS_HTTPX:
+            return await asyncio.to_thread(verify_col_species, name)
+
+        try:
+            response = await self.request(
+                "col", "GET", COL_SEARCH_URL,
+                params={"q": name, "limit": 1, "type": "EXACT"},
+                timeout=COL_REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            return build_col_result(name, response.json())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return create_col_error_result(name, f"네트워크 오류: {str(e)}", "Network Error",
+                                           "network_error", f"네트워크 오류: {str(e)}")
+
+    async def _verify_lpsn(self, name: str) -> Dict[str, Any]:
+        """LPSN 검색 페이지로 미생물 학명 하나를 검증합니다."""
+        from species_verifier.core.lpsn_scraper import (
+            LPSN_HEADERS, apply_lpsn_search_page, build_lpsn_search_url,
+            clean_scientific_name, create_lpsn_base_result, verify_microbe_lpsn_scraping
+        )
+
+        if not HAS_HTTPX:
+            return await asyncio.to_thread(verify_microbe_lpsn_scraping, name)
+
+        cleaned_name = clean_scientific_name(name)
+        base_result = create_lpsn_base_result(name, cleaned_name)
+        if not cleaned_name or len(cleaned_name) < 3:
+            base_result['status'] = 'Invalid input'
+            return base_result
+
+        try:
+            response = await self.request(
+                "lpsn", "GET", build_lpsn_search_url(cleaned_name),
+                headers=LPSN_HEADERS, timeout=15
+            )
+            if response.status_code != 200:
+                base_result['status'] = f'LPSN 접속 오류 (HTTP {response.status_code})'
+                return base_result
+            return apply_lpsn_search_page(base_result, response.content, cleaned_name)
+        except asyncio.CancelledError:
+            raise
+        except httpx.TimeoutException:
+            base_result['status'] = 'LPSN 연결 타임아웃'
+        except httpx.TransportError:
+            base_result['status'] = 'LPSN 연결 실패'
+        except Exception as e:
+            print(f"[Error Async] LPSN 검증 오류: {e}")
+            base_result['status'] = 'LPSN 스크래핑 오류'
+        return base_result
+
+    async def verify_many(self, names: List[str], source: str = "worms",
+                          callback: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        학명 목록을 동시에 검증합니다 (결과는 입력 순서).
+
+        Args:
+            names: 검증할 학명 목록
+            source: 'worms'/'marine', 'col', 'lpsn'/'microbe'
+            callback: 결과가 나올 때마다 호출할 함수
+
+        Returns:
+            검증 결과 목록 (작업이 취소되면 asyncio.CancelledError 발생,
+            한 단위가 예외로 끝나면 나머지 단위를 취소하고 그 예외를 다시 발생)
+        """
+        source = SOURCE_ALIASES.get(source, source)
+        if source == "worms":
+            units = [names[i:i + MATCH_BATCH_SIZE] for i in range(0, len(names), MATCH_BATCH_SIZE)]
+            verify_unit = self.verify_worms_batch
+        elif source == "col":
+            units = [[name] for name in names]
+            verify_unit = lambda unit: self._as_list(self.verify_col(unit[0]))
+        elif source == "lpsn":
+            units = [[name] for name in names]
+            verify_unit = lambda unit: self._as_list(self.verify_lpsn(unit[0]))
+        else:
+            raise ValueError(f"지원하지 않는 검증 소스: {source}")
+
+        async def run_unit(unit):
+            unit_results = await verify_unit(unit)
+            if callback:
+                for result in unit_results:
+                    callback(result)
+            return unit_results
+
+        tasks = [asyncio.ensure_future(run_unit(unit)) for unit in units]
+        try:
+            unit_results = await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            print(f"[Info Async] {source} 비동기 검증 취소됨")
+            raise
+        finally:
+            # 취소나 한 작업의 예외(콜백 예외 포함)로 끝나면 남은 작업도 취소해 토큰/연결을 더 쓰지 않게 함
+            remaining = [task for task in tasks if not task.done()]
+            for task in remaining:
+                task.cancel()
+            if remaining:
+                await asyncio.gather(*remaining, return_exceptions=True)
+
+        return [result for results in unit_results for result in results]
+
+    @staticmethod
+    async def _as_list(coroutine) -> List[Dict[str, Any]]:
+        return [await coroutine]
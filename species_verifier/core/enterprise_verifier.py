@@ -56,8 +56,7 @@ class EnterpriseWoRMSVerifier:
                     'worms_id': None
                 }
             
-            # 상세 정보 조회
-            time.sleep(1.5)  # 기관 네트워크에서는 더 보수적인 간격
+            # 상세 정보 조회 (호출 간격은 safe_api_call의 속도 제한이 담당)
             
             detail_url = f"{self.base_url}/AphiaRecordByAphiaID/{aphia_id}"
             detail_response = self.adapter.safe_api_call(
@@ -219,9 +218,6 @@ class EnterpriseLPSNAPIClient:
                 'page': 1
             }
             
-            import time
-            time.sleep(0.5)  # API 호출 간격
-            
             response = self.adapter.safe_api_call(
                 url=search_url,
                 method='GET',
@@ -266,7 +262,6 @@ class EnterpriseLPSNAPIClient:
                 return None
             
             # Detail API 호출
-            time.sleep(0.5)  # API 호출 간격
             detail_url = f"{self.api_base_url}/fetch/{lpsn_id}"
             
             detail_response = self.adapter.safe_api_call(
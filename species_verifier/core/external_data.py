@@ -2,6 +2,8 @@ import wikipediaapi
 import requests
 import urllib3
 from .gemini_api import format_worms_result_with_gemini
+from .tls_policy import get_tls_policy_cache
+from .rate_limiter import acquire as acquire_rate_limit
 
 # SSL 경고 관리 (보안 강화)
 try:
@@ -16,50 +18,25 @@ except ImportError:
 def get_wikipedia_summary(scientific_name, lang='en'):
     """위키피디아에서 학명에 대한 요약 정보를 가져옵니다. (보안 강화)"""
     try:
-        from species_verifier.config import SSL_CONFIG
+        def fetch_summary(verify):
+            wiki = wikipediaapi.Wikipedia(
+                language=lang,
+                user_agent='SpeciesVerifier/1.0'
+            )
+            
+            # wikipediaapi 세션에 SSL 설정 적용
+            session = getattr(wiki, '_session', None) or getattr(wiki, 'session', None)
+            if session is not None:
+                session.verify = verify
+            
+            acquire_rate_limit("wikipedia")
+            page = wiki.page(scientific_name)
+            if page.exists():
+                return page.summary
+            return None
         
-        # SSL 설정 (보안 우선)
-        ssl_configs = [
-            {'verify': True, 'description': 'SSL 검증 활성화'}
-        ]
-        
-        # 기업 환경 지원이 활성화된 경우에만 SSL 우회 추가
-        if SSL_CONFIG.get("allow_insecure_fallback", False):
-            ssl_configs.append({
-                'verify': False, 
-                'description': 'SSL 검증 우회 (기업 환경)'
-            })
-        
-        for ssl_config in ssl_configs:
-            try:
-                # SSL 우회 사용 시 조용히 처리
-                
-                # wikipediaapi에 SSL 설정 적용
-                wiki = wikipediaapi.Wikipedia(
-                    language=lang,
-                    user_agent='SpeciesVerifier/1.0'
-                )
-                
-                # 세션 설정 적용
-                if hasattr(wiki, 'session'):
-                    wiki.session.verify = ssl_config['verify']
-                
-                page = wiki.page(scientific_name)
-                if page.exists():
-                    # 연결 성공 - 조용히 처리
-                    return page.summary
-                return None
-                
-            except requests.exceptions.SSLError:
-                if ssl_config['verify']:
-                    continue  # SSL 검증 실패시 다음 설정으로 시도
-                else:
-                    raise  # SSL 우회도 실패하면 예외 발생
-            except Exception as e:
-                if ssl_config['verify']:
-                    continue  # 기타 오류시 다음 설정으로 시도
-                else:
-                    raise  # SSL 우회도 실패하면 예외 발생
+        # 호스트별 TLS 정책에 따라 SSL 검증 여부 결정 (SSL 오류일 때만 우회)
+        return get_tls_policy_cache().call(f"{lang}.wikipedia.org", fetch_summary)
                     
     except Exception as e:
         # 조용히 실패 처리
@@ -0,0 +1,142 @@
+"""
+공용 HTTP 세션(연결 풀) 관리 모듈
+
+외부 API 클라이언트가 요청마다 새 TCP/TLS 연결을 맺지 않도록
+클라이언트별 keep-alive 세션을 스레드 안전하게 생성하고 공유합니다.
+"""
+import threading
+from typing import Callable, Dict, Optional
+
+import requests
+
+from species_verifier.core.tls_policy import TLSPolicyAdapter
+from species_verifier.core.rate_limiter import THROTTLE_STATUS_CODES, get_rate_limiter
+
+try:
+    from species_verifier.config import api_config
+    POOL_CONNECTIONS = api_config.CONNECTION_POOL_SIZE
+    POOL_MAXSIZE = api_config.CONNECTION_POOL_MAXSIZE
+    DEFAULT_HEADERS = api_config.DEFAULT_HEADERS
+    MAX_RETRIES = api_config.MAX_RETRIES
+except ImportError:
+    # 설정 파일이 없는 경우 기본값 사용
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 20
+    DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    MAX_RETRIES = 3
+
+
+class PooledSessionManager:
+    """클라이언트 이름별 keep-alive 세션을 관리하는 스레드 안전 관리자"""
+
+    def __init__(self, pool_connections: int = None, pool_maxsize: int = None):
+        """
+        초기화 함수
+
+        Args:
+            pool_connections: 호스트별 연결 풀 수 (기본값: APIConfig.CONNECTION_POOL_SIZE)
+            pool_maxsize: 풀당 최대 연결 수 (기본값: APIConfig.CONNECTION_POOL_MAXSIZE)
+        """
+        self.pool_connections = pool_connections or POOL_CONNECTIONS
+        self.pool_maxsize = max(pool_maxsize or POOL_MAXSIZE, self.pool_connections)
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, name: str, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+        """이름에 해당하는 공유 세션을 반환합니다 (없으면 생성)."""
+        session = self._sessions.get(name)
+        if session is not None:
+            return session
+
+        with self._lock:
+            # 다른 스레드가 먼저 생성했는지 다시 확인
+            session = self._sessions.get(name)
+            if session is None:
+                session = self._create_session(headers)
+                self._sessions[name] = session
+                print(f"[Info] HTTP 연결 풀 세션 생성: {name} (pool={self.pool_connections}/{self.pool_maxsize})")
+            return session
+
+    def _create_session(self, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+        """keep-alive + gzip 압축 + 호스트별 TLS 정책을 사용하는 세션 생성"""
+        session = requests.Session()
+
+        adapter = TLSPolicyAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.headers.update(headers or DEFAULT_HEADERS)
+        # requests가 기본 지원하는 압축만 요청 (br은 brotli 패키지가 있어야 해제 가능)
+        session.headers['Accept-Encoding'] = 'gzip, deflate'
+        session.headers['Connection'] = 'keep-alive'
+
+        # 시스템 프록시 설정 사용 (보안 정책 준수)
+        session.trust_env = True
+        return session
+
+    def close(self, name: Optional[str] = None):
+        """세션을 닫습니다 (name이 없으면 전체)."""
+        with self._lock:
+            names = [name] if name else list(self._sessions.keys())
+            for session_name in names:
+                session = self._sessions.pop(session_name, None)
+                if session is not None:
+                    try:
+                        session.close()
+                    except Exception:
+                        pass  # 세션 정리 실패는 무시
+
+
+# 전역 세션 관리자 인스턴스
+_session_manager = PooledSessionManager()
+
+def get_session_manager() -> PooledSessionManager:
+    """전역 세션 관리자 인스턴스 반환"""
+    return _session_manager
+
+def get_pooled_session(name: str, headers: Optional[Dict[str, str]] = None) -> requests.Session:
+    """이름에 해당하는 공유 keep-alive 세션 반환"""
+    return _session_manager.get_session(name, headers)
+
+def throttled_request(session: requests.Session, source: str, method: str, url: str,
+                      check_cancelled: Optional[Callable[[], bool]] = None,
+                      max_retries: Optional[int] = None, **kwargs) -> Optional[requests.Response]:
+    """
+    업스트림 속도 제한을 적용해 요청을 보냅니다.
+
+    요청 전 source의 토큰을 얻고, 응답 상태로 속도를 조절합니다.
+    429/503 응답은 Retry-After를 지켜 최대 max_retries번 다시 요청합니다.
+
+    Args:
+        session: 사용할 requests 세션
+        source: 속도 제한 source 이름 (예: 'worms', 'col', 'lpsn')
+        method: HTTP 메서드
+        url: 요청 URL
+        check_cancelled: 취소 여부 확인 함수
+        max_retries: 429/503 재시도 횟수 (기본값: APIConfig.MAX_RETRIES)
+        **kwargs: session.request에 전달할 인자
+
+    Returns:
+        응답 객체 (대기 중 취소된 경우 None)
+    """
+    rate_limiter = get_rate_limiter()
+    retries = MAX_RETRIES if max_retries is None else max_retries
+    response = None
+
+    for attempt in range(retries + 1):
+        if not rate_limiter.acquire(source, check_cancelled):
+            return None
+
+        response = session.request(method, url, **kwargs)
+        rate_limiter.record_response(source, response.status_code, response.headers.get('Retry-After'))
+
+        if response.status_code not in THROTTLE_STATUS_CODES:
+            break
+        if attempt < retries:
+            print(f"[Info] {source} 요청 제한 응답({response.status_code}) - 재시도 {attempt + 1}/{retries}")
+
+    return response
@@ -14,6 +14,9 @@ from typing import Dict, Any, Optional
 from urllib.parse import quote_plus
 from bs4 import BeautifulSoup
 
+from species_verifier.core.http_session import throttled_request
+from species_verifier.core.single_flight import single_flight
+
 
 def clean_scientific_name(name: str) -> str:
     """학명 정리 (공통 유틸리티 함수)"""
@@ -30,6 +33,74 @@ def clean_scientific_name(name: str) -> str:
     return cleaned.strip()
 
 
+LPSN_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+
+def build_lpsn_search_url(cleaned_name: str) -> str:
+    """LPSN 검색 URL 생성"""
+    return f"https://lpsn.dsmz.de/search?word={quote_plus(cleaned_name)}"
+
+
+def create_lpsn_base_result(microbe_name: str, cleaned_name: str) -> Dict[str, Any]:
+    """LPSN 검증 기본 결과 구조 생성 (동기/비동기 클라이언트 공용)"""
+    return {
+        'input_name': microbe_name,
+        'scientific_name': cleaned_name,
+        'is_verified': False,
+        'valid_name': cleaned_name,
+        'status': 'Not found in LPSN',
+        'taxonomy': 'Domain: Bacteria',
+        'lpsn_link': build_lpsn_search_url(cleaned_name),
+        'wiki_summary': '-',
+        'korean_name': '-',
+        'is_microbe': True
+    }
+
+
+def apply_lpsn_search_page(base_result: Dict[str, Any], content: bytes, cleaned_name: str) -> Dict[str, Any]:
+    """LPSN 검색 결과 페이지(HTML)를 파싱해 결과 딕셔너리에 반영합니다 (동기/비동기 클라이언트 공용)."""
+    # HTML 파싱
+    soup = BeautifulSoup(content, 'html.parser')
+    
+    # 검색 결과 확인
+    results = parse_lpsn_search_results(soup, cleaned_name)
+    
+    if results:
+        # 검증 성공
+        result_data = results[0]  # 첫 번째 결과 사용
+        
+        base_result.update({
+            'scientific_name': result_data.get('name', cleaned_name),
+            'is_verified': True,
+            'valid_name': result_data.get('name', cleaned_name),
+            'status': f"LPSN 검증됨: {result_data.get('status', 'valid')}",
+            'taxonomy': result_data.get('taxonomy', 'Domain: Bacteria'),
+            'lpsn_link': result_data.get('link', base_result['lpsn_link']),
+            'wiki_summary': f"✅ LPSN에서 검증되었습니다.\n상태: {result_data.get('status', 'valid')}"
+        })
+        
+        print(f"[Info LPSN Scraper] 검증 성공: '{result_data.get('name', cleaned_name)}'")
+        
+    else:
+        # 검색 결과 없음
+        print(f"[Info LPSN Scraper] 검색 결과 없음: '{cleaned_name}'")
+        base_result.update({
+            'status': 'LPSN 검색됨: 결과 없음',
+            'taxonomy': 'Domain: Bacteria (추정)',
+            'wiki_summary': f"LPSN에서 '{cleaned_name}'을 검색했으나 결과가 없습니다."
+        })
+    
+    return base_result
+
+
+@single_flight("lpsn_scraping")  # verify_single_microbe_lpsn("lpsn")에서 중첩 호출되므로 별도 키 사용
 def verify_microbe_lpsn_scraping(microbe_name: str) -> Dict[str, Any]:
     """
     LPSN 웹사이트 스크래핑을 통한 미생물 학명 검증
@@ -47,18 +118,7 @@ def verify_microbe_lpsn_scraping(microbe_name: str) -> Dict[str, Any]:
     cleaned_name = clean_scientific_name(microbe_name)
     
     # 기본 결과 구조
-    base_result = {
-        'input_name': microbe_name,
-        'scientific_name': cleaned_name,
-        'is_verified': False,
-        'valid_name': cleaned_name,
-        'status': 'Not found in LPSN',
-        'taxonomy': 'Domain: Bacteria',
-        'lpsn_link': f"https://lpsn.dsmz.de/search?word={quote_plus(cleaned_name)}",
-        'wiki_summary': '-',
-        'korean_name': '-',
-        'is_microbe': True
-    }
+    base_result = create_lpsn_base_result(microbe_name, cleaned_name)
     
     if not cleaned_name or len(cleaned_name) < 3:
         base_result['status'] = 'Invalid input'
@@ -66,61 +126,24 @@ def verify_microbe_lpsn_scraping(microbe_name: str) -> Dict[str, Any]:
     
     try:
         # LPSN 검색 URL 구성
-        search_url = f"https://lpsn.dsmz.de/search?word={quote_plus(cleaned_name)}"
+        search_url = build_lpsn_search_url(cleaned_name)
         
         # 세션 생성 (쿠키 및 헤더 관리)
         session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        session.headers.update(LPSN_HEADERS)
         
         # 검색 요청
         print(f"[Info LPSN Scraper] LPSN 검색 요청: {search_url}")
-        response = session.get(search_url, timeout=15)
+        # 서버 부하 방지 (업스트림 속도 제한 + 429/503 시 자동 감속)
+        response = throttled_request(session, "lpsn", "GET", search_url, timeout=15)
         
         if response.status_code != 200:
             print(f"[Warning LPSN Scraper] HTTP 응답 오류: {response.status_code}")
             base_result['status'] = f'LPSN 접속 오류 (HTTP {response.status_code})'
             return base_result
         
-        # HTML 파싱
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 검색 결과 확인
-        results = parse_lpsn_search_results(soup, cleaned_name)
-        
-        if results:
-            # 검증 성공
-            result_data = results[0]  # 첫 번째 결과 사용
-            
-            base_result.update({
-                'scientific_name': result_data.get('name', cleaned_name),
-                'is_verified': True,
-                'valid_name': result_data.get('name', cleaned_name),
-                'status': f"LPSN 검증됨: {result_data.get('status', 'valid')}",
-                'taxonomy': result_data.get('taxonomy', 'Domain: Bacteria'),
-                'lpsn_link': result_data.get('link', base_result['lpsn_link']),
-                'wiki_summary': f"✅ LPSN에서 검증되었습니다.\n상태: {result_data.get('status', 'valid')}"
-            })
-            
-            print(f"[Info LPSN Scraper] 검증 성공: '{result_data.get('name', cleaned_name)}'")
-            
-        else:
-            # 검색 결과 없음
-            print(f"[Info LPSN Scraper] 검색 결과 없음: '{cleaned_name}'")
-            base_result.update({
-                'status': 'LPSN 검색됨: 결과 없음',
-                'taxonomy': 'Domain: Bacteria (추정)',
-                'wiki_summary': f"LPSN에서 '{cleaned_name}'을 검색했으나 결과가 없습니다."
-            })
-        
-        # 요청 간 지연
-        time.sleep(0.5)  # 서버 부하 방지
+        # HTML 파싱 및 결과 반영
+        apply_lpsn_search_page(base_result, response.content, cleaned_name)
         
         return base_result
         
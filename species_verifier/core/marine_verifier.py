@@ -10,7 +10,7 @@ from typing import List, Dict, Tuple, Union, Optional, Any
 
 from species_verifier.config import app_config, api_config
 from species_verifier.core.wiki import get_wiki_summary
-from species_verifier.core.worms_api import verify_species_list
+from species_verifier.core.worms_api import verify_species_list, MATCH_BATCH_SIZE
 
 class MarineSpeciesVerifier:
     """해양생물 학명 검증을 위한 클래스"""
@@ -97,6 +97,7 @@ class MarineSpeciesVerifier:
         num_skipped_worms = 0
         results_list = []
         is_cancelled = False
+        prefetched_results = {}  # WoRMS 일괄 매칭 결과 (학명 -> 결과)
 
         try:
             if verify_species_list is None:
@@ -149,8 +150,22 @@ class MarineSpeciesVerifier:
                         is_cancelled = True
                         break
                         
-                    # WoRMS 검증 실행 (check_cancelled 콜백 전달)
-                    result_list = verify_species_list([scientific_name], check_cancelled=self.check_cancelled)
+                    # WoRMS 일괄 매칭: MATCH_BATCH_SIZE 단위로 한 번에 미리 조회 (학명 문자열 항목만)
+                    if i % MATCH_BATCH_SIZE == 0:
+                        chunk_names = [item for item in verification_list_input[i:i + MATCH_BATCH_SIZE]
+                                       if isinstance(item, str)]
+                        prefetched_results = {}
+                        if chunk_names:
+                            chunk_results = verify_species_list(chunk_names, check_cancelled=self.check_cancelled)
+                            prefetched_results = {
+                                item.get('input_name'): item for item in chunk_results if 'error' not in item
+                            }
+                    
+                    # WoRMS 검증 실행 (일괄 조회 결과가 없으면 개별 조회)
+                    if isinstance(scientific_name, str) and scientific_name in prefetched_results:
+                        result_list = [prefetched_results[scientific_name]]
+                    else:
+                        result_list = verify_species_list([scientific_name], check_cancelled=self.check_cancelled)
                     
                     # WoRMS 검증 후 취소 확인
                     if self.check_cancelled and self.check_cancelled():
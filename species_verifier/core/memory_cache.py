@@ -0,0 +1,231 @@
+"""
+프로세스 내 L1 메모리 캐시(LRU + TTL) 모듈
+
+SQLite/Supabase 캐시 앞단에서 같은 세션 안의 반복 조회를 메모리에서 바로 처리합니다.
+키는 (source_db, 정규화 학명)이며 source_db는 'worms', 'col', 'lpsn'을 사용합니다.
+오류/취소 결과는 저장하지 않으며, 적중/미스/제거 횟수를 집계합니다.
+찾지 못함/잘못된 입력 결과는 네거티브 캐시로 더 짧은 TTL 동안만 보관하고 따로 집계합니다.
+"""
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from species_verifier.core.single_flight import _copy_for_caller
+from species_verifier.utils.text_processor import normalize_lookup_key
+
+try:
+    from species_verifier.config import app_config
+    MEMORY_CACHE_MAX_ENTRIES = app_config.MEMORY_CACHE_MAX_ENTRIES
+    MEMORY_CACHE_TTL = app_config.MEMORY_CACHE_TTL
+    MEMORY_NEGATIVE_CACHE_TTL = app_config.MEMORY_NEGATIVE_CACHE_TTL
+except ImportError:
+    # 설정 파일이 없는 경우 기본값 사용
+    MEMORY_CACHE_MAX_ENTRIES = 5000
+    MEMORY_CACHE_TTL = 6 * 3600
+    MEMORY_NEGATIVE_CACHE_TTL = 30 * 60
+
+# 오류/일시적 실패로 판단하는 상태 값 (캐시하지 않음)
+_ERROR_STATUS_VALUES = {"cancelled", "network_error", "config_error", "network error", "configuration error"}
+_ERROR_STATUS_MARKERS = ("오류", "실패", "타임아웃", "취소", "error", "timeout")
+
+# 찾지 못함/잘못된 입력으로 판단하는 상태 값 (네거티브 캐시, 소문자 비교)
+_NEGATIVE_STATUS_VALUES = {
+    "worms 등록되지 않음",  # WoRMS: AphiaID -999 / 204 응답
+    "not found",  # COL 매칭 없음
+    "not found in lpsn",
+    "lpsn 검색됨: 결과 없음",
+    "invalid input",
+}
+
+
+def is_cacheable_result(result: Any) -> bool:
+    """
+    검증 결과를 캐시해도 되는지 확인 (오류/취소/연결 실패 결과 제외)
+    
+    API 오류를 결과에 옮길 때 'cacheable': False로 표시한 결과(예: WoRMS 청크 전체 실패)는 상태 문구와
+    관계없이 제외하고, 표시가 없는 결과는 상태 문구의 오류 표현으로 판단합니다.
+    """
+    if not isinstance(result, dict) or not result or 'error' in result or result.get('cacheable') is False:
+        return False
+    for field in ('status', 'worms_status', 'col_status', 'COL 상태', '검증'):
+        value = result.get(field)
+        if not isinstance(value, str):
+            continue
+        lowered = value.strip().lower()
+        if lowered in _ERROR_STATUS_VALUES or any(marker in lowered for marker in _ERROR_STATUS_MARKERS):
+            return False
+    return True
+
+
+def is_negative_result(result: Any) -> bool:
+    """캐시 가능한 결과 중 찾지 못함/잘못된 입력 결과인지 확인 (네거티브 캐시 대상)"""
+    if not is_cacheable_result(result) or result.get('is_verified'):
+        return False
+    for field in ('status', 'worms_status', 'col_status'):
+        value = result.get(field)
+        if isinstance(value, str) and value.strip().lower() in _NEGATIVE_STATUS_VALUES:
+            return True
+    return False
+
+
+class MemoryCache:
+    """크기 제한과 만료 시간을 가진 스레드 안전 LRU 캐시"""
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_MAX_ENTRIES, ttl_seconds: float = MEMORY_CACHE_TTL,
+                 negative_ttl_seconds: float = MEMORY_NEGATIVE_CACHE_TTL):
+        """
+        초기화 함수
+
+        Args:
+            max_entries: 최대 저장 항목 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+            ttl_seconds: 항목 유지 시간(초)
+            negative_ttl_seconds: 찾지 못함/잘못된 입력 결과 유지 시간(초)
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = float(ttl_seconds)
+        self.negative_ttl_seconds = float(negative_ttl_seconds)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(source_db: str, name: str) -> Tuple[str, str]:
+        """(source_db, 정규화 학명) 키 생성"""
+        return (source_db, normalize_lookup_key(name))
+
+    def get(self, source_db: str, name: str) -> Optional[Any]:
+        """
+        캐시된 결과의 복사본을 반환합니다 (없거나 만료되면 None).
+        결과의 'input_name'은 조회한 이름으로 바뀝니다.
+        """
+        key = self.make_key(source_db, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value, negative = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if negative:
+                self._negative_hits += 1
+        return _copy_for_caller(value, name)
+
+    def set(self, source_db: str, name: str, value: Any, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        결과를 저장합니다. 오류/취소 결과는 저장하지 않으며,
+        찾지 못함 결과는 ttl_seconds를 지정하지 않으면 네거티브 TTL을 사용합니다.
+
+        Returns:
+            저장 여부
+        """
+        if not normalize_lookup_key(name) or not is_cacheable_result(value):
+            return False
+        key = self.make_key(source_db, name)
+        negative = is_negative_result(value)
+        if ttl_seconds is not None:
+            ttl = float(ttl_seconds)
+        else:
+            ttl = self.negative_ttl_seconds if negative else self.ttl_seconds
+        stored = _copy_for_caller(value, None)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, stored, negative)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return True
+
+    def invalidate(self, source_db: Optional[str] = None, name: Optional[str] = None) -> int:
+        """
+        항목을 삭제합니다.
+
+        Args:
+            source_db: 지정 시 해당 소스 항목만 (None이면 전체)
+            name: 지정 시 해당 학명 항목만
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            if source_db is not None and name is not None:
+                return 1 if self._entries.pop(self.make_key(source_db, name), None) is not None else 0
+            if source_db is None and name is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            lookup = normalize_lookup_key(name) if name is not None else None
+            keys = [key for key in self._entries
+                    if (source_db is None or key[0] == source_db) and (lookup is None or key[1] == lookup)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self):
+        """전체 항목 및 통계 초기화"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._negative_hits = self._misses = self._evictions = self._expirations = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적중/미스/제거 통계 반환 (네거티브 캐시 적중/항목 수 별도 집계)"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "size": len(self._entries),
+                "negative_size": sum(1 for entry in self._entries.values() if entry[2]),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "negative_ttl_seconds": self.negative_ttl_seconds,
+                "hit_rate": round(self._hits / lookups * 100, 2) if lookups else 0.0,
+            }
+
+
+# 전역 L1 캐시 인스턴스
+_memory_cache = MemoryCache()
+
+def get_memory_cache() -> MemoryCache:
+    """전역 L1 메모리 캐시 인스턴스 반환"""
+    return _memory_cache
+
+
+def memory_cached(source_db: str) -> Callable:
+    """
+    첫 번째 인자가 학명인 검증 함수 앞에 L1 메모리 캐시를 두는 데코레이터
+
+    Args:
+        source_db: 캐시 소스 이름 ('worms', 'col', 'lpsn')
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(name, *args, **kwargs):
+            if not isinstance(name, str) or not normalize_lookup_key(name):
+                return func(name, *args, **kwargs)
+
+            cached = _memory_cache.get(source_db, name)
+            if cached is not None:
+                return cached
+
+            result = func(name, *args, **kwargs)
+            _memory_cache.set(source_db, name, result)
+            return result
+
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorator
@@ -0,0 +1,209 @@
+"""
+다중 소스 동시 검증 파이프라인 모듈
+
+WoRMS(해양생물), LPSN(미생물), COL은 서로 다른 호스트이며 속도 제한도 따로 적용되므로,
+소스별로 크기가 제한된 작업자 풀을 두고 동시에 처리합니다.
+GUI의 해양생물/미생물/COL 검증과 캐시 예열이 이 파이프라인을 사용하며, (소스, 항목) 형식의
+혼합 목록은 소스별로 나누어 처리합니다. 결과는 기존 result_callback(result, tab_type)
+규약대로 도착하는 즉시 전달합니다. 호스트별 호출 간격은 core.rate_limiter가 지킵니다.
+"""
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    from species_verifier.config import api_config
+    PIPELINE_WORKERS = api_config.PIPELINE_WORKERS
+    MATCH_BATCH_SIZE = api_config.WORMS_MATCH_BATCH_SIZE
+except ImportError:
+    # 설정 파일이 없는 경우 기본값 사용
+    PIPELINE_WORKERS = {"marine": 2, "microbe": 1, "col": 3}
+    MATCH_BATCH_SIZE = 50
+
+SOURCES = ("marine", "microbe", "col")  # 소스 이름 = 결과 탭 타입
+
+
+def _verify_marine_chunk(items: List[Any], emit: Callable, check_cancelled: Optional[Callable[[], bool]]) -> List[Dict[str, Any]]:
+    """해양생물 묶음 검증 (WoRMS 일괄 매칭 사용)"""
+    from species_verifier.core.marine_verifier import MarineSpeciesVerifier
+
+    verifier = MarineSpeciesVerifier(result_callback=emit, check_cancelled=check_cancelled)
+    return verifier.perform_verification(items)
+
+
+def _verify_microbe_chunk(items: List[Any], emit: Callable, check_cancelled: Optional[Callable[[], bool]]) -> List[Dict[str, Any]]:
+    """미생물 묶음 검증 (LPSN)"""
+    from species_verifier.core.verifier import verify_microbe_species
+
+    return verify_microbe_species(list(items), result_callback=emit, check_cancelled=check_cancelled)
+
+
+def _verify_col_chunk(items: List[Any], emit: Callable, check_cancelled: Optional[Callable[[], bool]]) -> List[Dict[str, Any]]:
+    """COL 묶음 검증 (항목 입력: 학명 또는 (표시 이름, 검색어) 튜플)"""
+    from species_verifier.core.col_api import verify_col_species
+
+    results = []
+    for item in items:
+        if check_cancelled and check_cancelled():
+            break
+        input_name_display = item
+        query = item
+        if isinstance(item, (tuple, list)):
+            input_name_display = item[0]
+            query = item[1] if len(item) > 1 and item[1] else item[0]
+
+        result = verify_col_species(query)
+        result['input_name'] = input_name_display
+        emit(result)
+        results.append(result)
+    return results
+
+
+# 소스별 처리 함수와 한 작업 단위 크기
+DEFAULT_HANDLERS = {
+    "marine": {"handler": _verify_marine_chunk, "chunk_size": MATCH_BATCH_SIZE},
+    "microbe": {"handler": _verify_microbe_chunk, "chunk_size": 1},
+    "col": {"handler": _verify_col_chunk, "chunk_size": 1},
+}
+
+
+class VerificationPipeline:
+    """소스별 작업자 풀로 혼합 목록을 동시에 검증하는 파이프라인"""
+
+    def __init__(self, result_callback: Optional[Callable[[Dict[str, Any], str], None]] = None,
+                 progress_callback: Optional[Callable] = None,
+                 status_callback: Optional[Callable[[str], None]] = None,
+                 check_cancelled: Optional[Callable[[], bool]] = None,
+                 workers: Optional[Dict[str, int]] = None,
+                 handlers: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        초기화 함수
+
+        Args:
+            result_callback: 개별 결과 콜백 (결과 딕셔너리, 탭 타입)
+            progress_callback: 진행률 콜백 (진행률, 현재 항목 수, 전체 항목 수)
+            status_callback: 상태 메시지 콜백
+            check_cancelled: 취소 여부 확인 함수
+            workers: 소스별 최대 동시 작업자 수 (기본값: APIConfig.PIPELINE_WORKERS)
+            handlers: 소스별 {'handler': 처리 함수, 'chunk_size': 작업 단위 크기}
+        """
+        self.result_callback = result_callback
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback
+        self.check_cancelled = check_cancelled
+        self.workers = dict(PIPELINE_WORKERS)
+        if workers:
+            self.workers.update(workers)
+        self.handlers = dict(DEFAULT_HANDLERS)
+        if handlers:
+            self.handlers.update(handlers)
+
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._total = 0
+
+    def route(self, items: List[Any], default_source: Optional[str] = None) -> Dict[str, List[Any]]:
+        """
+        혼합 목록을 소스별 목록으로 나눕니다.
+
+        지원 형식:
+            - (소스, 항목) 튜플: ('col', 'Homo sapiens')
+            - {'source': 소스, 'name': 항목} 딕셔너리
+            - 그 외 항목은 default_source로 분류
+        """
+        routed: Dict[str, List[Any]] = {}
+        for item in items:
+            source = None
+            value = item
+            if isinstance(item, tuple) and len(item) == 2 and item[0] in self.handlers:
+                source, value = item
+            elif isinstance(item, dict) and item.get("source") in self.handlers:
+                source = item["source"]
+                value = item.get("name", item.get("input_name"))
+            elif default_source in self.handlers:
+                source = default_source
+
+            if source is None:
+                print(f"[Warning Pipeline] 소스를 알 수 없는 항목 건너뜀: {item}")
+                continue
+            routed.setdefault(source, []).append(value)
+        return routed
+
+    def _is_cancelled(self) -> bool:
+        return bool(self.check_cancelled and self.check_cancelled())
+
+    def _emit(self, source: str, result: Dict[str, Any], collected: List[Dict[str, Any]]):
+        """결과를 모으고 콜백/진행률을 전달합니다 (스레드 안전)."""
+        with self._lock:
+            collected.append(result)
+            self._completed += 1
+            completed, total = self._completed, self._total
+
+        if self.result_callback and not self._is_cancelled():
+            self.result_callback(result, source)
+        if self.progress_callback and total:
+            self.progress_callback(min(completed / total, 1.0), completed, total)
+
+    def _run_chunk(self, source: str, chunk: List[Any], collected: List[Dict[str, Any]]):
+        """작업자 스레드에서 한 작업 단위를 처리합니다."""
+        if self._is_cancelled():
+            return
+        handler = self.handlers[source]["handler"]
+        emit = lambda result, *args: self._emit(source, result, collected)
+        try:
+            handler(chunk, emit, self.check_cancelled)
+        except Exception as e:
+            print(f"[Error Pipeline] {source} 처리 중 오류: {e}")
+            traceback.print_exc()
+
+    def run(self, items: List[Any], default_source: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        혼합 목록을 소스별로 동시에 검증합니다.
+
+        Args:
+            items: 검증할 항목 목록 (route() 형식 참고)
+            default_source: 소스 표시가 없는 항목의 소스
+
+        Returns:
+            소스별 결과 목록 딕셔너리 (결과는 도착 순서)
+        """
+        routed = self.route(items, default_source)
+        self._completed = 0
+        self._total = sum(len(source_items) for source_items in routed.values())
+        results: Dict[str, List[Dict[str, Any]]] = {source: [] for source in routed}
+        if not self._total:
+            return results
+
+        summary = ", ".join(f"{source} {len(source_items)}개" for source, source_items in routed.items())
+        print(f"[Info Pipeline] 동시 검증 시작: {summary}")
+        if self.status_callback:
+            self.status_callback(f"동시 검증 중: {summary}")
+
+        executors = []
+        futures = []
+        try:
+            for source, source_items in routed.items():
+                max_workers = max(1, int(self.workers.get(source, 1)))
+                chunk_size = max(1, int(self.handlers[source].get("chunk_size", 1)))
+                executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"pipeline-{source}")
+                executors.append(executor)
+                for start in range(0, len(source_items), chunk_size):
+                    chunk = source_items[start:start + chunk_size]
+                    futures.append(executor.submit(self._run_chunk, source, chunk, results[source]))
+
+            # 취소 요청을 확인하면서 모든 작업 완료 대기
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=0.5)
+                if pending and self._is_cancelled():
+                    print("[Info Pipeline] 취소 요청 감지 - 대기 중인 작업 취소")
+                    for future in pending:
+                        future.cancel()
+                    break
+        finally:
+            for executor in executors:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        print(f"[Info Pipeline] 동시 검증 종료: {self._completed}/{self._total}개 결과")
+        return results
@@ -0,0 +1,271 @@
+"""
+외부 API 호출 속도 제한(토큰 버킷) 모듈
+
+곳곳에 흩어진 고정 time.sleep 지연 대신, 업스트림(source)별 토큰 버킷에서
+호출 권한을 받아 허용된 속도로만 요청합니다. 캐시 적중이나 실패한 요청처럼
+실제 호출이 없는 경우에는 대기하지 않습니다.
+
+응답 상태를 record_response()로 알려주면 정상 응답에서는 속도를 조금씩 올리고
+429/503에서는 배수로 낮추며 Retry-After를 지킵니다 (AIMD 방식).
+"""
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+try:
+    from species_verifier.config import api_config
+    RATE_LIMITS = api_config.RATE_LIMITS
+    RATE_LIMIT_HOSTS = api_config.RATE_LIMIT_HOSTS
+    ADAPTIVE_RATE_CONFIG = api_config.ADAPTIVE_RATE_CONFIG
+except ImportError:
+    # 설정 파일이 없는 경우 기본값 사용 (초당 요청 수 / 순간 허용 요청 수 / 적응형 조절 범위)
+    RATE_LIMITS = {
+        "worms": {"rate": 1.0, "burst": 3, "min_rate": 0.1, "max_rate": 5.0},
+        "col": {"rate": 1.0, "burst": 3, "min_rate": 0.1, "max_rate": 5.0},
+        "lpsn": {"rate": 0.33, "burst": 1, "min_rate": 0.05, "max_rate": 1.0},
+        "wikipedia": {"rate": 1.0, "burst": 2, "min_rate": 0.1, "max_rate": 3.0},
+    }
+    ADAPTIVE_RATE_CONFIG = {
+        "enabled": True,
+        "increase_step": 0.05,    # 정상 응답마다 늘릴 초당 요청 수
+        "decrease_factor": 0.5,   # 429/503 응답 시 곱할 비율
+        "max_retry_after": 120,   # Retry-After 최대 대기(초)
+    }
+    RATE_LIMIT_HOSTS = {
+        "www.marinespecies.org": "worms",
+        "api.catalogueoflife.org": "col",
+        "lpsn.dsmz.de": "lpsn",
+        "api.lpsn.dsmz.de": "lpsn",
+    }
+
+DEFAULT_RATE_LIMIT = {"rate": 1.0, "burst": 1}
+THROTTLE_STATUS_CODES = (429, 503)  # 서버가 속도 조절을 요청하는 상태 코드
+_WAIT_SLICE = 0.2  # 대기 중 취소 확인 간격(초)
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 초로 변환합니다."""
+    if value is None or value == "":
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        retry_at = parsedate_to_datetime(str(value))
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷
+
+    reserve()는 토큰을 미리 예약하고 기다려야 할 시간을 돌려주므로
+    동기 코드(acquire)와 비동기 코드(asyncio.sleep) 모두에서 사용할 수 있습니다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        초기화 함수
+
+        Args:
+            rate: 초당 허용 요청 수
+            burst: 한 번에 연속으로 허용할 최대 요청 수
+        """
+        self.rate = max(float(rate), 0.001)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 보충 (호출 전 잠금 필요)"""
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        토큰을 예약하고 기다려야 하는 시간(초)을 반환합니다.
+        토큰이 부족하면 잔량이 음수가 되어 다음 호출자는 그만큼 더 기다립니다.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0, check_cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """
+        토큰을 얻을 때까지 대기합니다.
+
+        Returns:
+            True(획득), False(대기 중 취소됨)
+        """
+        deadline = time.monotonic() + self.reserve(tokens)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            if check_cancelled and check_cancelled():
+                # 사용하지 않은 토큰 반환
+                with self._lock:
+                    self._tokens = min(float(self.burst), self._tokens + tokens)
+                return False
+            time.sleep(min(remaining, _WAIT_SLICE))
+
+    def set_rate(self, rate: float, burst: Optional[int] = None):
+        """속도와 순간 허용량을 변경합니다."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(float(rate), 0.001)
+            if burst is not None:
+                self.burst = max(int(burst), 1)
+                self._tokens = min(self._tokens, float(self.burst))
+
+    def pause(self, seconds: float):
+        """지정한 시간 동안 새 토큰을 내주지 않습니다 (Retry-After 대응)."""
+        if seconds <= 0:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+class RateLimiterRegistry:
+    """업스트림(source)별 토큰 버킷을 관리하는 레지스트리"""
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, float]]] = None,
+                 hosts: Optional[Dict[str, str]] = None):
+        """
+        초기화 함수
+
+        Args:
+            limits: source별 {'rate': 초당 요청 수, 'burst': 순간 허용 요청 수}
+            hosts: 호스트명 → source 매핑
+        """
+        self.limits = dict(limits if limits is not None else RATE_LIMITS)
+        self.hosts = dict(hosts if hosts is not None else RATE_LIMIT_HOSTS)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get(self, source: str) -> TokenBucket:
+        """source에 해당하는 토큰 버킷을 반환합니다 (없으면 생성)."""
+        bucket = self._buckets.get(source)
+        if bucket is not None:
+            return bucket
+
+        with self._lock:
+            bucket = self._buckets.get(source)
+            if bucket is None:
+                limit = self.limits.get(source, DEFAULT_RATE_LIMIT)
+                bucket = TokenBucket(limit.get("rate", 1.0), limit.get("burst", 1))
+                self._buckets[source] = bucket
+            return bucket
+
+    def source_for_url(self, url: str) -> str:
+        """URL의 호스트로 source 이름을 찾습니다 (매핑이 없으면 호스트명)."""
+        host = urlparse(url).hostname or ""
+        if host in self.hosts:
+            return self.hosts[host]
+        if host.endswith("wikipedia.org"):
+            return "wikipedia"
+        return host
+
+    def acquire(self, source: str, check_cancelled: Optional[Callable[[], bool]] = None) -> bool:
+        """source의 호출 권한을 얻을 때까지 대기합니다."""
+        return self.get(source).acquire(check_cancelled=check_cancelled)
+
+    def record_response(self, source: str, status_code: int, retry_after: Any = None) -> float:
+        """
+        응답 상태를 반영해 source의 속도를 조절합니다 (AIMD).
+
+        Args:
+            source: 업스트림 이름
+            status_code: HTTP 상태 코드
+            retry_after: Retry-After 헤더 값 (있는 경우)
+
+        Returns:
+            조절 후 초당 요청 수
+        """
+        bucket = self.get(source)
+        if not ADAPTIVE_RATE_CONFIG.get("enabled", True):
+            return bucket.rate
+
+        limit = self.limits.get(source, DEFAULT_RATE_LIMIT)
+        min_rate = limit.get("min_rate", limit.get("rate", 1.0) / 10)
+        max_rate = limit.get("max_rate", limit.get("rate", 1.0))
+
+        if status_code in THROTTLE_STATUS_CODES:
+            new_rate = max(min_rate, bucket.rate * ADAPTIVE_RATE_CONFIG.get("decrease_factor", 0.5))
+            bucket.set_rate(new_rate)
+            wait = parse_retry_after(retry_after)
+            if wait:
+                wait = min(wait, ADAPTIVE_RATE_CONFIG.get("max_retry_after", 120))
+                bucket.pause(wait)
+            print(f"[Warning] {source} 요청 제한 응답({status_code}) - 속도 {new_rate:.2f}회/초로 감소"
+                  + (f", {wait:.1f}초 대기" if wait else ""))
+            return new_rate
+
+        if status_code < 500 and bucket.rate < max_rate:
+            new_rate = min(max_rate, bucket.rate + ADAPTIVE_RATE_CONFIG.get("increase_step", 0.05))
+            bucket.set_rate(new_rate)
+            return new_rate
+        return bucket.rate
+
+    def get_current_rates(self) -> Dict[str, float]:
+        """source와 호스트별 현재 초당 요청 수 반환"""
+        rates = {source: info["rate"] for source, info in self.get_rates().items()}
+        for host, source in self.hosts.items():
+            if source in rates:
+                rates[host] = rates[source]
+        return rates
+
+    def set_rate(self, source: str, rate: float, burst: Optional[int] = None):
+        """source의 기본 속도 제한을 변경합니다."""
+        self.get(source).set_rate(rate, burst)
+        with self._lock:
+            limit = dict(self.limits.get(source, DEFAULT_RATE_LIMIT))
+            limit["rate"] = rate
+            if burst is not None:
+                limit["burst"] = burst
+            self.limits[source] = limit
+
+    def get_rates(self) -> Dict[str, Dict[str, float]]:
+        """source별 현재 속도 설정 반환"""
+        with self._lock:
+            sources = set(self.limits) | set(self._buckets)
+        rates = {}
+        for source in sources:
+            bucket = self.get(source)
+            rates[source] = {"rate": bucket.rate, "burst": bucket.burst}
+        return rates
+
+
+# 전역 속도 제한 레지스트리 인스턴스
+_rate_limiter = RateLimiterRegistry()
+
+def get_rate_limiter() -> RateLimiterRegistry:
+    """전역 속도 제한 레지스트리 인스턴스 반환"""
+    return _rate_limiter
+
+def acquire(source: str, check_cancelled: Optional[Callable[[], bool]] = None) -> bool:
+    """source(예: 'worms', 'col', 'lpsn', 'wikipedia')의 호출 권한을 얻을 때까지 대기"""
+    return _rate_limiter.acquire(source, check_cancelled)
+
+def record_response(source: str, status_code: int, retry_after: Any = None) -> float:
+    """응답 상태를 반영해 source의 속도를 조절하고 조절 후 속도를 반환"""
+    return _rate_limiter.record_response(source, status_code, retry_after)
+
+def get_current_rates() -> Dict[str, float]:
+    """source와 호스트별 현재 초당 요청 수 반환"""
+    return _rate_limiter.get_current_rates()
@@ -0,0 +1,256 @@
+"""
+중복 요청 병합(single-flight) 모듈
+
+같은 학명(정규화 키 기준)에 대한 검증이 동시에 여러 번 요청되면
+첫 요청만 업스트림(WoRMS/COL/LPSN)을 호출하고, 나머지는 그 결과를 함께 받습니다.
+진행 중인 요청만 병합하며 결과를 보관하지는 않습니다 (캐시와 별개).
+
+각 호출자는 결과의 복사본을 받고, 'input_name'은 호출자가 넘긴 이름으로 바뀝니다.
+먼저 시작한 호출이 취소/연결 실패로 끝나면 기다리던 호출자는 그 결과를 받지 않고 직접 다시 요청합니다.
+"""
+import asyncio
+import copy
+import functools
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+from species_verifier.utils.text_processor import normalize_lookup_key
+
+
+class _Call:
+    """진행 중인 호출 하나의 상태"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+def _copy_for_caller(result: Any, input_name: Any) -> Any:
+    """호출자별 결과 복사본 생성 (input_name을 호출자 입력으로 교체)"""
+    result = copy.deepcopy(result)
+    if isinstance(result, dict) and 'input_name' in result and input_name is not None:
+        result['input_name'] = input_name
+    return result
+
+
+def _is_shareable_result(result: Any) -> bool:
+    """다른 호출자에게 넘겨도 되는 결과인지 확인 (오류/취소/연결 실패 결과 제외)"""
+    if not isinstance(result, dict):
+        return result is not None
+    from species_verifier.core.memory_cache import is_cacheable_result  # 순환 임포트 방지
+    return is_cacheable_result(result)
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """기다리던 호출자가 직접 다시 시도할 일시적 오류인지 확인 (연결/타임아웃 오류)"""
+    return isinstance(error, (OSError, ConnectionError, TimeoutError))
+
+
+class SingleFlight:
+    """키별로 진행 중인 호출을 하나로 병합하는 스레드 안전 그룹"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.stats = {"calls": 0, "shared": 0, "retried": 0}
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        키에 대한 호출을 실행하거나 진행 중인 호출의 결과를 기다립니다.
+
+        진행 중인 호출이 오류/취소 결과나 연결 오류로 끝나면 공유하지 않고 직접 다시 호출합니다.
+
+        Returns:
+            (결과, 공유 여부) - 공유 여부가 True이면 다른 호출의 결과를 받은 것
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                self.stats["shared"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self.stats["calls"] += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None and not _is_transient_error(call.error):
+                raise call.error
+            if call.error is None and _is_shareable_result(call.result):
+                return call.result, True
+            with self._lock:
+                self.stats["retried"] += 1
+            return func(*args, **kwargs), False
+
+        try:
+            call.result = func(*args, **kwargs)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """현재 진행 중인 키 개수"""
+        with self._lock:
+            return len(self._calls)
+
+
+class AsyncSingleFlight:
+    """asyncio용 중복 요청 병합 그룹 (하나의 이벤트 루프 안에서 사용)"""
+
+    def __init__(self):
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self.stats = {"calls": 0, "shared": 0, "retried": 0}
+
+    async def do(self, key: Hashable, coro_factory: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        키에 대한 코루틴을 실행하거나 진행 중인 실행의 결과를 기다립니다.
+
+        진행 중인 실행이 취소되거나 오류 결과로 끝나면 공유하지 않고 직접 다시 실행합니다.
+
+        Returns:
+            (결과, 공유 여부)
+        """
+        future = self._futures.get(key)
+        if future is not None:
+            self.stats["shared"] += 1
+            shareable, result = await self._wait_shared(future)
+            if shareable:
+                return result, True
+            self.stats["retried"] += 1
+            return await coro_factory(), False
+
+        self.stats["calls"] += 1
+        future = asyncio.ensure_future(coro_factory())
+        self._futures[key] = future
+        try:
+            return await future, False
+        finally:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+
+    @staticmethod
+    async def _wait_shared(future: asyncio.Future) -> Tuple[bool, Any]:
+        """다른 실행의 결과를 기다려 (공유 가능 여부, 결과)를 반환합니다."""
+        try:
+            # 기다리는 쪽이 취소되어도 공유 작업은 계속 진행
+            result = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise  # 기다리던 쪽이 취소됨
+            return False, None  # 앞선 실행이 취소됨
+        except Exception as e:
+            if not _is_transient_error(e):
+                raise
+            return False, None
+        return _is_shareable_result(result), result
+
+    async def do_many(self, keys: List[Hashable],
+                      coro_factory: Callable[[List[int]], Awaitable[List[Any]]]) -> List[Tuple[Any, bool]]:
+        """
+        여러 키를 한 번의 실행으로 처리합니다 (일괄 요청용).
+        진행 중인 키는 그 결과를 기다리고, 나머지 키의 위치 목록만 coro_factory에 넘깁니다.
+        coro_factory는 넘겨받은 위치 순서대로 결과 목록을 반환해야 합니다.
+
+        기다린 키의 결과가 취소/오류 결과이면 그 키들만 모아 coro_factory로 다시 실행합니다.
+
+        Returns:
+            키 순서의 (결과, 공유 여부) 목록
+        """
+        loop = asyncio.get_running_loop()
+        futures: List[asyncio.Future] = []
+        owned: Dict[Hashable, asyncio.Future] = {}
+        lead_positions: List[int] = []
+        for position, key in enumerate(keys):
+            future = self._futures.get(key)
+            if future is None:
+                future = loop.create_future()
+                self._futures[key] = future
+                owned[key] = future
+                lead_positions.append(position)
+            else:
+                self.stats["shared"] += 1
+            futures.append(future)
+        self.stats["calls"] += len(lead_positions)
+
+        lead_results: Dict[int, Any] = {}
+        try:
+            if lead_positions:
+                lead_results = dict(zip(lead_positions, await coro_factory(lead_positions)))
+                for position in lead_positions:
+                    futures[position].set_result(lead_results.get(position))
+        except BaseException as e:
+            for future in owned.values():
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+                    future.exception()  # 기다리는 쪽이 없어도 경고가 나지 않도록 확인 처리
+            raise
+        finally:
+            for key, future in owned.items():
+                if self._futures.get(key) is future:
+                    del self._futures[key]
+
+        results: List[Tuple[Any, bool]] = [(None, False)] * len(keys)
+        retry_positions: List[int] = []
+        for position, future in enumerate(futures):
+            if position in lead_results:
+                results[position] = (lead_results[position], False)
+                continue
+            shareable, result = await self._wait_shared(future)
+            if shareable:
+                results[position] = (result, True)
+            else:
+                retry_positions.append(position)
+
+        if retry_positions:
+            self.stats["retried"] += len(retry_positions)
+            for position, result in zip(retry_positions, await coro_factory(retry_positions)):
+                results[position] = (result, False)
+        return results
+
+
+# 전역 병합 그룹 인스턴스
+_single_flight = SingleFlight()
+
+def get_single_flight() -> SingleFlight:
+    """전역 중복 요청 병합 그룹 반환"""
+    return _single_flight
+
+
+def single_flight(source: str) -> Callable:
+    """
+    첫 번째 인자가 학명인 검증 함수에 중복 요청 병합을 적용하는 데코레이터
+
+    키는 (source, 정규화 학명)입니다. 중첩 호출되는 함수끼리는 source를 다르게 지정해야 합니다.
+
+    Args:
+        source: 업스트림/함수 구분 이름 (예: 'worms', 'col', 'lpsn')
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(name, *args, **kwargs):
+            key = normalize_lookup_key(name) if isinstance(name, str) else None
+            if not key:
+                return func(name, *args, **kwargs)
+
+            result, shared = _single_flight.do((source, key), func, name, *args, **kwargs)
+            if shared:
+                print(f"[Debug SingleFlight] {source} 진행 중인 요청 결과 공유: '{name}'")
+            return _copy_for_caller(result, name)
+
+        wrapper.__wrapped__ = func
+        return wrapper
+    return decorator
@@ -0,0 +1,169 @@
+"""
+호스트별 TLS(SSL 검증) 정책 캐시 모듈
+
+기관망(TLS 가로채기 프록시) 환경에서는 SSL 검증이 항상 실패하므로,
+요청마다 verify=True를 먼저 시도하면 모든 호출이 두 번씩 나가게 됩니다.
+이 모듈은 호스트별로 SSL 검증 가능 여부를 한 번만 확인해 기억하고,
+TTL이 지나면 다시 확인합니다. SSL 오류가 아닌 실패(404, 타임아웃 등)는
+SSL 우회로 재시도하지 않습니다.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+try:
+    from species_verifier.config import SSL_CONFIG
+except ImportError:
+    # 설정 파일이 없는 경우 기본값 사용 (보안 우선)
+    SSL_CONFIG = {"allow_insecure_fallback": False, "log_ssl_bypass": True}
+
+DEFAULT_POLICY_TTL = 3600  # 정책 유지 시간(초)
+
+
+class TLSPolicyCache:
+    """호스트별 SSL 검증 가능 여부를 TTL과 함께 기억하는 스레드 안전 캐시"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, allow_insecure_fallback: Optional[bool] = None):
+        """
+        초기화 함수
+
+        Args:
+            ttl_seconds: 결정을 유지할 시간(초) (기본값: SSL_CONFIG['policy_ttl_seconds'])
+            allow_insecure_fallback: SSL 우회 허용 여부 (기본값: SSL_CONFIG 설정)
+        """
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else SSL_CONFIG.get("policy_ttl_seconds", DEFAULT_POLICY_TTL)
+        self._allow_insecure_fallback = allow_insecure_fallback
+        self._policies: Dict[str, Tuple[bool, float]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def allow_insecure_fallback(self) -> bool:
+        """SSL 우회 허용 여부 (지정하지 않았으면 현재 SSL_CONFIG를 따름)"""
+        if self._allow_insecure_fallback is not None:
+            return self._allow_insecure_fallback
+        return bool(SSL_CONFIG.get("allow_insecure_fallback", False))
+
+    def get_verify(self, host: str) -> Optional[bool]:
+        """
+        호스트의 SSL 검증 정책을 반환합니다.
+
+        Returns:
+            True(검증 사용), False(검증 우회), None(미확인 또는 만료)
+        """
+        if not host:
+            return None
+        with self._lock:
+            entry = self._policies.get(host)
+            if entry is None:
+                return None
+            verify, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._policies[host]
+                return None
+            return verify
+
+    def record(self, host: str, verify: bool):
+        """호스트의 SSL 검증 결과를 기록합니다."""
+        if not host:
+            return
+        with self._lock:
+            previous = self._policies.get(host)
+            self._policies[host] = (verify, time.monotonic() + self.ttl_seconds)
+
+        # 우회로 전환되는 시점에만 한 번 알림
+        if not verify and (previous is None or previous[0]) and SSL_CONFIG.get("log_ssl_bypass", True):
+            print(f"[Warning] ⚠️ {host} - SSL 검증 실패, {int(self.ttl_seconds)}초 동안 SSL 검증 우회 사용")
+
+    def invalidate(self, host: Optional[str] = None):
+        """정책을 삭제합니다 (host가 없으면 전체)."""
+        with self._lock:
+            if host:
+                self._policies.pop(host, None)
+            else:
+                self._policies.clear()
+
+    def call(self, host: str, func: Callable[[bool], Any]) -> Any:
+        """
+        verify 값을 인자로 받는 함수를 호스트 정책에 따라 호출합니다.
+        (requests 세션을 직접 다루지 않는 라이브러리용)
+
+        Args:
+            host: 대상 호스트
+            func: verify(bool)를 받아 요청을 수행하는 함수
+
+        Returns:
+            func의 반환값
+        """
+        if self.get_verify(host) is False:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return func(False)
+
+        try:
+            result = func(True)
+        except requests.exceptions.SSLError:
+            if not self.allow_insecure_fallback:
+                raise
+            self.record(host, False)
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return func(False)
+
+        self.record(host, True)
+        return result
+
+
+class TLSPolicyAdapter(HTTPAdapter):
+    """
+    호스트별 TLS 정책 캐시를 적용하는 HTTPAdapter
+
+    검증 우회가 기록된 호스트는 바로 verify=False로 보내고,
+    그 외에는 세션 설정대로 보낸 뒤 SSL 오류일 때만 한 번 우회합니다.
+    """
+
+    def __init__(self, *args, policy_cache: Optional[TLSPolicyCache] = None, **kwargs):
+        self.policy_cache = policy_cache
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        policy = getattr(self, "policy_cache", None) or get_tls_policy_cache()
+        host = urlparse(request.url).hostname or ""
+
+        # 호출자가 명시적으로 검증을 끈 경우는 그대로 전송
+        if verify is False:
+            return super().send(request, stream=stream, timeout=timeout, verify=False, cert=cert, proxies=proxies)
+
+        if policy.get_verify(host) is False:
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return super().send(request, stream=stream, timeout=timeout, verify=False, cert=cert, proxies=proxies)
+
+        try:
+            response = super().send(request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        except requests.exceptions.SSLError:
+            if not policy.allow_insecure_fallback:
+                raise
+            policy.record(host, False)
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            return super().send(request, stream=stream, timeout=timeout, verify=False, cert=cert, proxies=proxies)
+
+        policy.record(host, True)
+        return response
+
+
+def mount_tls_policy(session: requests.Session, **adapter_kwargs) -> requests.Session:
+    """세션의 http/https 어댑터를 TLS 정책 어댑터로 교체합니다."""
+    adapter = TLSPolicyAdapter(**adapter_kwargs)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# 전역 TLS 정책 캐시 인스턴스
+_tls_policy_cache = TLSPolicyCache()
+
+def get_tls_policy_cache() -> TLSPolicyCache:
+    """전역 TLS 정책 캐시 인스턴스 반환"""
+    return _tls_policy_cache
@@ -9,6 +9,10 @@ from bs4 import BeautifulSoup # LPSN 스크래핑에 필요
 import traceback
 from typing import Dict, Any, List, Callable, Optional
 from species_verifier.config import api_config # api_config 임포트 추가
+from species_verifier.core.rate_limiter import acquire as acquire_rate_limit
+from species_verifier.core.rate_limiter import record_response as record_rate_limit_response
+from species_verifier.core.memory_cache import memory_cached
+from species_verifier.core.single_flight import single_flight
 
 # 설정 및 다른 모듈 임포트
 try:
@@ -46,6 +50,24 @@ except ImportError:
 
 # 사용되지 않는 함수 제거됨
 
+def _throttle_lpsn_client(client):
+    """
+    LPSN 클라이언트의 모든 HTTP 요청(search, retrieve의 각 페이지)에 속도 제한 적용
+    
+    요청 전 토큰을 얻고, 응답 상태와 Retry-After로 'lpsn' 속도를 조절합니다 (throttled_request와 같은 방식).
+    """
+    do_request = client.do_request
+
+    def throttled_do_request(url):
+        acquire_rate_limit("lpsn")
+        resp = do_request(url)
+        if resp is not None:
+            record_rate_limit_response("lpsn", resp.status_code, resp.headers.get("Retry-After"))
+        return resp
+
+    client.do_request = throttled_do_request
+    return client
+
 # clean_scientific_name 함수에 check_scientific_name 별칭 추가
 check_scientific_name = clean_scientific_name
 
@@ -77,7 +99,7 @@ def check_worms_record(scientific_name):
         return {'error': result['error']}
     
     # 기존 check_worms_record 형식으로 변환
-        return {
+    return {
         'worms_id': result.get('worms_id', '-'),
         'scientific_name': result.get('scientific_name', scientific_name),
         'status': 'valid' if result.get('is_verified', False) else 'not_found',
@@ -176,6 +198,8 @@ def verify_marine_species(verification_list_input):
                 result_entry['worms_url'] = worms_record.get('worms_link', '-')
                 worms_status = worms_record.get('worms_status', '-')
                 result_entry['worms_status'] = worms_status
+                if worms_record.get('cacheable') is False:
+                    result_entry['cacheable'] = False  # API 오류 결과는 캐시하지 않음
                 
                 # worms_api.py는 is_verified로 검증 상태를 제공
                 if worms_record.get('is_verified', False):
@@ -229,6 +253,8 @@ def verify_marine_species(verification_list_input):
     print(f"[Info Verifier Core] 해양생물 검증 완료: {len(results)}개 결과 생성")
     return results
 
+@memory_cached("lpsn")
+@single_flight("lpsn")
 def verify_single_microbe_lpsn(microbe_name):
     """
     LPSN API를 사용한 미생물 학명 검증 (fallback으로 웹 스크래핑 사용)
@@ -264,6 +290,7 @@ def verify_single_microbe_lpsn(microbe_name):
             print(f"[Info LPSN] API 인증으로 검증 시도: '{cleaned_name}'")
             
             client = lpsn.LpsnClient(lpsn_email, lpsn_password)
+            _throttle_lpsn_client(client)
             count = client.search(taxon_name=cleaned_name, correct_name='yes')
             
             if count > 0:
@@ -8,6 +8,8 @@ import re
 import traceback
 import time
 
+from species_verifier.core.rate_limiter import acquire as acquire_rate_limit
+
 def get_wiki_summary(search_term, check_cancelled=None):
     """주어진 검색어로 위키백과 페이지의 내용을 가져옵니다.
 
@@ -43,6 +45,7 @@ def get_wiki_summary(search_term, check_cancelled=None):
                 print(f"[Debug Wiki] '{search_term}' 한국어 위키백과 검색 전 취소 요청됨")
                 return "작업 취소됨"
                 
+            acquire_rate_limit("wikipedia", check_cancelled)
             page = wikipedia.page(search_term, auto_suggest=False)
             print(f"[Info Wiki Core] '{search_term}' 한국어 페이지 찾음")
         except wikipedia.exceptions.PageError:
@@ -55,6 +58,7 @@ def get_wiki_summary(search_term, check_cancelled=None):
                 return "작업 취소됨"
                 
             try:
+                acquire_rate_limit("wikipedia", check_cancelled)
                 page = wikipedia.page(search_term, auto_suggest=False) # 영어로 재시도
                 print(f"[Info Wiki Core] '{search_term}' 영어 페이지 찾음")
                 is_english_page = True
@@ -187,6 +191,7 @@ def extract_scientific_name_from_wiki(korean_name):
         page = None
 
         try:
+            acquire_rate_limit("wikipedia")
             search_results = wikipedia.search(korean_name, results=3)
             if not search_results:
                 print(f"[Info Wiki Core] '{korean_name}' 위키 검색 결과 없음 (학명 추출 실패)")
@@ -196,6 +201,7 @@ def extract_scientific_name_from_wiki(korean_name):
             print(f"[Info Wiki Core] '{korean_name}' 첫 검색 결과 사용: {page_title}")
 
             try:
+                acquire_rate_limit("wikipedia")
                 page = wikipedia.page(page_title, auto_suggest=False)
             except wikipedia.exceptions.DisambiguationError as e:
                 if e.options:
@@ -203,6 +209,7 @@ def extract_scientific_name_from_wiki(korean_name):
                     print(f"[Info Wiki Core] 다의어 처리, 첫 옵션 사용: {page_title}")
                     # 다의어 페이지를 다시 로드 시도
                     try:
+                        acquire_rate_limit("wikipedia")
                         page = wikipedia.page(page_title, auto_suggest=False)
                     except wikipedia.exceptions.PageError:
                          print(f"[Warning Wiki Core] 다의어 옵션 '{page_title}' 페이지 로드 실패")
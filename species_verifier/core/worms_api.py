@@ -6,6 +6,9 @@ import os
 from dotenv import load_dotenv
 from typing import List, Dict, Any, Union, Tuple, Optional, Callable
 import urllib3
+from species_verifier.core.http_session import get_pooled_session, throttled_request
+from species_verifier.core.memory_cache import get_memory_cache, memory_cached
+from species_verifier.core.single_flight import single_flight
 
 # 설정 로드 (core 모듈 내에서도 필요할 수 있음)
 # load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), '..', '..', '.env')) # 프로젝트 루트의 .env 로드
@@ -14,70 +17,55 @@ try:
     from species_verifier.config import api_config, SSL_CONFIG
     WORMS_BASE_URL = api_config.WORMS_API_URL
     REQUEST_TIMEOUT = api_config.REQUEST_TIMEOUT
-    API_DELAY = api_config.REQUEST_DELAY  # 설정파일의 지연시간 사용 (서버 과부하 방지)
     DEFAULT_HEADERS = api_config.DEFAULT_HEADERS
+    MATCH_BATCH_SIZE = api_config.WORMS_MATCH_BATCH_SIZE
 except ImportError:
     # 설정 파일이 없는 경우 기본값 사용
     WORMS_BASE_URL = os.getenv("WORMS_BASE_URL", "https://www.marinespecies.org/rest")
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", 30))  # 원래 타임아웃 유지
-    API_DELAY = float(os.getenv("API_DELAY", 2.0))  # 서버 과부하 방지를 위한 적절한 지연
     DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
+    MATCH_BATCH_SIZE = int(os.getenv("WORMS_MATCH_BATCH_SIZE", 50))  # WoRMS 일괄 매칭 최대 50개
+
+def get_worms_session() -> requests.Session:
+    """WoRMS 클라이언트 공용 keep-alive 세션 반환 (스레드 안전, 연결 풀 공유)"""
+    return get_pooled_session("worms", DEFAULT_HEADERS)
+
+def _worms_get(url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None,
+               check_cancelled: Optional[Callable[[], bool]] = None) -> Optional[requests.Response]:
+    """
+    공용 세션으로 WoRMS GET 요청을 보냅니다.
+    호출 속도는 업스트림 속도 제한(429/503 시 자동 감속, Retry-After 준수)이,
+    SSL 검증/우회 여부는 호스트별 TLS 정책 캐시가 결정합니다.
+
+    Returns:
+        응답 객체 (속도 제한 대기 중 취소된 경우 None)
+    """
+    response = throttled_request(
+        get_worms_session(), "worms", "GET", url,
+        check_cancelled=check_cancelled,
+        params=params,
+        timeout=timeout or REQUEST_TIMEOUT
+    )
+    if response is not None:
+        response.raise_for_status()
+    return response
 
 def get_aphia_id(scientific_name: str, check_cancelled: Optional[Callable[[], bool]] = None) -> Union[int, Dict[str, str]]:
-    """주어진 학명으로 WoRMS에서 AphiaID를 조회합니다."""
+    """주어진 학명으로 WoRMS에서 AphiaID를 조회합니다 (일치하는 학명이 없으면 -999, 오류 시 {'error': ...})."""
     aphia_id = None # 변수 초기화
     try:
         if check_cancelled and check_cancelled():
             print(f"[Debug] 작업 취소 요청됨")
             return {"error": "작업 취소됨"}
         
-        time.sleep(API_DELAY)
         encoded_name = requests.utils.quote(scientific_name)
         url = f"{WORMS_BASE_URL}/AphiaIDByName/{encoded_name}?marine_only=false"
         print(f"[Debug WoRMS API] Requesting AphiaID: {url}") # 요청 URL 로그 추가
         
-        # 보안 강화된 SSL 처리
-        ssl_configs = [
-            {'verify': True, 'description': 'SSL 검증 활성화'}
-        ]
-        
-        # 기업 환경 지원이 활성화된 경우에만 SSL 우회 추가
-        if SSL_CONFIG.get("allow_insecure_fallback", False):
-            ssl_configs.append({
-                'verify': False, 
-                'description': 'SSL 검증 우회 (기업 환경)'
-            })
-        
-        response = None
-        
-        for ssl_config in ssl_configs:
-            try:
-                # SSL 우회 사용 시 조용히 처리
-                if not ssl_config['verify']:
-                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                
-                response = requests.get(
-                    url, 
-                    headers=DEFAULT_HEADERS, 
-                    timeout=REQUEST_TIMEOUT, 
-                    verify=ssl_config['verify']
-                )
-                response.raise_for_status()
-                
-                # 연결 성공 - 조용히 처리
-                
-                break  # 성공하면 루프 탈출
-                
-            except requests.exceptions.SSLError:
-                if ssl_config['verify']:
-                    continue  # SSL 검증 실패시 다음 설정으로 시도
-                else:
-                    raise  # SSL 우회도 실패하면 예외 발생
-            except Exception as e:
-                if ssl_config['verify']:
-                    continue  # 기타 오류시 다음 설정으로 시도
-                else:
-                    raise  # SSL 우회도 실패하면 예외 발생
+        # 공용 연결 풀 세션으로 요청 (업스트림 속도 제한 적용)
+        response = _worms_get(url, check_cancelled=check_cancelled)
+        if response is None:
+            return {"error": "작업 취소됨"}
         
         print(f"[Debug WoRMS API] Response Status (AphiaID for '{scientific_name}'): {response.status_code}") # 상태 코드 로그 추가
         # print(f"[Debug WoRMS API] Response Content (AphiaID for '{scientific_name}'): {response.text[:100]}...") # 내용 로그 (필요시 주석 해제)
@@ -91,7 +79,7 @@ def get_aphia_id(scientific_name: str, check_cancelled: Optional[Callable[[], bo
 
         if not response.content or response.status_code == 204:
             print(f"[Debug WoRMS API] No content received for AphiaID '{scientific_name}'") # 로그 추가
-            aphia_id = {"error": f"WoRMS 응답 없음 (AphiaID: {scientific_name})"}
+            aphia_id = -999  # 일치하는 학명 없음 (등록되지 않음으로 처리)
         else:
             try:
                 # JSON 파싱 전 취소 여부 다시 확인
@@ -108,12 +96,10 @@ def get_aphia_id(scientific_name: str, check_cancelled: Optional[Callable[[], bo
                     return {"error": "작업 취소됨"}
                     
                 aphia_id = aphia_id_value # 파싱 성공 시 데이터 할당
-                if isinstance(aphia_id, int) and aphia_id == -999:
-                    aphia_id = {"error": "유효하지 않은 학명 (WoRMS)"}
-                elif isinstance(aphia_id, list) and len(aphia_id) > 0 and isinstance(aphia_id[0], int):
+                if isinstance(aphia_id, list) and len(aphia_id) > 0 and isinstance(aphia_id[0], int):
                     aphia_id = aphia_id[0]
                 elif isinstance(aphia_id, int):
-                    aphia_id = aphia_id
+                    aphia_id = aphia_id  # -999: 일치하는 학명 없음
                 else:
                     print(f"[Warning WoRMS API] Unexpected response format (AphiaID for {scientific_name}): {aphia_id}") # 경고 로그
                     aphia_id = {"error": "WoRMS 예상치 못한 응답 형식 (AphiaID)"}
@@ -150,52 +136,13 @@ def get_aphia_record(aphia_id: int, check_cancelled: Optional[Callable[[], bool]
             print(f"[Debug] 작업 취소 요청됨")
             return {"error": "작업 취소됨"}
         
-        time.sleep(API_DELAY)
         url = f"{WORMS_BASE_URL}/AphiaRecordByAphiaID/{aphia_id}"
         print(f"[Debug WoRMS API] Requesting AphiaRecord: {url}") # 요청 URL 로그 추가
         
-        # 보안 강화된 SSL 처리
-        ssl_configs = [
-            {'verify': True, 'description': 'SSL 검증 활성화'}
-        ]
-        
-        # 기업 환경 지원이 활성화된 경우에만 SSL 우회 추가
-        if SSL_CONFIG.get("allow_insecure_fallback", False):
-            ssl_configs.append({
-                'verify': False, 
-                'description': 'SSL 검증 우회 (기업 환경)'
-            })
-        
-        response = None
-        
-        for ssl_config in ssl_configs:
-            try:
-                # SSL 우회 사용 시 조용히 처리
-                if not ssl_config['verify']:
-                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                
-                response = requests.get(
-                    url, 
-                    headers=DEFAULT_HEADERS, 
-                    timeout=REQUEST_TIMEOUT, 
-                    verify=ssl_config['verify']
-                )
-                response.raise_for_status()
-                
-                # 연결 성공 - 조용히 처리
-                
-                break  # 성공하면 루프 탈출
-                
-            except requests.exceptions.SSLError:
-                if ssl_config['verify']:
-                    continue  # SSL 검증 실패시 다음 설정으로 시도
-                else:
-                    raise  # SSL 우회도 실패하면 예외 발생
-            except Exception as e:
-                if ssl_config['verify']:
-                    continue  # 기타 오류시 다음 설정으로 시도
-                else:
-                    raise  # SSL 우회도 실패하면 예외 발생
+        # 공용 연결 풀 세션으로 요청 (업스트림 속도 제한 적용)
+        response = _worms_get(url, check_cancelled=check_cancelled)
+        if response is None:
+            return {"error": "작업 취소됨"}
         
         print(f"[Debug WoRMS API] Response Status (AphiaRecord for {aphia_id}): {response.status_code}") # 상태 코드 로그 추가
         # print(f"[Debug WoRMS API] Response Content (AphiaRecord for {aphia_id}): {response.text[:100]}...") # 내용 로그 (필요시 주석 해제)
@@ -243,9 +190,82 @@ def get_aphia_record(aphia_id: int, check_cancelled: Optional[Callable[[], bool]
     print(f"[Debug WoRMS API] Returning for AphiaRecord {aphia_id}: {record}") # 최종 반환 값 로그 추가
     return record
     
-def verify_single_species(scientific_name: str, check_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
-    """단일 종 학명의 유효성을 검증합니다."""
-    result = {
+def get_aphia_records_by_match_names(scientific_names: List[str], check_cancelled: Optional[Callable[[], bool]] = None) -> Union[List[List[Dict[str, Any]]], Dict[str, str]]:
+    """
+    여러 학명을 WoRMS AphiaRecordsByMatchNames로 한 번에 매칭합니다.
+
+    Args:
+        scientific_names: 매칭할 학명 목록 (WoRMS 제한: 요청당 최대 50개)
+        check_cancelled: 취소 여부 확인 콜백 함수
+
+    Returns:
+        입력 순서와 같은 순서의 레코드 목록 리스트 (매칭 없음은 빈 리스트),
+        실패 시 {"error": ...} 사전
+    """
+    if not scientific_names:
+        return []
+    if len(scientific_names) > MATCH_BATCH_SIZE:
+        return {"error": f"WoRMS 일괄 매칭 최대 {MATCH_BATCH_SIZE}개 초과 ({len(scientific_names)}개)"}
+
+    response = None
+    try:
+        if check_cancelled and check_cancelled():
+            print(f"[Debug] 작업 취소 요청됨")
+            return {"error": "작업 취소됨"}
+
+        url = f"{WORMS_BASE_URL}/AphiaRecordsByMatchNames"
+        params = {"scientificnames[]": list(scientific_names), "marine_only": "false"}
+        print(f"[Debug WoRMS API] Requesting AphiaRecordsByMatchNames: {len(scientific_names)}개 학명")
+
+        # 공용 연결 풀 세션으로 요청 (업스트림 속도 제한 적용)
+        response = _worms_get(url, params=params, check_cancelled=check_cancelled)
+        if response is None:
+            return {"error": "작업 취소됨"}
+
+        print(f"[Debug WoRMS API] Response Status (AphiaRecordsByMatchNames): {response.status_code}")
+        response.raise_for_status()
+
+        # 응답을 받은 후에도 취소 여부 다시 확인
+        if check_cancelled and check_cancelled():
+            print(f"[Debug] 응답 받은 후 취소 요청 감지됨")
+            return {"error": "작업 취소됨"}
+
+        # 204: 요청한 학명 모두 매칭 없음
+        if not response.content or response.status_code == 204:
+            return [[] for _ in scientific_names]
+
+        return _normalize_match_records(scientific_names, response.json())
+
+    except JSONDecodeError as e:
+        print(f"[Error WoRMS API] JSON parsing error during AphiaRecordsByMatchNames request: {e}")
+        return {"error": f"WoRMS 응답 파싱 오류 (AphiaRecordsByMatchNames): {e}"}
+    except RequestException as e:
+        print(f"[Error WoRMS API] Network error during AphiaRecordsByMatchNames request: {e}")
+        return {"error": f"WoRMS 네트워크 오류 (AphiaRecordsByMatchNames): {e}"}
+    except Exception as e:
+        import traceback
+        print(f"[Error WoRMS API] Unexpected error during AphiaRecordsByMatchNames request: {e}")
+        print(traceback.format_exc())
+        return {"error": f"WoRMS 예상치 못한 오류 (AphiaRecordsByMatchNames): {e}"}
+
+def _select_best_match(records: List[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    """
+    매칭 레코드를 정확 일치(exact)와 유사 일치(phonetic, near_* 등)로 나눕니다.
+
+    Returns:
+        (정확 일치 레코드, 유사 학명 제안용 레코드) - 없으면 None
+    """
+    candidates = [record for record in records if isinstance(record, dict) and record.get('AphiaID')]
+    if not candidates:
+        return None, None
+    for record in candidates:
+        if str(record.get('match_type', '')).lower() == 'exact':
+            return record, None
+    return None, candidates[0]
+
+def _create_worms_result(scientific_name: str) -> Dict[str, Any]:
+    """WoRMS 검증 결과 기본 사전을 생성합니다."""
+    return {
         'input_name': scientific_name,
         'scientific_name': scientific_name,
         'is_verified': False,
@@ -256,6 +276,77 @@ def verify_single_species(scientific_name: str, check_cancelled: Optional[Callab
         'worms_classification': {},
         'wiki_summary': '-'
     }
+
+def _apply_worms_error(result: Dict[str, Any], error: str) -> None:
+    """API 오류를 검증 결과에 반영합니다 (일시적 실패이므로 캐시하지 않도록 표시)."""
+    result['worms_status'] = error
+    result['cacheable'] = False
+
+def _apply_aphia_record(result: Dict[str, Any], aphia_id: int, record: Dict[str, Any], scientific_name: str) -> None:
+    """AphiaRecord 정보를 검증 결과 사전에 반영합니다."""
+    result['is_verified'] = True
+    result['worms_status'] = 'WoRMS 등재 확인됨'
+    result['worms_id'] = str(aphia_id)
+    result['worms_link'] = f'https://www.marinespecies.org/aphia.php?p=taxdetails&id={aphia_id}'
+
+    # 정확한 학명으로 업데이트
+    if 'scientificname' in record and record['scientificname']:
+        valid_scientific_name = record['scientificname']
+
+        # 입력 학명과 유효 학명이 다른 경우
+        if valid_scientific_name.lower() != scientific_name.lower():
+            result['similar_name'] = valid_scientific_name
+            result['worms_status'] = f'수정된 학명: {valid_scientific_name}'
+
+        result['scientific_name'] = valid_scientific_name
+
+    # 분류 정보 추가
+    taxonomy = {}
+    for level in ['kingdom', 'phylum', 'class', 'order', 'family', 'genus']:
+        if level in record and record[level]:
+            taxonomy[level] = record[level]
+
+    result['worms_classification'] = taxonomy
+    
+def _normalize_match_records(scientific_names: List[str], matches: Any) -> Union[List[List[Dict[str, Any]]], Dict[str, str]]:
+    """AphiaRecordsByMatchNames 응답(JSON)을 입력 순서의 레코드 목록 리스트로 정리합니다."""
+    if not isinstance(matches, list) or len(matches) != len(scientific_names):
+        print(f"[Warning WoRMS API] Unexpected response format (AphiaRecordsByMatchNames): {str(matches)[:200]}")
+        return {"error": "WoRMS 예상치 못한 응답 형식 (AphiaRecordsByMatchNames)"}
+
+    return [records if isinstance(records, list) else [] for records in matches]
+
+def _build_match_results(scientific_names: List[str], matches: Union[List[List[Dict[str, Any]]], Dict[str, str]]) -> List[Dict[str, Any]]:
+    """일괄 매칭 결과를 verify_single_species와 같은 형식의 결과 목록으로 변환합니다 (동기/비동기 공용)."""
+    results = []
+    for index, scientific_name in enumerate(scientific_names):
+        # 각 학명에 대한 기본 결과 사전 초기화
+        result = _create_worms_result(scientific_name)
+        
+        # 에러 처리 (청크 전체 실패)
+        if isinstance(matches, dict) and 'error' in matches:
+            _apply_worms_error(result, matches['error'])
+            results.append(result)
+            continue
+        
+        record, similar_record = _select_best_match(matches[index])
+        if record:
+            _apply_aphia_record(result, int(record['AphiaID']), record, scientific_name)
+        else:
+            # 정확히 일치하는 레코드가 없는 경우 (유사 일치는 검증하지 않고 제안만 표시)
+            result['worms_status'] = 'WoRMS 등록되지 않음'
+            if similar_record and similar_record.get('scientificname'):
+                result['similar_name'] = similar_record['scientificname']
+        
+        # 결과 목록에 추가
+        results.append(result)
+    return results
+
+@memory_cached("worms")
+@single_flight("worms")
+def verify_single_species(scientific_name: str, check_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """단일 종 학명의 유효성을 검증합니다."""
+    result = _create_worms_result(scientific_name)
     
     # 취소 확인
     if check_cancelled and check_cancelled():
@@ -267,7 +358,7 @@ def verify_single_species(scientific_name: str, check_cancelled: Optional[Callab
     
     # 에러 처리
     if isinstance(aphia_id, dict) and 'error' in aphia_id:
-        result['worms_status'] = aphia_id['error']
+        _apply_worms_error(result, aphia_id['error'])
         return result
         
     # 유효한 ID가 반환되면 상세 정보 조회
@@ -277,31 +368,9 @@ def verify_single_species(scientific_name: str, check_cancelled: Optional[Callab
         # 레코드 정보로 결과 업데이트
         if record and isinstance(record, dict):
             if 'error' in record:
-                result['worms_status'] = record['error']
+                _apply_worms_error(result, record['error'])
             else:
-                result['is_verified'] = True
-                result['worms_status'] = 'WoRMS 등재 확인됨'
-                result['worms_id'] = str(aphia_id)
-                result['worms_link'] = f'https://www.marinespecies.org/aphia.php?p=taxdetails&id={aphia_id}'
-                
-                # 정확한 학명으로 업데이트
-                if 'scientificname' in record and record['scientificname']:
-                    valid_scientific_name = record['scientificname']
-                    
-                    # 입력 학명과 유효 학명이 다른 경우
-                    if valid_scientific_name.lower() != scientific_name.lower():
-                        result['similar_name'] = valid_scientific_name
-                        result['worms_status'] = f'수정된 학명: {valid_scientific_name}'
-                        
-                    result['scientific_name'] = valid_scientific_name
-                
-                # 분류 정보 추가
-                taxonomy = {}
-                for level in ['kingdom', 'phylum', 'class', 'order', 'family', 'genus']:
-                    if level in record and record[level]:
-                        taxonomy[level] = record[level]
-                
-                result['worms_classification'] = taxonomy
+                _apply_aphia_record(result, aphia_id, record, scientific_name)
     else:
         # 유효한 ID가 없는 경우
         result['worms_status'] = 'WoRMS 등록되지 않음'
@@ -311,159 +380,73 @@ def verify_single_species(scientific_name: str, check_cancelled: Optional[Callab
 def verify_species_list(species_list: List[str], check_cancelled: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
     """
     여러 종 학명의 유효성을 검증합니다.
+
+    L1 메모리 캐시에 있는 학명은 바로 사용하고, 나머지만 MATCH_BATCH_SIZE(최대 50)개 단위로
+    묶어 AphiaRecordsByMatchNames 한 번의 요청으로 조회한 뒤 verify_single_species와 같은 형식의 결과로 변환합니다.
     
     Args:
         species_list: 검증할 종 목록 (학명 문자열 리스트)
         check_cancelled: 취소 여부 확인 콜백 함수
             
     Returns:
-        검증 결과 목록 (각 종별 결과 사전)
+        검증 결과 목록 (각 종별 결과 사전, 입력 순서)
     """
-    print(f"[Debug WoRMS API] 검증 시작: 전체 {len(species_list)}개 항목 처리")
+    print(f"[Debug WoRMS API] 검증 시작: 전체 {len(species_list)}개 항목 처리 (일괄 매칭 {MATCH_BATCH_SIZE}개 단위)")
     
-    results = []
-    for i, scientific_name in enumerate(species_list):
-        print(f"[Debug WoRMS API] 항목 처리 중: {i+1}/{len(species_list)}")
+    # L1 메모리 캐시 우선 조회
+    memory_cache = get_memory_cache()
+    results_by_index: Dict[int, Dict[str, Any]] = {}
+    pending = []
+    for index, name in enumerate(species_list):
+        cached = memory_cache.get("worms", name) if isinstance(name, str) else None
+        if cached is not None:
+            results_by_index[index] = cached
+        else:
+            pending.append(index)
+    if results_by_index:
+        print(f"[Debug WoRMS API] 메모리 캐시 적중: {len(results_by_index)}개, API 조회 대상: {len(pending)}개")
+    
+    def ordered_results() -> List[Dict[str, Any]]:
+        return [results_by_index[index] for index in sorted(results_by_index)]
+    
+    for start in range(0, len(pending), MATCH_BATCH_SIZE):
+        chunk_indexes = pending[start:start + MATCH_BATCH_SIZE]
+        chunk = [species_list[index] for index in chunk_indexes]
+        print(f"[Debug WoRMS API] 항목 처리 중: {start + 1}-{start + len(chunk)}/{len(pending)}")
         
         # 취소 확인
         if check_cancelled and check_cancelled():
             print(f"[Debug WoRMS] 작업 취소 요청됨 - 검증 즉시 중단")
             # 취소 정보를 결과에 추가하고 즉시 반환
-            results.append({"error": "작업 취소됨", "status": "cancelled"})
-            return results
+            return ordered_results() + [{"error": "작업 취소됨", "status": "cancelled"}]
             
-        # 각 학명에 대한 기본 결과 사전 초기화
-        result = {
-            'input_name': scientific_name,
-            'scientific_name': scientific_name,
-            'is_verified': False,
-            'worms_status': 'N/A',
-            'similar_name': '-',
-            'worms_id': '-',
-            'worms_link': '-',
-            'worms_classification': {},
-            'wiki_summary': '-'
-        }
-        
-        # 취소 여부 다시 확인
-        if check_cancelled and check_cancelled():
-            print(f"[Debug WoRMS] 작업 취소 요청 감지됨 - 검증 즉시 중단")
-            # 취소 정보를 결과에 추가하고 즉시 반환
-            results.append({"error": "작업 취소됨", "status": "cancelled", "input_name": scientific_name})
-            return results
-            
-        # WoRMS ID 조회
-        aphia_id = get_aphia_id(scientific_name, check_cancelled)
-        
-        # 에러 처리
-        if isinstance(aphia_id, dict) and 'error' in aphia_id:
-            result['worms_status'] = aphia_id['error']
-            results.append(result)
-            continue
-        
-        # 유효한 ID가 반환되면 상세 정보 조회
-        if isinstance(aphia_id, int) and aphia_id > 0:
-            record = get_aphia_record(aphia_id, check_cancelled)
-            
-            # 레코드 정보로 결과 업데이트
-            if record and isinstance(record, dict):
-                if 'error' in record:
-                    result['worms_status'] = record['error']
-                else:
-                    result['is_verified'] = True
-                    result['worms_status'] = 'WoRMS 등재 확인됨'
-                    result['worms_id'] = str(aphia_id)
-                    result['worms_link'] = f'https://www.marinespecies.org/aphia.php?p=taxdetails&id={aphia_id}'
-                    
-                    # 정확한 학명으로 업데이트
-                    if 'scientificname' in record and record['scientificname']:
-                        valid_scientific_name = record['scientificname']
-                        
-                        # 입력 학명과 유효 학명이 다른 경우
-                        if valid_scientific_name.lower() != scientific_name.lower():
-                            result['similar_name'] = valid_scientific_name
-                            result['worms_status'] = f'수정된 학명: {valid_scientific_name}'
-                        
-                        result['scientific_name'] = valid_scientific_name
-                    
-                    # 분류 정보 추가
-                    taxonomy = {}
-                    for level in ['kingdom', 'phylum', 'class', 'order', 'family', 'genus']:
-                        if level in record and record[level]:
-                            taxonomy[level] = record[level]
-                    
-                    result['worms_classification'] = taxonomy
-        else:
-            # 유효한 ID가 없는 경우
-            result['worms_status'] = 'WoRMS 등록되지 않음'
+        # 청크 단위 일괄 매칭 (요청 1회)
+        matches = get_aphia_records_by_match_names(chunk, check_cancelled)
         
         # API 응답 처리 후 취소 확인
         if check_cancelled and check_cancelled():
             print(f"[Debug WoRMS] API 처리 후 취소 요청 감지됨 - 검증 즉시 중단")
-            # 취소 정보를 결과에 추가하고 즉시 반환
-            results.append({"error": "작업 취소됨", "status": "cancelled", "input_name": scientific_name})
-            return results
-        
-        # 결과 목록에 추가
-        results.append(result)
+            return ordered_results() + [{"error": "작업 취소됨", "status": "cancelled", "input_name": chunk[0]}]
         
-        # API 속도 제한 준수
-        time.sleep(API_DELAY)
+        for index, name, result in zip(chunk_indexes, chunk, _build_match_results(chunk, matches)):
+            results_by_index[index] = result
+            memory_cache.set("worms", name, result)
     
+    results = ordered_results()
     print(f"[Debug WoRMS API] 검증 완료: 총 {len(results)}/{len(species_list)}개 항목 처리됨")
     return results
 
 def get_worms_data_with_fallback(scientific_name: str) -> Dict[str, Any]:
     """
     WoRMS API에서 학명 데이터를 가져옵니다. (보안 강화)
-    네트워크 오류 시 여러 방법으로 재시도합니다.
+    SSL 검증 실패 시 호스트별 TLS 정책에 따라 한 번만 우회합니다.
     """
-    url = "https://www.marinespecies.org/rest/AphiaRecordsByName/" + scientific_name
+    url = f"{WORMS_BASE_URL}/AphiaRecordsByName/" + requests.utils.quote(scientific_name)
     params = {"like": "false", "marine_only": "false"}
     
-    # SSL 설정 (보안 우선)
-    ssl_configs = [
-        {'verify': True, 'description': 'SSL 검증 활성화'}
-    ]
-    
-    # 기업 환경 지원이 활성화된 경우에만 SSL 우회 추가
-    if SSL_CONFIG.get("allow_insecure_fallback", False):
-        ssl_configs.append({
-            'verify': False, 
-            'description': 'SSL 검증 우회 (기업 환경)'
-        })
-    
-    for ssl_config in ssl_configs:
-        try:
-            # SSL 우회 사용 시 로깅
-            if not ssl_config['verify'] and SSL_CONFIG.get("log_ssl_bypass", True):
-                print(f"[Warning] ⚠️ WoRMS API - SSL 검증 우회 사용 중")
-                import urllib3
-                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            
-            response = requests.get(
-                url, 
-                params=params, 
-                headers={'User-Agent': api_config.USER_AGENT},
-                timeout=api_config.WORMS_REQUEST_TIMEOUT,
-                verify=ssl_config['verify']
-            )
-            response.raise_for_status()
-            
-            # 성공 로깅
-            if ssl_config['verify']:
-                print(f"[Info] ✅ WoRMS API 보안 연결 성공")
-            else:
-                print(f"[Info] ⚠️ WoRMS API SSL 우회로 연결 성공")
-            
-            return response.json()
-            
-        except requests.exceptions.SSLError as e:
-            print(f"[Debug] WoRMS SSL 오류: {ssl_config['description']}")
-            continue
-        except Exception as e:
-            print(f"[Debug] WoRMS 연결 오류: {ssl_config['description']} - {type(e).__name__}")
-            continue
-    
-    # 모든 시도 실패
-    raise Exception("WoRMS API 연결 실패 - 모든 보안 연결 방법 시도 후 실패")
\ No newline at end of file
+    try:
+        response = _worms_get(url, params=params)
+        return response.json()
+    except Exception as e:
+        print(f"[Debug] WoRMS 연결 오류: {type(e).__name__}")
+        raise Exception(f"WoRMS API 연결 실패 - {type(e).__name__}") from e
@@ -6,10 +6,19 @@ Supabase 기반 스마트 캐싱 매니저
 """
 import time
 import json
+import threading
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Callable
 from .supabase_client import get_supabase_client
 from .models import VerificationType
+from .revalidator import CACHE_STALE_MAX_DAYS, get_stale_revalidator
+from .log_shipper import get_log_shipper
+
+# 일괄 조회 시 in_() 필터 하나에 넣을 최대 학명 수 (PostgREST 요청 URL 길이 제한 대비)
+SUPABASE_IN_CHUNK_SIZE = 100
+SUPABASE_CLEANUP_BATCH = 200  # 만료 캐시 정리 시 요청당 삭제할 행 수 (id 목록이 URL에 들어감)
+SUPABASE_CLEANUP_MAX_SECONDS = 60  # 정리 1회 최대 실행 시간 (남은 항목은 다음 정리 때 삭제)
+CLEANUP_WORKER_INTERVAL = 3600  # 백그라운드 정리 주기 (초)
 
 class SpeciesCacheManager:
     """학명 검증 결과 캐싱 관리 - 완전한 로깅 기능 + 실시간 비교 업데이트"""
@@ -33,28 +42,39 @@ class SpeciesCacheManager:
             'general': 'col'        # 일반생물 → COL (기본값)
         }
         
+        # 백그라운드 만료 캐시 정리 (start_cleanup_worker로 시작)
+        self._cleanup_thread = None
+        self._cleanup_stop = threading.Event()
+        self.last_cleanup: Dict[str, Any] = {}
+        
         print(f"[Info] 캐시 매니저 초기화 완료: {self.user_session_id}")
     
     def get_cache_with_validation(self, scientific_name: str, source_db: str, 
                                   api_call_func: Optional[Callable] = None,
                                   session_id: Optional[str] = None,
                                   force_refresh: bool = False) -> Optional[Dict[str, Any]]:
-        """캐시 조회 + 실시간 API 결과와 비교 검증"""
+        """
+        캐시 조회 + 실시간 API 결과와 비교 검증 (stale-while-revalidate)
+        
+        유효한 캐시는 API 호출 없이 바로 반환합니다. 만료 후 허용 기간 이내의 캐시는
+        'cache_stale' 표시와 함께 바로 반환하고, API 비교 검증은 백그라운드에서 수행합니다.
+        """
         start_time = time.time()
         
         try:
-            # 1. 캐시에서 기존 데이터 조회
+            # 1. 캐시에서 기존 데이터 조회 (API로 재검증할 수 있으면 만료된 항목 포함)
             if not force_refresh:
-                cached_data = self.get_cache(scientific_name, source_db, session_id)
+                cached_data = self.get_cache(
+                    scientific_name, source_db, session_id, allow_stale=api_call_func is not None
+                )
                 if cached_data:
-                    # 2. 실시간 API 호출이 가능한 경우 비교 검증
-                    if api_call_func:
-                        return self._validate_cache_with_api(
-                            scientific_name, source_db, cached_data, 
-                            api_call_func, session_id
+                    # 2. 만료된 항목은 백그라운드에서 비교 검증
+                    if cached_data.get('cache_stale'):
+                        get_stale_revalidator().submit(
+                            ('cloud', source_db, scientific_name), self._revalidate_stale_cache,
+                            scientific_name, source_db, cached_data, api_call_func, session_id
                         )
-                    else:
-                        return cached_data
+                    return cached_data
             
             # 3. 캐시가 없거나 강제 새로고침인 경우 API 호출
             if api_call_func:
@@ -79,62 +99,35 @@ class SpeciesCacheManager:
             print(f"[Error] 캐시 검증 중 오류: {e}")
             return None
     
-    def _validate_cache_with_api(self, scientific_name: str, source_db: str,
-                                 cached_data: Dict[str, Any], api_call_func: Callable,
-                                 session_id: Optional[str] = None) -> Dict[str, Any]:
-        """캐시 데이터와 실시간 API 결과 비교 검증"""
-        try:
-            # 실시간 API 호출 (주요 필드만 확인)
-            api_start = time.time()
-            fresh_data = api_call_func(scientific_name)
-            api_time = int((time.time() - api_start) * 1000)
-            
-            if not fresh_data:
-                print(f"[Warning] API 호출 실패, 캐시 데이터 사용: {scientific_name}")
-                return cached_data
-            
-            # 주요 필드 비교 (데이터베이스별 다른 필드)
-            key_fields = self._get_key_fields_for_db(source_db)
-            has_differences = False
-            
-            for field in key_fields:
-                cached_value = cached_data.get(field)
-                fresh_value = fresh_data.get(field)
-                
-                if cached_value != fresh_value:
-                    print(f"[Info] 데이터 변경 감지: {scientific_name}.{field} '{cached_value}' → '{fresh_value}'")
-                    has_differences = True
-            
-            if has_differences:
-                # 변경사항이 있으면 캐시 업데이트
-                print(f"[Info] 캐시 자동 업데이트: {scientific_name} ({source_db})")
-                self.set_cache(
-                    scientific_name, source_db, fresh_data,
-                    update_reason='data_mismatch',
-                    api_response_time=api_time,
-                    session_id=session_id
-                )
-                
-                # 불일치 로그 기록
-                self._log_cache_update(
-                    scientific_name=scientific_name,
-                    source_db=source_db,
-                    update_type='api_mismatch',
-                    old_data=cached_data,
-                    new_data=fresh_data,
-                    update_reason=f"실시간 검증에서 {len([f for f in key_fields if cached_data.get(f) != fresh_data.get(f)])}개 필드 변경 감지",
-                    api_response_time=api_time
-                )
-                
-                return fresh_data
-            else:
-                # 데이터가 동일하면 캐시 그대로 사용
-                print(f"[Info] 캐시 데이터 검증 완료: {scientific_name} (변경사항 없음)")
-                return cached_data
-                
-        except Exception as e:
-            print(f"[Warning] API 비교 검증 실패, 캐시 데이터 사용: {e}")
-            return cached_data
+    def _revalidate_stale_cache(self, scientific_name: str, source_db: str,
+                                stale_data: Dict[str, Any], api_call_func: Callable,
+                                session_id: Optional[str] = None):
+        """만료된 캐시 백그라운드 재검증 (변경 사항은 스케줄러 비교 로직으로 기록, 캐시는 항상 갱신)"""
+        from .scheduler import get_cache_scheduler
+        
+        api_start = time.time()
+        fresh_data = api_call_func(scientific_name)
+        api_time = int((time.time() - api_start) * 1000)
+        
+        if not fresh_data or 'error' in fresh_data:
+            print(f"[Warning] 재검증 API 호출 실패, stale 캐시 유지: {scientific_name}")
+            return
+        
+        scheduler = get_cache_scheduler()
+        comparison_result = scheduler._compare_data(stale_data, fresh_data, source_db)
+        if comparison_result['has_changes']:
+            scheduler._log_data_changes(
+                scientific_name, source_db,
+                comparison_result['changed_fields'],
+                stale_data, fresh_data
+            )
+        
+        self.set_cache(
+            scientific_name, source_db, fresh_data,
+            update_reason='data_mismatch' if comparison_result['has_changes'] else 'stale_revalidate',
+            api_response_time=api_time,
+            session_id=session_id
+        )
     
     def _get_key_fields_for_db(self, source_db: str) -> List[str]:
         """데이터베이스별 주요 비교 필드 반환"""
@@ -186,9 +179,6 @@ class SpeciesCacheManager:
                             skipped_count += 1
                     else:
                         skipped_count += 1
-                        
-                    # API 호출 간격 (서버 부담 방지)
-                    time.sleep(1.5)
                     
                 except Exception as item_error:
                     print(f"[Warning] {scientific_name} 새로고침 실패: {item_error}")
@@ -227,18 +217,25 @@ class SpeciesCacheManager:
         return None
 
     def get_cache(self, scientific_name: str, source_db: str, 
-                  session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        """기본 캐시 조회 (기존 기능 유지)"""
+                  session_id: Optional[str] = None,
+                  allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        기본 캐시 조회 (기존 기능 유지)
+        
+        allow_stale이면 만료 후 CACHE_STALE_MAX_DAYS 이내의 항목도 'cache_stale' 표시와 함께 반환합니다.
+        """
         start_time = time.time()
         
         try:
-            # 캐시 조회 (만료되지 않은 것만)
+            # 캐시 조회 (만료되지 않은 것만, allow_stale이면 stale 허용 기간 이내까지)
+            now = datetime.now()
+            min_expires_at = now - timedelta(days=CACHE_STALE_MAX_DAYS) if allow_stale else now
             result = self.client.table("species_cache").select("*").eq(
                 "scientific_name", scientific_name
             ).eq(
                 "source_db", source_db
             ).gt(
-                "expires_at", datetime.now().isoformat()
+                "expires_at", min_expires_at.isoformat()
             ).execute()
             
             response_time_ms = int((time.time() - start_time) * 1000)
@@ -247,16 +244,21 @@ class SpeciesCacheManager:
                 # 캐시 히트
                 cache_record = result.data[0]
                 cache_age = (datetime.now() - datetime.fromisoformat(cache_record['created_at'].replace('Z', '+00:00')))
+                is_stale = cache_record['expires_at'] <= now.isoformat()
                 
                 self._log_cache_access(
                     scientific_name=scientific_name,
                     source_db=source_db,
-                    access_type='hit',
+                    access_type='stale_hit' if is_stale else 'hit',
                     response_time_ms=response_time_ms,
                     cache_age_seconds=int(cache_age.total_seconds()),
                     session_id=session_id
                 )
                 
+                if is_stale:
+                    print(f"[Info] 캐시 stale 히트: {scientific_name} ({source_db}) - {response_time_ms}ms")
+                    return dict(cache_record['cache_data'], cache_stale=True)
+                
                 print(f"[Info] 캐시 히트: {scientific_name} ({source_db}) - {response_time_ms}ms")
                 return cache_record['cache_data']
             else:
@@ -276,6 +278,64 @@ class SpeciesCacheManager:
             print(f"[Error] 캐시 조회 중 오류: {e}")
             return None
     
+    def get_cache_many(self, scientific_names: List[str], source_db: str,
+                       session_id: Optional[str] = None,
+                       allow_stale: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 학명의 캐시를 in_() 일괄 조회로 가져옵니다 (get_cache의 일괄 버전).
+        
+        학명 SUPABASE_IN_CHUNK_SIZE개당 조회 1회, 액세스 로그는 전체를 모아 insert 1회로 기록합니다.
+        
+        Returns:
+            학명 → 캐시 데이터 딕셔너리 (미스 항목은 포함되지 않음)
+        """
+        names = list(dict.fromkeys(name for name in scientific_names if name))
+        if not names:
+            return {}
+        
+        found: Dict[str, Dict[str, Any]] = {}
+        access_logs: List[Dict[str, Any]] = []
+        now = datetime.now()
+        min_expires_at = now - timedelta(days=CACHE_STALE_MAX_DAYS) if allow_stale else now
+        
+        try:
+            for start in range(0, len(names), SUPABASE_IN_CHUNK_SIZE):
+                chunk = names[start:start + SUPABASE_IN_CHUNK_SIZE]
+                chunk_start = time.time()
+                result = self.client.table("species_cache").select("*").in_(
+                    "scientific_name", chunk
+                ).eq(
+                    "source_db", source_db
+                ).gt(
+                    "expires_at", min_expires_at.isoformat()
+                ).execute()
+                # 한 번의 조회 시간을 학명별로 나눠 기록
+                response_time_ms = int((time.time() - chunk_start) * 1000 / len(chunk))
+                
+                records = {record['scientific_name']: record for record in (result.data or [])}
+                for name in chunk:
+                    cache_record = records.get(name)
+                    if cache_record is None:
+                        access_logs.append(self._build_access_log(
+                            name, source_db, 'miss', response_time_ms, session_id=session_id
+                        ))
+                        continue
+                    
+                    cache_age = (datetime.now() - datetime.fromisoformat(cache_record['created_at'].replace('Z', '+00:00')))
+                    is_stale = cache_record['expires_at'] <= now.isoformat()
+                    access_logs.append(self._build_access_log(
+                        name, source_db, 'stale_hit' if is_stale else 'hit', response_time_ms,
+                        int(cache_age.total_seconds()), session_id
+                    ))
+                    found[name] = dict(cache_record['cache_data'], cache_stale=True) if is_stale else cache_record['cache_data']
+                    
+        except Exception as e:
+            print(f"[Error] 캐시 일괄 조회 중 오류: {e}")
+        
+        self._insert_access_logs(access_logs)
+        print(f"[Info] 캐시 일괄 조회 ({source_db}): {len(found)}/{len(names)}개 히트")
+        return found
+    
     def set_cache(self, scientific_name: str, source_db: str, data: Dict[str, Any],
                   version_info: str = None, update_reason: str = 'api_call',
                   api_response_time: int = None, session_id: Optional[str] = None):
@@ -357,28 +417,36 @@ class SpeciesCacheManager:
                           access_type: str, response_time_ms: int = None,
                           cache_age_seconds: int = None, session_id: str = None):
         """캐시 액세스 로그 기록"""
-        try:
-            log_data = {
-                "scientific_name": scientific_name,
-                "source_db": source_db,
-                "access_type": access_type,
-                "accessed_at": datetime.now().isoformat(),
-                "response_time_ms": response_time_ms,
-                "user_session": self.user_session_id,
-                "cache_age_seconds": cache_age_seconds,
-                "session_id": session_id
-            }
-            
-            self.client.table("cache_access_log").insert(log_data).execute()
-            
-        except Exception as e:
-            print(f"[Warning] 캐시 액세스 로그 기록 실패: {e}")
+        self._insert_access_logs([self._build_access_log(
+            scientific_name, source_db, access_type, response_time_ms, cache_age_seconds, session_id
+        )])
+    
+    def _build_access_log(self, scientific_name: str, source_db: str,
+                          access_type: str, response_time_ms: int = None,
+                          cache_age_seconds: int = None, session_id: str = None) -> Dict[str, Any]:
+        """캐시 액세스 로그 행 생성"""
+        return {
+            "scientific_name": scientific_name,
+            "source_db": source_db,
+            "access_type": access_type,
+            "accessed_at": datetime.now().isoformat(),
+            "response_time_ms": response_time_ms,
+            "user_session": self.user_session_id,
+            "cache_age_seconds": cache_age_seconds,
+            "session_id": session_id
+        }
+    
+    def _insert_access_logs(self, logs: List[Dict[str, Any]]):
+        """캐시 액세스 로그를 백그라운드 전송 대기열에 추가 (일괄 insert는 로그 전송기가 처리)"""
+        shipper = get_log_shipper()
+        for log_data in logs:
+            shipper.enqueue("cache_access_log", log_data)
     
     def _log_cache_update(self, scientific_name: str, source_db: str,
                           update_type: str, new_data: Dict[str, Any],
                           old_data: Dict[str, Any] = None, update_reason: str = None,
                           api_response_time: int = None):
-        """캐시 업데이트 히스토리 기록"""
+        """캐시 업데이트 히스토리 기록 (백그라운드 전송)"""
         try:
             history_data = {
                 "scientific_name": scientific_name,
@@ -392,39 +460,40 @@ class SpeciesCacheManager:
                 "api_response_time_ms": api_response_time
             }
             
-            self.client.table("cache_update_history").insert(history_data).execute()
+            get_log_shipper().enqueue("cache_update_history", history_data)
             
         except Exception as e:
             print(f"[Warning] 캐시 업데이트 히스토리 기록 실패: {e}")
     
     def get_cache_stats(self, days: int = 7) -> Dict[str, Any]:
-        """캐시 통계 조회"""
+        """캐시 통계 조회 (서버 집계 함수 get_cache_access_stats 사용, schema.sql 참고)"""
         try:
-            # 기간별 액세스 로그 조회
             since_date = (datetime.now() - timedelta(days=days)).isoformat()
             
-            logs_result = self.client.table("cache_access_log").select("*").gte(
-                "accessed_at", since_date
-            ).execute()
+            try:
+                # 소스별 집계 행만 전송됨 (액세스 로그 수와 무관)
+                rows = self.client.rpc("get_cache_access_stats", {"since": since_date}).execute().data or []
+            except Exception as rpc_error:
+                print(f"[Warning] 집계 함수 get_cache_access_stats 호출 실패, 로그 직접 집계 (schema.sql 적용 필요): {rpc_error}")
+                rows = self._aggregate_access_logs(since_date)
             
-            if not logs_result.data:
+            if not rows:
                 return {"total_queries": 0, "cache_hits": 0, "hit_rate": 0.0}
             
-            logs = logs_result.data
-            total_queries = len(logs)
-            cache_hits = len([log for log in logs if log['access_type'] == 'hit'])
+            total_queries = sum(row['total_queries'] for row in rows)
+            cache_hits = sum(row['cache_hits'] for row in rows)
+            response_time_sum = sum(row['response_time_sum'] or 0 for row in rows)
             hit_rate = (cache_hits / total_queries * 100) if total_queries > 0 else 0.0
             
             # 데이터베이스별 통계
+            rows_by_db = {row['source_db']: row for row in rows}
             db_stats = {}
             for source_db in ['worms', 'lpsn', 'col']:
-                db_logs = [log for log in logs if log['source_db'] == source_db]
-                db_hits = [log for log in db_logs if log['access_type'] == 'hit']
-                
+                row = rows_by_db.get(source_db, {'total_queries': 0, 'cache_hits': 0})
                 db_stats[source_db] = {
-                    "queries": len(db_logs),
-                    "hits": len(db_hits),
-                    "hit_rate": (len(db_hits) / len(db_logs) * 100) if db_logs else 0.0
+                    "queries": row['total_queries'],
+                    "hits": row['cache_hits'],
+                    "hit_rate": (row['cache_hits'] / row['total_queries'] * 100) if row['total_queries'] else 0.0
                 }
             
             return {
@@ -433,48 +502,131 @@ class SpeciesCacheManager:
                 "cache_hits": cache_hits,
                 "hit_rate": round(hit_rate, 2),
                 "db_stats": db_stats,
-                "avg_response_time": round(
-                    sum([log.get('response_time_ms', 0) for log in logs]) / len(logs)
-                ) if logs else 0
+                "avg_response_time": round(response_time_sum / total_queries) if total_queries else 0
             }
             
         except Exception as e:
             print(f"[Error] 캐시 통계 조회 중 오류: {e}")
             return {"error": str(e)}
     
-    def cleanup_expired_cache(self) -> int:
-        """만료된 캐시 정리"""
-        try:
-            # 만료된 캐시 조회
-            expired_result = self.client.table("species_cache").select("*").lt(
-                "expires_at", datetime.now().isoformat()
-            ).execute()
+    def _aggregate_access_logs(self, since_date: str) -> List[Dict[str, Any]]:
+        """집계 함수가 없는 DB용: 액세스 로그를 내려받아 get_cache_access_stats와 같은 형태로 집계"""
+        logs_result = self.client.table("cache_access_log").select(
+            "source_db, access_type, response_time_ms"
+        ).gte("accessed_at", since_date).execute()
+        
+        rows: Dict[str, Dict[str, Any]] = {}
+        for log in logs_result.data or []:
+            row = rows.setdefault(log['source_db'], {
+                'source_db': log['source_db'], 'total_queries': 0, 'cache_hits': 0, 'response_time_sum': 0
+            })
+            row['total_queries'] += 1
+            if log['access_type'] in ('hit', 'stale_hit'):
+                row['cache_hits'] += 1
+            row['response_time_sum'] += log.get('response_time_ms') or 0
+        return list(rows.values())
+    
+    def cleanup_expired_cache(self, batch_size: int = SUPABASE_CLEANUP_BATCH,
+                              max_seconds: Optional[float] = SUPABASE_CLEANUP_MAX_SECONDS) -> int:
+        """
+        만료된 캐시 정리 (stale 허용 기간이 지난 항목만 삭제)
+        
+        대상 수는 개수만 조회하고, batch_size개씩 id로 나눠 삭제하므로 정리할 항목이 많아도
+        요청 하나가 시간 초과되거나 테이블을 오래 잠그지 않습니다.
+        
+        Args:
+            batch_size: 요청당 삭제할 행 수
+            max_seconds: 최대 실행 시간 (None이면 제한 없음)
             
-            if not expired_result.data:
+        Returns:
+            삭제된 항목 수
+        """
+        start_time = time.time()
+        deleted_count = 0
+        batches = 0
+        try:
+            cutoff = (datetime.now() - timedelta(days=CACHE_STALE_MAX_DAYS)).isoformat()
+            # 개수만 조회 (행 데이터는 받지 않음)
+            count_result = self.client.table("species_cache").select("id", count="exact").lt(
+                "expires_at", cutoff
+            ).limit(1).execute()
+            expired_count = count_result.count or 0
+            
+            if not expired_count:
                 return 0
             
-            expired_count = len(expired_result.data)
-            
-            # 만료된 캐시 삭제
-            self.client.table("species_cache").delete().lt(
-                "expires_at", datetime.now().isoformat()
-            ).execute()
+            while not self._cleanup_stop.is_set():
+                if max_seconds is not None and time.time() - start_time >= max_seconds:
+                    break
+                id_result = self.client.table("species_cache").select("id").lt(
+                    "expires_at", cutoff
+                ).limit(batch_size).execute()
+                ids = [row['id'] for row in (id_result.data or [])]
+                if not ids:
+                    break
+                
+                self.client.table("species_cache").delete().in_("id", ids).execute()
+                deleted_count += len(ids)
+                batches += 1
+                if len(ids) < batch_size:
+                    break
+            
+            elapsed = time.time() - start_time
+            self.last_cleanup = {
+                "expired": expired_count,
+                "deleted": deleted_count,
+                "remaining": max(expired_count - deleted_count, 0),
+                "batches": batches,
+                "elapsed_seconds": round(elapsed, 3),
+                "rows_per_second": round(deleted_count / elapsed) if elapsed > 0 else deleted_count,
+                "finished_at": datetime.now().isoformat()
+            }
             
             # 정리 히스토리 기록
             self._log_cache_update(
                 scientific_name="batch_cleanup",
                 source_db="all",
                 update_type="expire",
-                new_data={"deleted_count": expired_count},
-                update_reason=f"Automatic cleanup of {expired_count} expired records"
+                new_data=self.last_cleanup,
+                update_reason=f"Automatic cleanup of {deleted_count}/{expired_count} expired records"
             )
             
-            print(f"[Info] 만료된 캐시 {expired_count}개 정리 완료")
-            return expired_count
+            print(f"[Info] 만료된 캐시 {deleted_count}/{expired_count}개 정리 완료 "
+                  f"({batches}회, {elapsed:.2f}초, 초당 {self.last_cleanup['rows_per_second']}개)")
+            return deleted_count
             
         except Exception as e:
-            print(f"[Error] 캐시 정리 중 오류: {e}")
-            return 0
+            print(f"[Error] 캐시 정리 중 오류 ({deleted_count}개 삭제 후 중단): {e}")
+            return deleted_count
+    
+    def start_cleanup_worker(self, interval_seconds: float = CLEANUP_WORKER_INTERVAL) -> bool:
+        """
+        만료 캐시 정리를 백그라운드에서 주기적으로 실행합니다.
+        
+        Returns:
+            새로 시작했으면 True (이미 실행 중이면 False)
+        """
+        if self._cleanup_thread is not None and self._cleanup_thread.is_alive():
+            return False
+        self._cleanup_stop.clear()
+        
+        def run():
+            while not self._cleanup_stop.is_set():
+                self.cleanup_expired_cache()
+                self._cleanup_stop.wait(interval_seconds)
+        
+        self._cleanup_thread = threading.Thread(target=run, name="cache-cleanup", daemon=True)
+        self._cleanup_thread.start()
+        print(f"[Info] 백그라운드 캐시 정리 시작 (주기: {interval_seconds}초)")
+        return True
+    
+    def stop_cleanup_worker(self):
+        """백그라운드 만료 캐시 정리 중지"""
+        self._cleanup_stop.set()
+        if self._cleanup_thread is not None:
+            self._cleanup_thread.join(timeout=5)
+            self._cleanup_thread = None
+        self._cleanup_stop.clear()  # 이후 직접 호출하는 정리는 계속 동작
     
     def get_popular_species(self, limit: int = 10) -> List[Dict[str, Any]]:
         """인기 검색어 Top N"""
@@ -19,6 +19,9 @@ from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 import logging
 
+from species_verifier.core.http_session import throttled_request
+from species_verifier.core.rate_limiter import get_rate_limiter
+
 # 기관 네트워크에서는 과도한 로깅 방지
 logging.getLogger("urllib3").setLevel(logging.WARNING)
 
@@ -186,7 +189,9 @@ class EnterpriseNetworkAdapter:
         try:
             print(f"[Info] API 호출: {method} {sanitized_url}")
             
-            response = session.request(method, url, **kwargs)
+            # 호스트별 속도 제한 + 적응형 조절 (고정 대기 대신)
+            source = get_rate_limiter().source_for_url(url)
+            response = throttled_request(session, source, method, url, **kwargs)
             
             # 응답 상태 확인
             if response.status_code == 200:
@@ -7,12 +7,17 @@ from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 import json
 import logging
+import time
 from dataclasses import dataclass
 
 from .supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+UPSERT_CHUNK_SIZE = 500  # 일괄 저장 시 upsert 요청 하나에 넣을 행 수
+UPSERT_MAX_RETRIES = 2  # 묶음 저장 실패 시 재시도 횟수 (이후 반으로 나눠 실패 행만 분리)
+UPSERT_RETRY_DELAY = 1.0  # 재시도 대기 기본 시간 (초, 재시도마다 2배)
+
 @dataclass
 class CacheResult:
     """캐시 검색 결과를 담는 데이터 클래스"""
@@ -132,6 +137,84 @@ class HybridCacheManager:
             logger.error(f"Cache 저장 중 오류: {str(e)}")
             return False
     
+    def save_realtime_results(self, verification_results: List[Dict[str, Any]], api_type: str,
+                              chunk_size: int = UPSERT_CHUNK_SIZE) -> Dict[str, Any]:
+        """
+        여러 실시간 검증 결과를 묶음 upsert로 캐시에 저장합니다 (save_realtime_result의 일괄 버전).
+        
+        묶음이 실패하면 재시도하고, 그래도 실패하면 반으로 나눠 다시 저장해
+        문제가 있는 행만 실패로 남깁니다.
+        
+        Args:
+            verification_results: 검증 결과 딕셔너리 목록
+            api_type: 'marine', 'microbe', 'col'
+            chunk_size: upsert 요청 하나에 넣을 행 수
+            
+        Returns:
+            {'saved', 'failed', 'failed_names'} 요약
+        """
+        summary = {'saved': 0, 'failed': 0, 'failed_names': []}
+        table_name = self.table_mapping.get(api_type)
+        if not table_name:
+            logger.error(f"Unknown API type: {api_type}")
+            summary['failed'] = len(verification_results)
+            return summary
+        
+        # 같은 입력명은 마지막 결과만 저장 (한 upsert 안에 같은 충돌 키가 두 번 있으면 오류)
+        rows_by_name: Dict[str, Dict] = {}
+        for verification_result in verification_results:
+            try:
+                cache_data = self._convert_to_cache_format(verification_result, api_type)
+            except Exception as e:
+                logger.error(f"Cache 변환 실패: {verification_result.get('input_name')} - {str(e)}")
+                summary['failed'] += 1
+                summary['failed_names'].append(verification_result.get('input_name'))
+                continue
+            if cache_data['input_name']:
+                rows_by_name[cache_data['input_name']] = cache_data
+        rows = list(rows_by_name.values())
+        
+        for start in range(0, len(rows), max(1, chunk_size)):
+            self._upsert_chunk(table_name, rows[start:start + chunk_size], summary)
+        
+        logger.info(f"Cache 일괄 SAVE ({api_type}): {summary['saved']}개 저장, {summary['failed']}개 실패")
+        return summary
+    
+    def _upsert_chunk(self, table_name: str, rows: List[Dict], summary: Dict[str, Any],
+                      max_retries: int = UPSERT_MAX_RETRIES):
+        """묶음 upsert (재시도 후에도 실패하면 반으로 나눠 저장, 연결 오류면 나누지 않음)"""
+        last_error = None
+        for attempt in range(max_retries + 1):
+            if attempt:
+                time.sleep(UPSERT_RETRY_DELAY * (2 ** (attempt - 1)))
+            try:
+                self.supabase.table(table_name)\
+                    .upsert(rows, on_conflict="input_name")\
+                    .execute()
+                summary['saved'] += len(rows)
+                return
+            except Exception as e:
+                last_error = e
+                logger.warning(f"Cache 일괄 저장 실패 ({len(rows)}개, 시도 {attempt + 1}): {str(e)}")
+        
+        # 일부 행의 데이터 문제일 수 있으므로 반으로 나눠 저장 (나눈 묶음은 재시도 없이 한 번만)
+        if len(rows) > 1 and not self._is_connection_error(last_error):
+            middle = len(rows) // 2
+            self._upsert_chunk(table_name, rows[:middle], summary, max_retries=0)
+            self._upsert_chunk(table_name, rows[middle:], summary, max_retries=0)
+            return
+        
+        logger.error(f"Cache SAVE 실패: {len(rows)}개 ({rows[0]['input_name']} 등) - {str(last_error)}")
+        summary['failed'] += len(rows)
+        summary['failed_names'].extend(row['input_name'] for row in rows)
+    
+    def _is_connection_error(self, error: Exception) -> bool:
+        """연결/시간 초과 오류인지 확인 (행을 나눠 저장해도 소용없는 오류)"""
+        if isinstance(error, (ConnectionError, TimeoutError, OSError)):
+            return True
+        error_type = type(error).__name__
+        return any(marker in error_type for marker in ("Connect", "Timeout", "Network", "Transport"))
+    
     def get_outdated_species(self, api_type: str, max_age_days: int = 30) -> List[str]:
         """
         오래된 캐시 데이터 목록을 반환합니다.
@@ -178,6 +261,20 @@ class HybridCacheManager:
             stats = {}
             api_types = [api_type] if api_type else ['marine', 'microbe', 'col']
             
+            # 집계 뷰 한 번 조회 (schema.sql의 species_cache_table_stats)
+            try:
+                rows = self.supabase.table("species_cache_table_stats")\
+                    .select("*")\
+                    .in_("source_type", api_types)\
+                    .execute().data or []
+                for row in rows:
+                    stats[row['source_type']] = self._build_table_stats(
+                        row['total_cached'], row['recent_30days'], row['verified_count']
+                    )
+                return stats
+            except Exception as view_error:
+                logger.warning(f"집계 뷰 조회 실패, 테이블별 개수 조회로 대체 (schema.sql 적용 필요): {str(view_error)}")
+            
             for api in api_types:
                 table_name = self.table_mapping.get(api)
                 if not table_name:
@@ -204,13 +301,7 @@ class HybridCacheManager:
                     .execute()
                 verified_count = verified_result.count
                 
-                stats[api] = {
-                    'total_cached': total_count,
-                    'recent_30days': recent_count,
-                    'outdated': total_count - recent_count,
-                    'verified_count': verified_count,
-                    'success_rate': round(verified_count / total_count * 100, 1) if total_count > 0 else 0
-                }
+                stats[api] = self._build_table_stats(total_count, recent_count, verified_count)
                 
             return stats
             
@@ -218,6 +309,16 @@ class HybridCacheManager:
             logger.error(f"캐시 통계 조회 중 오류: {str(e)}")
             return {}
     
+    def _build_table_stats(self, total_count: int, recent_count: int, verified_count: int) -> Dict[str, Any]:
+        """캐시 테이블 개수로 통계 딕셔너리 생성"""
+        return {
+            'total_cached': total_count,
+            'recent_30days': recent_count,
+            'outdated': total_count - recent_count,
+            'verified_count': verified_count,
+            'success_rate': round(verified_count / total_count * 100, 1) if total_count > 0 else 0
+        }
+    
     def _build_cache_result(self, cache_data: Dict, api_type: str, days_old: int) -> CacheResult:
         """캐시 데이터를 CacheResult 객체로 변환"""
         
@@ -46,6 +46,10 @@ class VerificationDatabaseIntegrator:
         results = []
         verified_count = 0
         
+        # 캐시 우선 검증: 전체 학명을 한 번에 조회하고, 새 결과는 모아서 일괄 저장
+        prefetched = {} if use_real_time_validation else self.secure_db.get_many(scientific_names, 'worms')
+        pending_cache_writes = []
+        
         try:
             for i, scientific_name in enumerate(scientific_names, 1):
                 print(f"[Info] 진행: {i}/{len(scientific_names)} - {scientific_name}")
@@ -80,7 +84,7 @@ class VerificationDatabaseIntegrator:
                             )
                     else:
                         # 기본 캐시 우선 검증
-                        cached_data = self.secure_db.get_cache(scientific_name, 'worms')
+                        cached_data = prefetched.get(scientific_name)
                         
                         if cached_data:
                             result = MarineVerificationResult(
@@ -88,7 +92,7 @@ class VerificationDatabaseIntegrator:
                                 scientific_name=cached_data.get('scientific_name', scientific_name),
                                 is_verified=cached_data.get('status') == 'valid',
                                 worms_data=cached_data,
-                                verification_status="cache_hit"
+                                verification_status="cache_stale" if cached_data.get('cache_stale') else "cache_hit"
                             )
                             if result.is_verified:
                                 verified_count += 1
@@ -98,8 +102,8 @@ class VerificationDatabaseIntegrator:
                             fresh_data = check_worms_record(scientific_name)
                             
                             if fresh_data:
-                                # 새 데이터 캐시에 저장
-                                self.secure_db.set_cache(scientific_name, 'worms', fresh_data)
+                                # 새 데이터는 루프 종료 후 일괄 저장
+                                pending_cache_writes.append({'scientific_name': scientific_name, 'source_db': 'worms', 'data': fresh_data})
                                 
                                 result = MarineVerificationResult(
                                     input_name=scientific_name,
@@ -127,9 +131,6 @@ class VerificationDatabaseIntegrator:
                         verification_type="marine"
                     )
                     
-                    # API 호출 간격 (서버 부담 방지)
-                    time.sleep(0.5)
-                    
                 except Exception as item_error:
                     print(f"[Warning] {scientific_name} 검증 실패: {item_error}")
                     # 실패한 항목도 기록
@@ -163,6 +164,10 @@ class VerificationDatabaseIntegrator:
             # 세션 실패 처리
             self.db_service.fail_verification_session(session_id, str(e))
             raise
+        finally:
+            # 새로 조회한 결과를 한 트랜잭션으로 저장
+            if pending_cache_writes:
+                self.secure_db.set_many(pending_cache_writes)
     
     def verify_microbe_species_with_cache(self, scientific_names: List[str],
                                           session_name: str = None,
@@ -182,6 +187,10 @@ class VerificationDatabaseIntegrator:
         results = []
         verified_count = 0
         
+        # 캐시 우선 검증: 전체 학명을 한 번에 조회하고, 새 결과는 모아서 일괄 저장
+        prefetched = {} if use_real_time_validation else self.secure_db.get_many(scientific_names, 'lpsn')
+        pending_cache_writes = []
+        
         try:
             for i, scientific_name in enumerate(scientific_names, 1):
                 print(f"[Info] 진행: {i}/{len(scientific_names)} - {scientific_name}")
@@ -215,7 +224,7 @@ class VerificationDatabaseIntegrator:
                             )
                     else:
                         # 기본 캐시 우선 검증
-                        cached_data = self.secure_db.get_cache(scientific_name, 'lpsn')
+                        cached_data = prefetched.get(scientific_name)
                         
                         if cached_data:
                             result = MicrobeVerificationResult(
@@ -223,7 +232,7 @@ class VerificationDatabaseIntegrator:
                                 scientific_name=cached_data.get('scientific_name', scientific_name),
                                 is_verified=cached_data.get('status') == 'valid',
                                 lpsn_data=cached_data,
-                                verification_status="cache_hit"
+                                verification_status="cache_stale" if cached_data.get('cache_stale') else "cache_hit"
                             )
                             if result.is_verified:
                                 verified_count += 1
@@ -233,8 +242,8 @@ class VerificationDatabaseIntegrator:
                             fresh_data = verify_single_microbe_lpsn(scientific_name)
                             
                             if fresh_data:
-                                # 새 데이터 캐시에 저장
-                                self.secure_db.set_cache(scientific_name, 'lpsn', fresh_data)
+                                # 새 데이터는 루프 종료 후 일괄 저장
+                                pending_cache_writes.append({'scientific_name': scientific_name, 'source_db': 'lpsn', 'data': fresh_data})
                                 
                                 result = MicrobeVerificationResult(
                                     input_name=scientific_name,
@@ -262,9 +271,6 @@ class VerificationDatabaseIntegrator:
                         verification_type="microbe"
                     )
                     
-                    # API 호출 간격 (LPSN은 더 안전하게)
-                    time.sleep(1.0)
-                    
                 except Exception as item_error:
                     print(f"[Warning] {scientific_name} 검증 실패: {item_error}")
                     error_result = MicrobeVerificationResult(
@@ -296,6 +302,10 @@ class VerificationDatabaseIntegrator:
             print(f"[Error] 미생물 검증 중 오류: {e}")
             self.db_service.fail_verification_session(session_id, str(e))
             raise
+        finally:
+            # 새로 조회한 결과를 한 트랜잭션으로 저장
+            if pending_cache_writes:
+                self.secure_db.set_many(pending_cache_writes)
     
     def get_user_favorites_with_cache_info(self, limit: int = 10) -> List[Dict[str, Any]]:
         """사용자 즐겨찾기 + 캐시 정보 조회"""
@@ -0,0 +1,250 @@
+"""
+비동기 로그 전송(log shipper) 모듈
+
+캐시 액세스/업데이트 로그와 API 사용 로그를 검증 경로에서 바로 insert하지 않고
+크기 제한이 있는 큐에 넣은 뒤, 백그라운드 스레드가 테이블별로 모아 일괄 insert합니다.
+
+- 묶음 크기(LOG_SHIPPER_BATCH_SIZE)가 차거나 주기(LOG_SHIPPER_FLUSH_INTERVAL)가 지나면 전송
+- 큐가 가득 차면 새 로그는 버리고 집계만 함 (검증 속도 우선)
+- Supabase에 연결할 수 없으면 로컬 임시 파일(JSON Lines)에 보관했다가 재시도 간격이 지난 뒤 재전송
+- 프로세스 종료 시 남은 로그 전송 (실패분은 임시 파일에 보관)
+"""
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+LOG_SHIPPER_QUEUE_SIZE = int(os.getenv("LOG_SHIPPER_QUEUE_SIZE", "10000"))  # 대기 로그 최대 수
+LOG_SHIPPER_BATCH_SIZE = int(os.getenv("LOG_SHIPPER_BATCH_SIZE", "200"))  # insert 한 번에 보낼 최대 행 수
+LOG_SHIPPER_FLUSH_INTERVAL = float(os.getenv("LOG_SHIPPER_FLUSH_INTERVAL", "5"))  # 최대 전송 지연 (초)
+LOG_SHIPPER_RETRY_INTERVAL = 60  # 전송 실패 후 재시도 간격 (초)
+LOG_SHIPPER_SPILL_MAX_BYTES = int(os.getenv("LOG_SHIPPER_SPILL_MAX_BYTES", str(20 * 1024 * 1024)))  # 임시 파일 최대 크기
+
+
+class LogShipper:
+    """테이블별 로그를 모아 백그라운드에서 일괄 insert하는 전송기"""
+
+    def __init__(self, client_factory: Optional[Callable[[], Any]] = None,
+                 spill_path: Optional[str] = None,
+                 max_queue: int = LOG_SHIPPER_QUEUE_SIZE,
+                 batch_size: int = LOG_SHIPPER_BATCH_SIZE,
+                 flush_interval: float = LOG_SHIPPER_FLUSH_INTERVAL):
+        """
+        초기화 함수
+
+        Args:
+            client_factory: Supabase 클라이언트 반환 함수 (기본값: get_supabase_client)
+            spill_path: 전송 실패 로그를 보관할 파일 경로 (기본값: APPDATA 아래)
+            max_queue: 대기 로그 최대 수
+            batch_size: insert 한 번에 보낼 최대 행 수
+            flush_interval: 최대 전송 지연 (초)
+        """
+        self._client_factory = client_factory
+        self._client = None
+        self.spill_path = spill_path or self._get_default_spill_path()
+        self.batch_size = max(1, int(batch_size))
+        self.flush_interval = float(flush_interval)
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max(1, int(max_queue)))
+        self._send_lock = threading.Lock()  # 전송/임시 파일 접근 직렬화
+        self._stats_lock = threading.Lock()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._flush_event = threading.Event()
+        self._retry_after = 0.0  # 이 시각 전에는 전송하지 않고 임시 파일에 보관
+        self.stats = {"queued": 0, "sent": 0, "dropped": 0, "spilled": 0, "replayed": 0, "failed_batches": 0}
+        atexit.register(self.close)
+
+    def _get_default_spill_path(self) -> str:
+        """기본 임시 파일 경로 반환"""
+        app_data_dir = os.getenv("APPDATA", os.path.expanduser("~"))
+        log_dir = Path(app_data_dir) / "SpeciesVerifier" / "cache"
+        log_dir.mkdir(parents=True, exist_ok=True)
+        return str(log_dir / "pending_logs.jsonl")
+
+    def _get_client(self):
+        """Supabase 클라이언트 (처음 전송할 때 연결)"""
+        if self._client is None:
+            if self._client_factory is None:
+                from .supabase_client import get_supabase_client
+                self._client_factory = get_supabase_client
+            self._client = self._client_factory()
+        return self._client
+
+    def _increment(self, key: str, count: int = 1):
+        with self._stats_lock:
+            self.stats[key] += count
+
+    def enqueue(self, table: str, row: Dict[str, Any]) -> bool:
+        """
+        로그 한 행을 전송 대기열에 넣습니다 (대기하지 않음).
+
+        Returns:
+            대기열 추가 여부 (가득 차서 버렸으면 False)
+        """
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((table, row))
+        except queue.Full:
+            self._increment("dropped")
+            return False
+        self._increment("queued")
+        if self._stop_event.is_set():
+            self.flush()  # 종료 후 들어온 로그는 바로 전송
+        elif self._queue.qsize() >= self.batch_size:
+            self._flush_event.set()
+        return True
+
+    def _ensure_thread(self):
+        """백그라운드 전송 스레드 시작 (처음 한 번)"""
+        if self._thread is not None or self._stop_event.is_set():
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-shipper", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """주기 또는 묶음 크기 도달 시 대기열 전송"""
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[Warning] 로그 전송 중 오류: {e}")
+
+    def _drain(self) -> Dict[str, List[Dict[str, Any]]]:
+        """대기열의 로그를 테이블별로 모두 꺼냄"""
+        batches: Dict[str, List[Dict[str, Any]]] = {}
+        while True:
+            try:
+                table, row = self._queue.get_nowait()
+            except queue.Empty:
+                return batches
+            batches.setdefault(table, []).append(row)
+
+    def flush(self) -> int:
+        """
+        대기 중인 로그를 지금 전송합니다 (실패분은 임시 파일에 보관).
+
+        Returns:
+            전송된 행 수
+        """
+        with self._send_lock:
+            batches = self._drain()
+            if time.time() < self._retry_after:
+                for table, rows in batches.items():
+                    self._spill(table, rows)
+                return 0
+
+            sent = 0
+            for table, rows in batches.items():
+                sent += self._send_rows(table, rows)
+            if time.time() >= self._retry_after:
+                sent += self._replay_spill()
+            return sent
+
+    def _send_rows(self, table: str, rows: List[Dict[str, Any]]) -> int:
+        """batch_size 단위로 insert (실패하면 나머지는 임시 파일에 보관)"""
+        sent = 0
+        for start in range(0, len(rows), self.batch_size):
+            chunk = rows[start:start + self.batch_size]
+            if time.time() < self._retry_after:
+                self._spill(table, rows[start:])
+                break
+            try:
+                self._get_client().table(table).insert(chunk).execute()
+                sent += len(chunk)
+            except Exception as e:
+                print(f"[Warning] 로그 일괄 전송 실패 ({table}, {len(chunk)}건), 로컬에 보관: {e}")
+                self._increment("failed_batches")
+                self._retry_after = time.time() + LOG_SHIPPER_RETRY_INTERVAL
+                self._spill(table, rows[start:])
+                break
+        self._increment("sent", sent)
+        return sent
+
+    def _spill(self, table: str, rows: List[Dict[str, Any]]):
+        """전송하지 못한 로그를 임시 파일에 추가 (최대 크기를 넘으면 버림)"""
+        if not rows:
+            return
+        try:
+            if os.path.exists(self.spill_path) and os.path.getsize(self.spill_path) >= LOG_SHIPPER_SPILL_MAX_BYTES:
+                self._increment("dropped", len(rows))
+                return
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps({"table": table, "row": row}, ensure_ascii=False, default=str) + "\n")
+            self._increment("spilled", len(rows))
+        except OSError as e:
+            print(f"[Warning] 로그 임시 파일 저장 실패, {len(rows)}건 버림: {e}")
+            self._increment("dropped", len(rows))
+
+    def _replay_spill(self) -> int:
+        """임시 파일에 보관된 로그 재전송 (다시 실패한 로그는 새 임시 파일에 보관)"""
+        if not os.path.exists(self.spill_path):
+            return 0
+        replay_path = f"{self.spill_path}.sending"
+        try:
+            os.replace(self.spill_path, replay_path)
+            batches: Dict[str, List[Dict[str, Any]]] = {}
+            with open(replay_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        batches.setdefault(entry["table"], []).append(entry["row"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # 중간에 잘린 줄은 버림
+            os.remove(replay_path)
+        except OSError as e:
+            print(f"[Warning] 로그 임시 파일 읽기 실패: {e}")
+            return 0
+
+        sent = 0
+        for table, rows in batches.items():
+            sent += self._send_rows(table, rows)
+        if sent:
+            self._increment("replayed", sent)
+            print(f"[Info] 보관된 로그 재전송 완료: {sent}건")
+        return sent
+
+    def close(self, timeout: float = 5):
+        """전송 스레드를 멈추고 남은 로그 전송 (종료 시 자동 호출)"""
+        self._stop_event.set()
+        self._flush_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"[Warning] 종료 시 로그 전송 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """전송 통계 반환"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+        stats["pending"] = self._queue.qsize()
+        stats["spill_bytes"] = os.path.getsize(self.spill_path) if os.path.exists(self.spill_path) else 0
+        return stats
+
+
+# 전역 로그 전송기 인스턴스 (처음 사용할 때 생성)
+_log_shipper = None
+_log_shipper_lock = threading.Lock()
+
+def get_log_shipper() -> LogShipper:
+    """전역 로그 전송기 인스턴스 반환"""
+    global _log_shipper
+    if _log_shipper is None:
+        with _log_shipper_lock:
+            if _log_shipper is None:
+                _log_shipper = LogShipper()
+    return _log_shipper
@@ -0,0 +1,102 @@
+"""
+만료(stale) 캐시 백그라운드 재검증 모듈
+
+stale-while-revalidate 정책에서 만료된 캐시 항목은 즉시 반환하고,
+재검증(실시간 API 호출)은 크기가 제한된 작업자 풀에서 백그라운드로 처리합니다.
+같은 항목의 재검증은 진행 중인 것이 있으면 다시 예약하지 않으며,
+대기 작업이 너무 많으면 새 요청은 버립니다 (다음 조회 때 다시 예약됨).
+"""
+import os
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable
+
+# 만료 후에도 stale 상태로 반환할 수 있는 기간 (이 기간이 지나면 캐시 미스)
+CACHE_STALE_MAX_DAYS = float(os.getenv("CACHE_STALE_MAX_DAYS", "30"))
+STALE_REVALIDATE_WORKERS = int(os.getenv("STALE_REVALIDATE_WORKERS", "2"))  # 동시 재검증 수
+STALE_REVALIDATE_MAX_PENDING = int(os.getenv("STALE_REVALIDATE_MAX_PENDING", "500"))  # 최대 대기 작업 수
+
+
+class StaleRevalidator:
+    """동시 실행 수와 대기 작업 수가 제한된 백그라운드 재검증 실행기"""
+
+    def __init__(self, max_workers: int = STALE_REVALIDATE_WORKERS,
+                 max_pending: int = STALE_REVALIDATE_MAX_PENDING):
+        self.max_workers = max(1, int(max_workers))
+        self.max_pending = max(1, int(max_pending))
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending: set = set()
+        self.stats = {"scheduled": 0, "completed": 0, "failed": 0, "dropped": 0, "duplicate": 0}
+
+    def submit(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> bool:
+        """
+        재검증 작업을 예약합니다.
+
+        Returns:
+            예약 여부 (이미 진행 중이거나 대기 작업이 가득 차면 False)
+        """
+        with self._lock:
+            if key in self._pending:
+                self.stats["duplicate"] += 1
+                return False
+            if len(self._pending) >= self.max_pending:
+                self.stats["dropped"] += 1
+                return False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="cache-revalidate"
+                )
+            self._pending.add(key)
+            self.stats["scheduled"] += 1
+
+        try:
+            self._executor.submit(self._run, key, func, args, kwargs)
+        except RuntimeError:
+            # 종료 중인 실행기
+            with self._lock:
+                self._pending.discard(key)
+                self.stats["dropped"] += 1
+            return False
+        return True
+
+    def _run(self, key: Hashable, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]):
+        """작업 실행 (예외는 로그만 남김)"""
+        try:
+            func(*args, **kwargs)
+            with self._lock:
+                self.stats["completed"] += 1
+        except Exception as e:
+            print(f"[Warning] 백그라운드 재검증 실패 ({key}): {e}")
+            traceback.print_exc()
+            with self._lock:
+                self.stats["failed"] += 1
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def pending_count(self) -> int:
+        """진행 중이거나 대기 중인 재검증 수"""
+        with self._lock:
+            return len(self._pending)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """재검증 통계 반환"""
+        with self._lock:
+            return dict(self.stats, pending=len(self._pending), max_workers=self.max_workers)
+
+    def shutdown(self, wait: bool = False):
+        """작업자 풀 종료"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# 전역 재검증 실행기 인스턴스
+_stale_revalidator = StaleRevalidator()
+
+def get_stale_revalidator() -> StaleRevalidator:
+    """전역 백그라운드 재검증 실행기 반환"""
+    return _stale_revalidator
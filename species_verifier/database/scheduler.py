@@ -5,39 +5,53 @@
 1. 월간 정기 캐시 새로고침 (WoRMS, LPSN, COL)
 2. 실시간 검증 결과와 캐시 비교 업데이트
 3. 데이터베이스별 맞춤 업데이트 전략
+4. 만료(stale) 캐시 백그라운드 재검증 (stale-while-revalidate)
 """
 import time
 import asyncio
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Callable
-from .cache_manager import get_cache_manager
-from .secure_mode import get_secure_database_manager
+from .secure_mode import SecureDatabaseManager, get_secure_database_manager
+from .revalidator import get_stale_revalidator
 
 class CacheUpdateScheduler:
     """캐시 업데이트 스케줄링 및 실시간 검증 관리자"""
     
-    def __init__(self):
-        self.cache_manager = get_cache_manager()
-        self.secure_db = get_secure_database_manager()
+    def __init__(self, secure_db: Optional[SecureDatabaseManager] = None):
+        """
+        초기화 함수
         
-        # 데이터베이스별 업데이트 전략
+        Args:
+            secure_db: 관리할 로컬 캐시 매니저 (기본값: 전역 인스턴스). 이 매니저에 stale 재검증 훅을 등록
+        """
+        # Supabase 설정이 없는 LOCAL 모드에서도 스케줄러는 동작해야 함
+        try:
+            from .cache_manager import get_cache_manager
+            self.cache_manager = get_cache_manager()
+        except Exception as e:
+            print(f"[Warning] 클라우드 캐시 매니저 사용 불가, 로컬 캐시만 관리: {e}")
+            self.cache_manager = None
+        self.secure_db = secure_db or get_secure_database_manager()
+        
+        # 만료된 로컬 캐시는 즉시 반환하고 백그라운드에서 재검증
+        self.revalidator = get_stale_revalidator()
+        self.secure_db.set_stale_handler(self.schedule_revalidation)
+        
+        # 데이터베이스별 업데이트 전략 (API 호출 간격은 core.rate_limiter의 업스트림별 속도 제한이 담당)
         self.update_strategies = {
             'worms': {
                 'schedule': 'monthly',  # 월간 업데이트
                 'priority_fields': ['status', 'valid_name', 'classification'],
-                'api_delay': 1.5,  # API 호출 간격 (초)
                 'batch_size': 50   # 배치 크기
             },
             'lpsn': {
                 'schedule': 'monthly',  # 월간 업데이트  
                 'priority_fields': ['status', 'valid_name', 'taxonomy'],
-                'api_delay': 2.0,  # LPSN은 더 안전하게
                 'batch_size': 30
             },
             'col': {
                 'schedule': 'monthly',  # 월간 업데이트
                 'priority_fields': ['status', 'accepted_name', 'rank'],
-                'api_delay': 1.0,
                 'batch_size': 100
             }
         }
@@ -112,6 +126,70 @@ class CacheUpdateScheduler:
                 return {"status": "error_cache_fallback", "data": cached_data}
             return {"status": "error", "data": None}
     
+    def schedule_revalidation(self, scientific_name: str, source_db: str,
+                              stale_data: Dict[str, Any]) -> bool:
+        """
+        만료(stale) 캐시 항목의 백그라운드 재검증을 예약합니다 (SecureDatabaseManager 훅).
+        
+        Returns:
+            해당 소스를 재검증할 수 있는지 여부 (False면 호출 측에서 캐시 미스로 처리)
+        """
+        api_func = self._get_revalidation_function(source_db)
+        if not api_func:
+            return False
+        
+        # 이미 진행 중이거나 대기 작업이 가득 찬 경우에도 stale 데이터는 반환 (다음 조회 때 다시 예약)
+        self.revalidator.submit(
+            (self.secure_db.local_db_path, source_db, scientific_name), self._revalidate_stale_entry,
+            scientific_name, source_db, stale_data, api_func
+        )
+        return True
+    
+    def _revalidate_stale_entry(self, scientific_name: str, source_db: str,
+                                stale_data: Dict[str, Any], api_call_func: Callable):
+        """stale 항목 재검증 후 변경 사항 기록 및 캐시 갱신 (백그라운드 작업자에서 실행)"""
+        from ..core.memory_cache import is_cacheable_result
+        
+        fresh_data = api_call_func(scientific_name)
+        if not is_cacheable_result(fresh_data):
+            print(f"[Warning] 재검증 실패, stale 캐시 유지: {scientific_name} ({source_db})")
+            return
+        
+        comparison_result = self._compare_data(stale_data, fresh_data, source_db)
+        if comparison_result['has_changes']:
+            print(f"[Info] 재검증 중 데이터 변경 감지: {scientific_name}")
+            self._log_data_changes(
+                scientific_name, source_db,
+                comparison_result['changed_fields'],
+                stale_data, fresh_data
+            )
+        
+        self.secure_db.set_cache(scientific_name, source_db, fresh_data, 'stale_revalidate')
+    
+    def _get_revalidation_function(self, source_db: str) -> Optional[Callable]:
+        """
+        stale 재검증에 사용할 함수 반환
+        
+        앱 배치 캐시('marine'/'microbe'/'col')는 저장할 때와 같은 검증 파이프라인 처리 함수로
+        다시 검증하여 같은 형식의 결과로 덮어씁니다.
+        """
+        try:
+            from ..core.pipeline import DEFAULT_HANDLERS
+        except ImportError as e:
+            print(f"[Warning] 재검증 함수 임포트 실패: {e}")
+            return None
+        
+        if source_db in DEFAULT_HANDLERS:
+            handler = DEFAULT_HANDLERS[source_db]['handler']
+            
+            def revalidate(scientific_name: str) -> Optional[Dict[str, Any]]:
+                results = handler([scientific_name], lambda result, *args: None, None)
+                return results[0] if results else None
+            
+            return revalidate
+        
+        return self._get_api_function(source_db)
+    
     def _compare_data(self, cached_data: Dict[str, Any], fresh_data: Dict[str, Any],
                       source_db: str) -> Dict[str, Any]:
         """캐시 데이터와 실시간 데이터 비교"""
@@ -243,11 +321,6 @@ class CacheUpdateScheduler:
                         print(f"[Warning] {source_db} API 함수를 찾을 수 없음")
                         skipped_count += 1
                     
-                    # API 호출 간격 (서버 부담 방지)
-                    strategy = self.update_strategies.get(source_db, {})
-                    delay = strategy.get('api_delay', 1.5)
-                    time.sleep(delay)
-                    
                 except Exception as item_error:
                     print(f"[Warning] {scientific_name} 업데이트 실패: {item_error}")
                     skipped_count += 1
@@ -312,9 +385,12 @@ class CacheUpdateScheduler:
         
         return next_update.strftime('%Y-%m-%d')
 
-# 전역 스케줄러 인스턴스
-cache_scheduler = CacheUpdateScheduler()
+# 전역 스케줄러 인스턴스 (처음 사용할 때 생성)
+cache_scheduler = None
 
 def get_cache_scheduler() -> CacheUpdateScheduler:
     """캐시 업데이트 스케줄러 인스턴스 반환"""
+    global cache_scheduler
+    if cache_scheduler is None:
+        cache_scheduler = CacheUpdateScheduler()
     return cache_scheduler 
\ No newline at end of file
@@ -136,4 +136,45 @@ ALTER TABLE col_species_cache ENABLE ROW LEVEL SECURITY;
 -- 모든 사용자가 읽고 쓸 수 있도록 설정 (간단한 예시)
 CREATE POLICY "Public Access" ON marine_species_cache FOR ALL USING (true);
 CREATE POLICY "Public Access" ON microbe_species_cache FOR ALL USING (true);
-CREATE POLICY "Public Access" ON col_species_cache FOR ALL USING (true); 
\ No newline at end of file
+CREATE POLICY "Public Access" ON col_species_cache FOR ALL USING (true); 
+
+-- 집계 통계 (대시보드가 원본 행을 내려받지 않고 상수 크기 결과만 조회)
+
+-- 뷰: 캐시 테이블별 요약 (HybridCacheManager.get_cache_statistics)
+CREATE OR REPLACE VIEW species_cache_table_stats AS
+SELECT 'marine' as source_type, COUNT(*) as total_cached,
+    COUNT(*) FILTER (WHERE last_verified_at >= NOW() - INTERVAL '30 days') as recent_30days,
+    COUNT(*) FILTER (WHERE is_verified) as verified_count
+FROM marine_species_cache
+UNION ALL
+SELECT 'microbe' as source_type, COUNT(*) as total_cached,
+    COUNT(*) FILTER (WHERE last_verified_at >= NOW() - INTERVAL '30 days') as recent_30days,
+    COUNT(*) FILTER (WHERE is_verified) as verified_count
+FROM microbe_species_cache
+UNION ALL
+SELECT 'col' as source_type, COUNT(*) as total_cached,
+    COUNT(*) FILTER (WHERE last_verified_at >= NOW() - INTERVAL '30 days') as recent_30days,
+    COUNT(*) FILTER (WHERE is_verified) as verified_count
+FROM col_species_cache;
+
+-- RPC: 기간별 캐시 액세스 통계 (SpeciesCacheManager.get_cache_stats)
+-- cache_access_log 테이블은 📋_Supabase_DB_구성_가이드.md 참고
+CREATE INDEX IF NOT EXISTS idx_cache_access_log_stats
+    ON cache_access_log(accessed_at, source_db, access_type, response_time_ms);
+
+CREATE OR REPLACE FUNCTION get_cache_access_stats(since TIMESTAMPTZ)
+RETURNS TABLE (
+    source_db VARCHAR,
+    total_queries BIGINT,
+    cache_hits BIGINT,
+    response_time_sum BIGINT
+)
+LANGUAGE sql STABLE AS $$
+    SELECT source_db,
+        COUNT(*) as total_queries,
+        COUNT(*) FILTER (WHERE access_type IN ('hit', 'stale_hit')) as cache_hits,
+        COALESCE(SUM(response_time_ms), 0) as response_time_sum
+    FROM cache_access_log
+    WHERE accessed_at >= since
+    GROUP BY source_db;
+$$;
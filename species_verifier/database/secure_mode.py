@@ -9,14 +9,133 @@
 import os
 import json
 import sqlite3
-import hashlib
+import atexit
+import threading
+import time
+import zlib
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Literal
+from typing import Dict, Any, Optional, List, Literal, Callable
 from pathlib import Path
 
+from .revalidator import CACHE_STALE_MAX_DAYS
+from ..utils.text_processor import normalize_lookup_key
+
 # 운영 모드 정의
 DatabaseMode = Literal["local", "hybrid", "cloud"]
 
+# 로컬 SQLite 연결 설정 (스레드별 장기 연결 + WAL)
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(64 * 1024 * 1024)))  # 메모리 맵 크기 (바이트)
+SQLITE_BUSY_TIMEOUT = float(os.getenv("SQLITE_BUSY_TIMEOUT", "10"))  # 잠금 대기 시간 (초)
+SQLITE_CACHED_STATEMENTS = 128  # 연결별 컴파일된 SQL 문 캐시 크기
+SQLITE_IN_CHUNK_SIZE = 500  # 일괄 조회 시 IN 절 하나에 넣을 최대 이름 수 (SQLite 변수 개수 제한 대비)
+HIT_FLUSH_INTERVAL = float(os.getenv("CACHE_HIT_FLUSH_INTERVAL", "30"))  # 히트 카운트 일괄 반영 주기 (초)
+HIT_FLUSH_THRESHOLD = int(os.getenv("CACHE_HIT_FLUSH_THRESHOLD", "500"))  # 이 개수 이상 쌓이면 주기 전에 반영
+
+# 로컬 캐시 크기 제한 (초과 시 백그라운드에서 LFU + 에이징 순으로 제거)
+CACHE_MAX_ROWS = int(os.getenv("CACHE_MAX_ROWS", "200000"))  # 최대 캐시 항목 수
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(512 * 1024 * 1024)))  # 최대 DB 크기 (바이트)
+CACHE_EVICTION_TARGET_RATIO = 0.9  # 제거 시 한도의 90%까지 줄임 (잦은 재실행 방지)
+CACHE_EVICTION_HALF_LIFE_DAYS = float(os.getenv("CACHE_EVICTION_HALF_LIFE_DAYS", "30"))  # 히트 수 에이징 기준 기간
+CACHE_EVICTION_BATCH = 1000  # 트랜잭션당 제거할 행 수
+CACHE_EVICTION_CHECK_WRITES = 1000  # 이 횟수만큼 저장되면 주기 전에 크기 확인
+CACHE_EVICTION_CHECK_INTERVAL = 300  # 크기 확인 최소 간격 (초)
+CACHE_INCREMENTAL_VACUUM_PAGES = 2000  # 한 번에 파일에서 반환할 빈 페이지 수
+CACHE_VACUUM_IDLE_SECONDS = float(os.getenv("CACHE_VACUUM_IDLE_SECONDS", "300"))  # 기존 DB 증분 VACUUM 전환 전 필요한 무저장 시간 (초)
+CACHE_CLEANUP_BATCH = 1000  # 만료 캐시 정리 시 트랜잭션당 삭제할 행 수
+CACHE_CLEANUP_INTERVAL = float(os.getenv("CACHE_CLEANUP_INTERVAL", "3600"))  # 백그라운드 만료 캐시 정리 주기 (초)
+CACHE_TTL_DAYS = 30  # 로컬 캐시 유지 기간 (일)
+NEGATIVE_CACHE_TTL_HOURS = float(os.getenv("NEGATIVE_CACHE_TTL_HOURS", "24"))  # 찾지 못함/잘못된 입력 결과 유지 시간
+CACHE_PAYLOAD_ZLIB_LEVEL = 6  # 캐시 데이터 압축 수준 (1: 빠름 ~ 9: 작음)
+CACHE_PAYLOAD_MIGRATE_BATCH = 500  # 기존 JSON 텍스트 행을 압축 형식으로 옮길 때 트랜잭션당 행 수
+
+# 캐시 데이터 저장 형식 (payload_format 컬럼)
+PAYLOAD_FORMAT_JSON = "json"  # 기존 형식: JSON 텍스트
+PAYLOAD_FORMAT_ZLIB = "json+zlib"  # 압축 JSON BLOB
+
+# 자주 쓰는 SQL 문 (문자열이 같아야 연결별 문 캐시가 재사용됨)
+# 조회 키는 normalized_name (공백 정리 + 대소문자 무시), scientific_name은 처음 저장된 표기를 유지
+SELECT_LOCAL_CACHE_SQL = """
+    SELECT * FROM local_species_cache 
+    WHERE normalized_name = ? AND source_db = ?
+"""
+UPSERT_LOCAL_CACHE_SQL = """
+    INSERT INTO local_species_cache 
+    (scientific_name, normalized_name, source_db, cache_data, payload_format, is_negative, created_at, updated_at, 
+     expires_at, hit_count, data_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+    ON CONFLICT(normalized_name, source_db) DO UPDATE SET
+        cache_data = excluded.cache_data,
+        payload_format = excluded.payload_format,
+        is_negative = excluded.is_negative,
+        updated_at = excluded.updated_at,
+        expires_at = excluded.expires_at,
+        data_hash = excluded.data_hash
+"""
+# 제거 우선순위: 마지막 접근 이후 경과 기간으로 감쇠한 히트 수가 낮은 항목부터 (LFU + 에이징)
+EVICT_LOCAL_CACHE_SQL = """
+    DELETE FROM local_species_cache WHERE id IN (
+        SELECT id FROM local_species_cache
+        ORDER BY hit_count / (1.0 + MAX(julianday('now', 'localtime') - julianday(COALESCE(last_accessed, updated_at)), 0) / ?) ASC,
+                 COALESCE(last_accessed, updated_at) ASC
+        LIMIT ?
+    )
+"""
+# 만료 캐시 정리: stale 허용 기간이 지난 항목과 만료된 네거티브 캐시를 묶음 단위로 삭제 (만료 시각 인덱스 사용)
+CLEANUP_EXPIRED_CACHE_SQL = """
+    DELETE FROM local_species_cache WHERE id IN (
+        SELECT id FROM local_species_cache
+        WHERE expires_at < ? AND (is_negative = 1 OR expires_at < ?)
+        LIMIT ?
+    )
+"""
+FLUSH_HIT_COUNT_SQL = """
+    UPDATE local_species_cache 
+    SET hit_count = hit_count + ?, last_accessed = MAX(COALESCE(last_accessed, ''), ?)
+    WHERE normalized_name = ? AND source_db = ?
+"""
+
+
+def _encode_payload(data: Any) -> tuple:
+    """
+    캐시 데이터를 저장 형식으로 변환합니다.
+    
+    Returns:
+        (압축 JSON BLOB, 저장 형식, 변경 감지용 해시)
+    """
+    raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    data_hash = format(zlib.crc32(raw), "08x")  # 변경 감지용 (암호학적 해시 불필요)
+    return sqlite3.Binary(zlib.compress(raw, CACHE_PAYLOAD_ZLIB_LEVEL)), PAYLOAD_FORMAT_ZLIB, data_hash
+
+
+def _decode_payload(cache_data: Any, payload_format: Optional[str]) -> Any:
+    """저장된 캐시 데이터를 복원합니다 (기존 JSON 텍스트 행도 지원)"""
+    if payload_format == PAYLOAD_FORMAT_ZLIB:
+        return json.loads(zlib.decompress(cache_data).decode("utf-8"))
+    if isinstance(cache_data, bytes):
+        cache_data = cache_data.decode("utf-8")
+    return json.loads(cache_data)
+
+
+def _is_negative_payload(data: Any) -> bool:
+    """찾지 못함/잘못된 입력 결과인지 확인 (네거티브 캐시 대상)"""
+    from ..core.memory_cache import is_negative_result
+    return is_negative_result(data)
+
+
+def _mark_stale(data: Any) -> Any:
+    """만료(stale) 상태로 반환하는 캐시 데이터 표시 (원본은 변경하지 않음)"""
+    if isinstance(data, dict):
+        data = dict(data)
+        data['cache_stale'] = True
+    return data
+
+
+def _cache_expires_at(negative: bool) -> str:
+    """캐시 만료 시각 계산 (네거티브 캐시는 더 짧게 유지)"""
+    ttl = timedelta(hours=NEGATIVE_CACHE_TTL_HOURS) if negative else timedelta(days=CACHE_TTL_DAYS)
+    return (datetime.now() + ttl).isoformat()
+
+
 class SecureDatabaseManager:
     """보안을 고려한 로컬/하이브리드 데이터베이스 관리자"""
     
@@ -24,9 +143,41 @@ class SecureDatabaseManager:
         self.mode = mode
         self.local_db_path = local_db_path or self._get_default_db_path()
         
+        # 스레드별 장기 연결 (연결 생성 비용 제거)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        
+        # 히트 카운트/최근 접근 시각 지연 기록 (읽기 경로에서 쓰기 없음)
+        self._pending_hits: Dict[tuple, List] = {}  # (정규화 학명, 소스) → [증가분, 최근 접근 시각]
+        self._negative_hits = 0  # 네거티브 캐시 적중 수 (프로세스 시작 이후)
+        self._stale_hits = 0  # 만료(stale) 캐시 반환 수 (프로세스 시작 이후)
+        
+        self._hits_lock = threading.Lock()
+        
+        # 백그라운드 유지보수 스레드 (히트 카운트 반영 + 크기 제한 초과 시 제거)
+        self._maintenance_event = threading.Event()
+        self._maintenance_thread = None
+        self._stop_event = threading.Event()  # close() 시 백그라운드 작업 중지
+        self._writes_since_eviction_check = 1  # 시작 후 첫 주기에 한 번 크기 확인
+        self._last_eviction_check = 0.0
+        self._evicted_total = 0
+        self._last_cleanup_run = time.monotonic()  # 시작 후 CACHE_CLEANUP_INTERVAL이 지나면 첫 정리
+        self._last_cleanup: Dict[str, Any] = {}
+        self._last_write_time = time.monotonic()  # 마지막 캐시 저장 시각 (증분 VACUUM 전환 시점 판단)
+        self._vacuum_conversion_pending = False  # auto_vacuum이 꺼진 기존 DB (유지보수 스레드가 한가할 때 전환)
+        atexit.register(self.flush_hit_counts)
+        
+        # stale-while-revalidate: 만료 항목 재검증 훅 (CacheUpdateScheduler가 등록)
+        self._stale_handler: Optional[Callable[[str, str, Dict[str, Any]], bool]] = None
+        self._stale_handler_loaded = False
+        
         # 로컬 SQLite 데이터베이스 초기화
         self._init_local_database()
         
+        # 기존 JSON 텍스트 행을 압축 형식으로 백그라운드 변환
+        self._start_payload_migration()
+        
         # 외부 연결 설정 (모드에 따라)
         self.supabase_client = None
         if mode in ["hybrid", "cloud"]:
@@ -47,27 +198,95 @@ class SecureDatabaseManager:
         db_dir.mkdir(parents=True, exist_ok=True)
         return str(db_dir / "species_cache.db")
     
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        현재 스레드의 로컬 SQLite 연결 반환 (없으면 생성)
+        
+        WAL 모드와 synchronous=NORMAL로 읽기와 쓰기가 서로 막지 않고 커밋마다 fsync하지 않으며,
+        mmap과 연결별 SQL 문 캐시로 조회 비용을 줄입니다.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        
+        conn = sqlite3.connect(
+            self.local_db_path,
+            timeout=SQLITE_BUSY_TIMEOUT,
+            cached_statements=SQLITE_CACHED_STATEMENTS,
+            check_same_thread=False  # close()에서 다른 스레드가 닫을 수 있도록 허용
+        )
+        conn.row_factory = sqlite3.Row
+        # 새 DB는 증분 VACUUM 사용 (첫 테이블 생성 전에만 적용됨, 기존 DB는 enable_incremental_vacuum에서 전환)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={int(SQLITE_MMAP_SIZE)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA busy_timeout={int(SQLITE_BUSY_TIMEOUT * 1000)}")
+        
+        self._local.conn = conn
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+    
+    def close(self):
+        """대기 중인 히트 카운트를 반영하고 모든 스레드의 로컬 SQLite 연결 종료"""
+        self._stop_event.set()
+        self._maintenance_event.set()
+        if self._maintenance_thread is not None:
+            self._maintenance_thread.join(timeout=5)
+            self._maintenance_thread = None
+        self.flush_hit_counts()
+        
+        with self._connections_lock:
+            connections = list(self._connections)
+            self._connections.clear()
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                print(f"[Warning] 로컬 DB 연결 종료 실패: {e}")
+        # 다음 사용 시 새 연결 생성
+        self._local = threading.local()
+    
     def _init_local_database(self):
         """로컬 SQLite 데이터베이스 초기화"""
         try:
-            with sqlite3.connect(self.local_db_path) as conn:
+            with self._get_connection() as conn:
                 # 로컬 캐시 테이블 생성
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS local_species_cache (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         scientific_name TEXT NOT NULL,
+                        normalized_name TEXT,  -- 조회 키 (공백 정리 + 대소문자 무시)
                         source_db TEXT NOT NULL,
-                        cache_data TEXT NOT NULL,  -- JSON 데이터
+                        cache_data BLOB NOT NULL,  -- 압축 JSON (payload_format 참고)
+                        payload_format TEXT DEFAULT 'json',  -- 'json' (기존 텍스트) / 'json+zlib'
+                        is_negative INTEGER DEFAULT 0,  -- 찾지 못함/잘못된 입력 결과 (짧은 TTL)
                         created_at TEXT NOT NULL,
                         updated_at TEXT NOT NULL,
                         expires_at TEXT NOT NULL,
                         hit_count INTEGER DEFAULT 0,
                         last_accessed TEXT,
-                        data_hash TEXT,  -- 데이터 무결성 확인용
+                        data_hash TEXT,  -- 데이터 변경 감지용
                         UNIQUE(scientific_name, source_db)
                     )
                 """)
                 
+                # 기존 DB 마이그레이션: 저장 형식 컬럼 추가 (기존 행은 'json'으로 읽음)
+                columns = {row['name'] for row in conn.execute("PRAGMA table_info(local_species_cache)")}
+                if 'payload_format' not in columns:
+                    conn.execute("ALTER TABLE local_species_cache ADD COLUMN payload_format TEXT DEFAULT 'json'")
+                    print("[Info] 로컬 캐시 테이블에 payload_format 컬럼 추가")
+                if 'is_negative' not in columns:
+                    conn.execute("ALTER TABLE local_species_cache ADD COLUMN is_negative INTEGER DEFAULT 0")
+                    print("[Info] 로컬 캐시 테이블에 is_negative 컬럼 추가")
+                if 'normalized_name' not in columns:
+                    conn.execute("ALTER TABLE local_species_cache ADD COLUMN normalized_name TEXT")
+                    print("[Info] 로컬 캐시 테이블에 normalized_name 컬럼 추가")
+                
+                self._migrate_lookup_keys(conn)
+                
                 # 로컬 세션 테이블
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS local_verification_sessions (
@@ -99,21 +318,245 @@ class SecureDatabaseManager:
                 """)
                 
                 conn.commit()
+                
+                # 기존 DB는 모드만 확인 (전체 VACUUM은 유지보수 스레드가 한가할 때 수행, 검증 작업을 멈추지 않음)
+                if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0:
+                    self._vacuum_conversion_pending = True
+                    self._ensure_maintenance_thread()
                 print(f"[Info] 로컬 데이터베이스 초기화 완료: {self.local_db_path}")
                 
         except Exception as e:
             print(f"[Error] 로컬 데이터베이스 초기화 실패: {e}")
             raise
     
+    def _migrate_lookup_keys(self, conn: sqlite3.Connection):
+        """
+        정규화 조회 키 채우기, 인덱스 및 항목 수 카운터 생성 (기존 DB는 한 번만 수행)
+        
+        - normalized_name이 비어 있는 행을 채우고, 같은 키로 겹치는 행은 가장 최근 항목만 남김
+        - (normalized_name, source_db) 고유 인덱스: 단건/일괄 조회와 UPSERT 충돌 대상
+        - 만료 시각 / 네거티브 / 인기 종 인덱스: 통계 쿼리가 전체 테이블을 읽지 않도록 함
+        - 항목 수 카운터(트리거 유지): 전체/소스별 항목 수를 COUNT(*) 없이 조회
+        """
+        conn.create_function("normalize_lookup_key", 1, normalize_lookup_key, deterministic=True)
+        backfilled = conn.execute("""
+            UPDATE local_species_cache SET normalized_name = normalize_lookup_key(scientific_name)
+            WHERE normalized_name IS NULL
+        """).rowcount
+        
+        has_unique_key = conn.execute("""
+            SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_local_cache_lookup'
+        """).fetchone()
+        if not has_unique_key:
+            merged = conn.execute("""
+                DELETE FROM local_species_cache WHERE id IN (
+                    SELECT id FROM (
+                        SELECT id, ROW_NUMBER() OVER (
+                            PARTITION BY normalized_name, source_db ORDER BY updated_at DESC, id DESC
+                        ) AS rank_in_key
+                        FROM local_species_cache
+                    ) WHERE rank_in_key > 1
+                )
+            """).rowcount
+            if merged:
+                print(f"[Info] 표기만 다른 중복 캐시 {merged}개 정리 (최근 항목 유지)")
+        
+        conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_local_cache_lookup
+            ON local_species_cache(normalized_name, source_db)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_local_cache_expires
+            ON local_species_cache(expires_at)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_local_cache_negative
+            ON local_species_cache(is_negative, expires_at)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_local_cache_popular
+            ON local_species_cache(is_negative, hit_count DESC, scientific_name, source_db)
+        """)
+        
+        # 소스별 집계 뷰는 통계 조회마다 전체 행을 묶어 세므로 소스별 카운터로 대체
+        conn.execute("DROP VIEW IF EXISTS local_cache_source_stats")
+        conn.execute("DROP INDEX IF EXISTS idx_local_cache_source_stats")
+        
+        # 항목 수 카운터
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS local_cache_counters (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_local_cache_count_insert
+            AFTER INSERT ON local_species_cache BEGIN
+                UPDATE local_cache_counters SET value = value + 1 WHERE name = 'rows';
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_local_cache_count_delete
+            AFTER DELETE ON local_species_cache BEGIN
+                UPDATE local_cache_counters SET value = value - 1 WHERE name = 'rows';
+            END
+        """)
+        conn.execute("""
+            INSERT OR IGNORE INTO local_cache_counters (name, value)
+            SELECT 'rows', COUNT(*) FROM local_species_cache
+        """)
+        
+        # 소스별 항목 수 카운터 ('rows:<source_db>', 처음 보는 소스는 트리거가 0부터 생성)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_local_cache_source_count_insert
+            AFTER INSERT ON local_species_cache BEGIN
+                INSERT OR IGNORE INTO local_cache_counters (name, value) VALUES ('rows:' || NEW.source_db, 0);
+                UPDATE local_cache_counters SET value = value + 1 WHERE name = 'rows:' || NEW.source_db;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS trg_local_cache_source_count_delete
+            AFTER DELETE ON local_species_cache BEGIN
+                UPDATE local_cache_counters SET value = value - 1 WHERE name = 'rows:' || OLD.source_db;
+            END
+        """)
+        conn.execute("""
+            INSERT OR IGNORE INTO local_cache_counters (name, value)
+            SELECT 'rows:' || source_db, COUNT(*) FROM local_species_cache GROUP BY source_db
+        """)
+        
+        if backfilled:
+            print(f"[Info] 기존 캐시 {backfilled}개에 정규화 조회 키 추가")
+    
+    def enable_incremental_vacuum(self) -> bool:
+        """
+        auto_vacuum이 꺼진 기존 DB를 증분 VACUUM 모드로 한 번 전환합니다.
+        
+        auto_vacuum 모드는 VACUUM으로 DB를 다시 써야 바뀌므로 처음 한 번만 전체 VACUUM을 수행하며,
+        이후 제거/정리 때는 증분 VACUUM으로 빈 페이지를 조금씩 반환합니다.
+        전체 VACUUM 동안 캐시 저장이 대기하므로 보통 유지보수 스레드가 CACHE_VACUUM_IDLE_SECONDS 동안
+        저장이 없을 때 호출합니다.
+        
+        Returns:
+            증분 VACUUM 모드 여부 (전환 실패 시 False)
+        """
+        try:
+            conn = self._get_connection()
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0:
+                start_time = time.monotonic()
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()  # VACUUM으로 커진 WAL 파일 정리
+                print(f"[Info] 기존 로컬 캐시 DB를 증분 VACUUM 모드로 전환 "
+                      f"({time.monotonic() - start_time:.1f}초)")
+            self._vacuum_conversion_pending = False
+            return True
+        except Exception as e:
+            # 전환하지 못해도 빈 페이지는 새 항목 저장에 재사용됨 (다음 한가한 주기에 다시 시도)
+            print(f"[Warning] 증분 VACUUM 모드 전환 실패: {e}")
+            return False
+    
+    def _is_vacuum_conversion_due(self) -> bool:
+        """증분 VACUUM 전환이 필요하고 CACHE_VACUUM_IDLE_SECONDS 동안 캐시 저장이 없었는지 확인"""
+        return (self._vacuum_conversion_pending
+                and time.monotonic() - self._last_write_time >= CACHE_VACUUM_IDLE_SECONDS)
+    
+    def _count_cache_rows(self, conn: sqlite3.Connection) -> int:
+        """전체 캐시 항목 수 (트리거로 유지되는 카운터 사용)"""
+        row = conn.execute("SELECT value FROM local_cache_counters WHERE name = 'rows'").fetchone()
+        if row is None:
+            return conn.execute("SELECT COUNT(*) FROM local_species_cache").fetchone()[0]
+        return row[0]
+    
+    def _start_payload_migration(self):
+        """압축되지 않은 기존 캐시 행이 있으면 백그라운드 변환 스레드 시작"""
+        try:
+            legacy = self._get_connection().execute(
+                "SELECT 1 FROM local_species_cache WHERE payload_format IS NOT ? LIMIT 1",
+                (PAYLOAD_FORMAT_ZLIB,)
+            ).fetchone()
+        except Exception as e:
+            print(f"[Warning] 캐시 저장 형식 확인 실패: {e}")
+            return
+        if legacy:
+            threading.Thread(
+                target=self.migrate_cache_payloads, name="cache-payload-migrate", daemon=True
+            ).start()
+    
+    def migrate_cache_payloads(self, batch_size: int = CACHE_PAYLOAD_MIGRATE_BATCH) -> int:
+        """
+        기존 JSON 텍스트 캐시 행을 압축 형식으로 변환합니다.
+        
+        짧은 트랜잭션 단위로 처리하므로 변환 중에도 조회/저장이 가능하며,
+        변환 전 행도 그대로 읽을 수 있습니다 (payload_format 기준으로 복원).
+        
+        Args:
+            batch_size: 트랜잭션당 변환할 행 수
+            
+        Returns:
+            변환된 행 수
+        """
+        converted = 0
+        last_id = 0
+        try:
+            conn = self._get_connection()
+            while not self._stop_event.is_set():
+                rows = conn.execute("""
+                    SELECT id, cache_data, payload_format FROM local_species_cache
+                    WHERE payload_format IS NOT ? AND id > ?
+                    ORDER BY id LIMIT ?
+                """, (PAYLOAD_FORMAT_ZLIB, last_id, batch_size)).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1]['id']
+                
+                params = []
+                for row in rows:
+                    try:
+                        data = _decode_payload(row['cache_data'], row['payload_format'])
+                    except (TypeError, ValueError, zlib.error):
+                        continue  # 손상된 항목은 그대로 둠 (조회 시 미스로 처리)
+                    payload, payload_format, data_hash = _encode_payload(data)
+                    params.append((payload, payload_format, data_hash, row['id'], PAYLOAD_FORMAT_ZLIB))
+                
+                with conn:
+                    # 변환 도중 새로 저장된 행은 덮어쓰지 않음
+                    conn.executemany("""
+                        UPDATE local_species_cache
+                        SET cache_data = ?, payload_format = ?, data_hash = ?
+                        WHERE id = ? AND payload_format IS NOT ?
+                    """, params)
+                converted += len(params)
+        except Exception as e:
+            print(f"[Warning] 캐시 저장 형식 변환 중단 ({converted}개 완료): {e}")
+            return converted
+        
+        if converted:
+            print(f"[Info] 기존 캐시 {converted}개를 압축 형식으로 변환 완료 (공간 회수는 VACUUM 필요)")
+        return converted
+    
     def get_cache(self, scientific_name: str, source_db: str) -> Optional[Dict[str, Any]]:
         """보안 모드에 따른 캐시 조회"""
         # 1. 항상 로컬 캐시부터 확인
         local_data = self._get_local_cache(scientific_name, source_db)
         
         if local_data and not self._is_cache_expired(local_data):
-            self._update_hit_count(scientific_name, source_db)
-            print(f"[Info] 로컬 캐시 히트: {scientific_name} ({source_db})")
-            return json.loads(local_data['cache_data'])
+            negative = bool(local_data.get('is_negative'))
+            self._record_hit(scientific_name, source_db, datetime.now().isoformat(), negative)
+            tier = "네거티브 캐시" if negative else "캐시"
+            print(f"[Info] 로컬 {tier} 히트: {scientific_name} ({source_db})")
+            return _decode_payload(local_data['cache_data'], local_data.get('payload_format'))
+        
+        # 1-1. 만료됐지만 stale 허용 기간 이내면 즉시 반환하고 백그라운드에서 재검증
+        if local_data and not local_data.get('is_negative') and self._is_within_stale_window(local_data):
+            try:
+                stale_data = _decode_payload(local_data['cache_data'], local_data.get('payload_format'))
+            except (TypeError, ValueError, zlib.error):
+                stale_data = None
+            if stale_data is not None and self._schedule_revalidation(scientific_name, source_db, stale_data):
+                self._record_hit(scientific_name, source_db, datetime.now().isoformat(), stale=True)
+                print(f"[Info] 로컬 캐시 stale 히트 (백그라운드 재검증): {scientific_name} ({source_db})")
+                return _mark_stale(stale_data)
         
         # 2. 하이브리드/클라우드 모드에서만 외부 조회
         if self.mode in ["hybrid", "cloud"] and self.supabase_client:
@@ -138,8 +581,8 @@ class SecureDatabaseManager:
         # 1. 항상 로컬에 저장 (오프라인 대응)
         local_success = self._set_local_cache(scientific_name, source_db, data, update_reason)
         
-        # 2. 클라우드 모드에서만 외부 저장
-        if self.mode == "cloud" and self.supabase_client:
+        # 2. 클라우드 모드에서만 외부 저장 (네거티브 캐시는 로컬에만 보관)
+        if self.mode == "cloud" and self.supabase_client and not _is_negative_payload(data):
             try:
                 cloud_success = self._set_cloud_cache(scientific_name, source_db, data, update_reason)
                 success = local_success and cloud_success
@@ -154,18 +597,172 @@ class SecureDatabaseManager:
         
         return success
     
+    def get_many(self, scientific_names: List[str], source_db: str) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 학명의 캐시를 한 번에 조회합니다 (만료되지 않은 항목만).
+        
+        로컬 조회는 IN 절 일괄 조회, 히트 카운트 갱신은 executemany 한 번으로 처리합니다.
+        하이브리드/클라우드 모드에서는 로컬 미스만 클라우드에서 조회하고 로컬에 일괄 백업합니다.
+        
+        Args:
+            scientific_names: 조회할 학명 목록
+            source_db: 소스 데이터베이스 ('worms', 'lpsn', 'col' 등)
+            
+        Returns:
+            학명 → 캐시 데이터 딕셔너리 (미스 항목은 포함되지 않음)
+        """
+        names = list(dict.fromkeys(name for name in scientific_names if name))
+        if not names:
+            return {}
+        
+        # 표기만 다른 학명은 같은 정규화 키 하나로 조회
+        names_by_key: Dict[str, List[str]] = {}
+        for name in names:
+            names_by_key.setdefault(normalize_lookup_key(name), []).append(name)
+        keys = [key for key in names_by_key if key]
+        
+        found: Dict[str, Dict[str, Any]] = {}
+        now = datetime.now().isoformat()
+        # stale 재검증이 가능하면 만료 후 허용 기간 이내의 (네거티브가 아닌) 항목도 조회
+        stale_cutoff = self._stale_cutoff() if self._get_stale_handler() else now
+        try:
+            conn = self._get_connection()
+            for start in range(0, len(keys), SQLITE_IN_CHUNK_SIZE):
+                chunk = keys[start:start + SQLITE_IN_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"""
+                    SELECT scientific_name, normalized_name, cache_data, payload_format, is_negative, expires_at
+                    FROM local_species_cache
+                    WHERE source_db = ? AND normalized_name IN ({placeholders})
+                      AND (expires_at > ? OR (is_negative = 0 AND expires_at > ?))
+                """, (source_db, *chunk, now, stale_cutoff)).fetchall()
+                for row in rows:
+                    try:
+                        data = _decode_payload(row['cache_data'], row['payload_format'])
+                    except (TypeError, ValueError, zlib.error):
+                        continue  # 손상된 항목은 미스로 처리
+                    stale = row['expires_at'] <= now
+                    if stale:
+                        if not self._schedule_revalidation(row['scientific_name'], source_db, data):
+                            continue  # 재검증할 수 없는 소스는 미스로 처리
+                        data = _mark_stale(data)
+                    for name in names_by_key[row['normalized_name']]:
+                        found[name] = data
+                    self._record_hit(row['scientific_name'], source_db, now, bool(row['is_negative']), stale)
+        except Exception as e:
+            print(f"[Error] 로컬 캐시 일괄 조회 실패: {e}")
+        
+        # 하이브리드/클라우드 모드: 로컬 미스만 외부 조회
+        if self.mode in ["hybrid", "cloud"] and self.supabase_client:
+            cloud_found = {}
+            for name in names:
+                if name in found:
+                    continue
+                try:
+                    cloud_data = self._get_cloud_cache(name, source_db)
+                except Exception as e:
+                    print(f"[Warning] 클라우드 캐시 조회 실패, 로컬만 사용: {e}")
+                    break
+                if cloud_data:
+                    cloud_found[name] = cloud_data
+            if cloud_found:
+                self._set_local_cache_many([(name, source_db, data) for name, data in cloud_found.items()])
+                found.update(cloud_found)
+        
+        print(f"[Info] 캐시 일괄 조회 ({source_db}): {len(found)}/{len(names)}개 히트")
+        return found
+    
+    def get_cached_names(self, scientific_names: List[str], source_db: str) -> set:
+        """
+        유효한(만료되지 않은) 로컬 캐시가 있는 학명 집합을 반환합니다.
+        
+        캐시 예열 등 존재 여부만 확인할 때 사용하며, 히트 카운트와 stale 재검증에는 영향을 주지 않습니다.
+        """
+        names_by_key: Dict[str, List[str]] = {}
+        for name in scientific_names:
+            if name:
+                names_by_key.setdefault(normalize_lookup_key(name), []).append(name)
+        keys = [key for key in names_by_key if key]
+        
+        cached = set()
+        now = datetime.now().isoformat()
+        try:
+            conn = self._get_connection()
+            for start in range(0, len(keys), SQLITE_IN_CHUNK_SIZE):
+                chunk = keys[start:start + SQLITE_IN_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"""
+                    SELECT normalized_name FROM local_species_cache
+                    WHERE source_db = ? AND normalized_name IN ({placeholders}) AND expires_at > ?
+                """, (source_db, *chunk, now)).fetchall()
+                for row in rows:
+                    cached.update(names_by_key[row['normalized_name']])
+        except Exception as e:
+            print(f"[Error] 로컬 캐시 존재 여부 확인 실패: {e}")
+        return cached
+    
+    def set_many(self, records: List[Dict[str, Any]], update_reason: str = "api_call") -> int:
+        """
+        여러 캐시 항목을 한 트랜잭션으로 저장합니다.
+        
+        Args:
+            records: {'scientific_name', 'source_db', 'data'} 딕셔너리 목록
+            update_reason: 갱신 사유 (클라우드 저장 시 기록)
+            
+        Returns:
+            로컬에 저장된 항목 수
+        """
+        rows = [
+            (record['scientific_name'], record['source_db'], record['data'])
+            for record in records
+            if record.get('scientific_name') and record.get('source_db') and record.get('data') is not None
+        ]
+        if not rows:
+            return 0
+        
+        saved = self._set_local_cache_many(rows)
+        
+        if self.mode == "cloud" and self.supabase_client:
+            for scientific_name, source_db, data in rows:
+                if _is_negative_payload(data):
+                    continue  # 네거티브 캐시는 로컬에만 보관
+                try:
+                    self._set_cloud_cache(scientific_name, source_db, data, update_reason)
+                except Exception as e:
+                    print(f"[Warning] 클라우드 저장 실패, 로컬만 저장됨: {e}")
+                    break
+        
+        print(f"[Info] 캐시 일괄 저장 완료: {saved}개 ({self.mode} 모드)")
+        return saved
+    
+    def _set_local_cache_many(self, rows: List[tuple]) -> int:
+        """(학명, 소스, 데이터) 목록을 executemany 한 번으로 로컬 SQLite에 저장"""
+        try:
+            now = datetime.now().isoformat()
+            params = []
+            for scientific_name, source_db, data in rows:
+                payload, payload_format, data_hash = _encode_payload(data)
+                negative = _is_negative_payload(data)
+                params.append((scientific_name, normalize_lookup_key(scientific_name), source_db,
+                               payload, payload_format, int(negative),
+                               now, now, _cache_expires_at(negative), data_hash))
+            
+            with self._get_connection() as conn:
+                conn.executemany(UPSERT_LOCAL_CACHE_SQL, params)
+            self._record_writes(len(params))
+            return len(params)
+            
+        except Exception as e:
+            print(f"[Error] 로컬 캐시 일괄 저장 실패: {e}")
+            return 0
+    
     def _get_local_cache(self, scientific_name: str, source_db: str) -> Optional[Dict[str, Any]]:
         """로컬 SQLite에서 캐시 조회"""
         try:
-            with sqlite3.connect(self.local_db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute("""
-                    SELECT * FROM local_species_cache 
-                    WHERE scientific_name = ? AND source_db = ?
-                """, (scientific_name, source_db))
-                
-                row = cursor.fetchone()
-                return dict(row) if row else None
+            row = self._get_connection().execute(
+                SELECT_LOCAL_CACHE_SQL, (normalize_lookup_key(scientific_name), source_db)
+            ).fetchone()
+            return dict(row) if row else None
                 
         except Exception as e:
             print(f"[Error] 로컬 캐시 조회 실패: {e}")
@@ -175,32 +772,19 @@ class SecureDatabaseManager:
                          data: Dict[str, Any], update_reason: str = "api_call") -> bool:
         """로컬 SQLite에 캐시 저장"""
         try:
-            cache_data_json = json.dumps(data, ensure_ascii=False)
-            data_hash = hashlib.md5(cache_data_json.encode()).hexdigest()
+            payload, payload_format, data_hash = _encode_payload(data)
+            negative = _is_negative_payload(data)
             now = datetime.now().isoformat()
-            expires_at = (datetime.now() + timedelta(days=30)).isoformat()
             
-            with sqlite3.connect(self.local_db_path) as conn:
-                # UPSERT 기능 (INSERT OR REPLACE)
-                conn.execute("""
-                    INSERT OR REPLACE INTO local_species_cache 
-                    (scientific_name, source_db, cache_data, created_at, updated_at, 
-                     expires_at, hit_count, data_hash)
-                    VALUES (?, ?, ?, 
-                           COALESCE((SELECT created_at FROM local_species_cache 
-                                   WHERE scientific_name = ? AND source_db = ?), ?),
-                           ?, ?, 
-                           COALESCE((SELECT hit_count FROM local_species_cache 
-                                   WHERE scientific_name = ? AND source_db = ?), 0),
-                           ?)
-                """, (scientific_name, source_db, cache_data_json,
-                      scientific_name, source_db, now,  # created_at 처리
-                      now, expires_at,  # updated_at, expires_at
-                      scientific_name, source_db,  # hit_count 처리
-                      data_hash))
-                
-                conn.commit()
-                return True
+            with self._get_connection() as conn:
+                # UPSERT (기존 행의 created_at, hit_count 유지)
+                conn.execute(UPSERT_LOCAL_CACHE_SQL, (
+                    scientific_name, normalize_lookup_key(scientific_name), source_db,
+                    payload, payload_format, int(negative),
+                    now, now, _cache_expires_at(negative), data_hash
+                ))
+            self._record_writes(1)
+            return True
                 
         except Exception as e:
             print(f"[Error] 로컬 캐시 저장 실패: {e}")
@@ -227,7 +811,7 @@ class SecureDatabaseManager:
                          data: Dict[str, Any], update_reason: str = "api_call") -> bool:
         """클라우드 Supabase에 캐시 저장"""
         try:
-            expires_at = datetime.now() + timedelta(days=30)
+            expires_at = datetime.now() + timedelta(days=CACHE_TTL_DAYS)
             
             cache_data = {
                 "scientific_name": scientific_name,
@@ -267,76 +851,362 @@ class SecureDatabaseManager:
         except:
             return True
     
+    def set_stale_handler(self, handler: Optional[Callable[[str, str, Dict[str, Any]], bool]]):
+        """
+        만료(stale) 캐시 재검증 훅을 등록합니다.
+        
+        Args:
+            handler: (학명, 소스, stale 데이터)를 받아 백그라운드 재검증을 예약하는 함수.
+                     해당 소스를 재검증할 수 없으면 False를 반환 (그 항목은 캐시 미스로 처리)
+        """
+        self._stale_handler = handler
+        self._stale_handler_loaded = True
+    
+    def _get_stale_handler(self) -> Optional[Callable[[str, str, Dict[str, Any]], bool]]:
+        """재검증 훅 반환 (미등록 시 이 인스턴스를 관리하는 캐시 업데이트 스케줄러를 한 번 만들어 등록)"""
+        if self._stale_handler is None and not self._stale_handler_loaded:
+            self._stale_handler_loaded = True
+            try:
+                from .scheduler import CacheUpdateScheduler, get_cache_scheduler
+                # 생성 시 관리 대상 매니저에 set_stale_handler로 등록됨
+                if self is secure_db_manager:
+                    get_cache_scheduler()
+                else:
+                    CacheUpdateScheduler(secure_db=self)
+            except Exception as e:
+                print(f"[Warning] 캐시 재검증 스케줄러를 불러올 수 없어 만료 캐시는 미스로 처리합니다: {e}")
+        return self._stale_handler
+    
+    def _stale_cutoff(self) -> str:
+        """이 시각 이후에 만료된 항목까지 stale 상태로 반환 가능"""
+        return (datetime.now() - timedelta(days=CACHE_STALE_MAX_DAYS)).isoformat()
+    
+    def _is_within_stale_window(self, cache_record: Dict[str, Any]) -> bool:
+        """만료됐지만 stale 허용 기간 이내인지 확인"""
+        try:
+            return cache_record['expires_at'] > self._stale_cutoff()
+        except (KeyError, TypeError):
+            return False
+    
+    def _schedule_revalidation(self, scientific_name: str, source_db: str, stale_data: Dict[str, Any]) -> bool:
+        """stale 항목의 백그라운드 재검증 예약 (재검증할 수 없으면 False)"""
+        handler = self._get_stale_handler()
+        if handler is None:
+            return False
+        try:
+            return bool(handler(scientific_name, source_db, stale_data))
+        except Exception as e:
+            print(f"[Warning] 재검증 예약 실패, 캐시 미스로 처리: {scientific_name} ({source_db}) - {e}")
+            return False
+    
     def _update_hit_count(self, scientific_name: str, source_db: str):
-        """로컬 캐시 히트 카운트 업데이트"""
+        """로컬 캐시 히트 카운트 업데이트 (메모리에 모았다가 주기적으로 일괄 반영)"""
+        self._record_hit(scientific_name, source_db, datetime.now().isoformat())
+    
+    def _record_hit(self, scientific_name: str, source_db: str, accessed_at: str,
+                    negative: bool = False, stale: bool = False):
+        """히트 1회를 메모리 버퍼에 기록"""
+        with self._hits_lock:
+            if negative:
+                self._negative_hits += 1
+            if stale:
+                self._stale_hits += 1
+            key = (normalize_lookup_key(scientific_name), source_db)
+            entry = self._pending_hits.get(key)
+            if entry is None:
+                self._pending_hits[key] = [1, accessed_at]
+            else:
+                entry[0] += 1
+                entry[1] = max(entry[1], accessed_at)
+            pending_count = len(self._pending_hits)
+        
+        self._ensure_maintenance_thread()
+        if pending_count >= HIT_FLUSH_THRESHOLD:
+            self._maintenance_event.set()  # 백그라운드 스레드에 즉시 반영 요청
+    
+    def _record_writes(self, count: int):
+        """캐시 저장 횟수 기록 (많이 쌓이면 백그라운드 크기 확인 요청)"""
+        self._last_write_time = time.monotonic()
+        with self._hits_lock:
+            self._writes_since_eviction_check += count
+            due = self._writes_since_eviction_check >= CACHE_EVICTION_CHECK_WRITES
+        self._ensure_maintenance_thread()
+        if due:
+            self._maintenance_event.set()
+    
+    def _ensure_maintenance_thread(self):
+        """백그라운드 유지보수 스레드 시작 (한 번만)"""
+        if self._maintenance_thread is not None or self._stop_event.is_set():
+            return
+        with self._hits_lock:
+            if self._maintenance_thread is None:
+                self._maintenance_thread = threading.Thread(
+                    target=self._maintenance_loop, name="cache-maintenance", daemon=True
+                )
+                self._maintenance_thread.start()
+    
+    def _maintenance_loop(self):
+        """
+        주기적으로(또는 요청 시) 히트 카운트를 반영하고, 필요하면 크기 제한에 맞게 제거 및 만료 캐시 정리
+        (기존 DB의 증분 VACUUM 전환은 저장이 한동안 없을 때 수행)
+        """
+        while not self._stop_event.is_set():
+            self._maintenance_event.wait(HIT_FLUSH_INTERVAL)
+            self._maintenance_event.clear()
+            if self._stop_event.is_set():
+                break
+            self.flush_hit_counts()
+            if self._is_eviction_check_due():
+                self.evict_cache()
+            if time.monotonic() - self._last_cleanup_run >= CACHE_CLEANUP_INTERVAL:
+                self.cleanup_expired_cache()
+            if self._is_vacuum_conversion_due():
+                self.enable_incremental_vacuum()
+    
+    def _is_eviction_check_due(self) -> bool:
+        """새 저장이 있었고, 저장이 많이 쌓였거나 확인 간격이 지났는지 확인"""
+        with self._hits_lock:
+            writes = self._writes_since_eviction_check
+        if writes <= 0:
+            return False
+        return (writes >= CACHE_EVICTION_CHECK_WRITES
+                or time.monotonic() - self._last_eviction_check >= CACHE_EVICTION_CHECK_INTERVAL)
+    
+    def evict_cache(self, max_rows: int = None, max_bytes: int = None) -> Dict[str, Any]:
+        """
+        로컬 캐시가 크기 제한을 넘으면 LFU + 에이징 순으로 항목을 제거합니다.
+        
+        히트 수를 마지막 접근 이후 경과 기간으로 감쇠한 점수가 낮은 항목부터 짧은 트랜잭션 단위로
+        제거하고, 증분 VACUUM이 켜진 DB는 빈 페이지를 파일에서 반환합니다.
+        보통 백그라운드 유지보수 스레드에서 호출되므로 검증 작업을 멈추지 않습니다.
+        
+        Args:
+            max_rows: 최대 항목 수 (기본값: CACHE_MAX_ROWS)
+            max_bytes: 최대 DB 크기 (기본값: CACHE_MAX_BYTES)
+            
+        Returns:
+            {'rows', 'bytes', 'evicted', 'vacuumed_pages'} 통계
+        """
+        max_rows = CACHE_MAX_ROWS if max_rows is None else max_rows
+        max_bytes = CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        with self._hits_lock:
+            self._writes_since_eviction_check = 0
+        self._last_eviction_check = time.monotonic()
+        
+        summary = {"rows": 0, "bytes": 0, "evicted": 0, "vacuumed_pages": 0}
         try:
-            with sqlite3.connect(self.local_db_path) as conn:
-                conn.execute("""
-                    UPDATE local_species_cache 
-                    SET hit_count = hit_count + 1, last_accessed = ?
-                    WHERE scientific_name = ? AND source_db = ?
-                """, (datetime.now().isoformat(), scientific_name, source_db))
-                conn.commit()
+            # 점수 계산에 최신 히트 수 반영
+            self.flush_hit_counts()
+            conn = self._get_connection()
+            rows, db_bytes = self._get_cache_size(conn)
+            summary.update(rows=rows, bytes=db_bytes)
+            
+            # 제거할 항목 수 계산 (한도의 90%까지)
+            to_evict = 0
+            if rows > max_rows:
+                to_evict = rows - int(max_rows * CACHE_EVICTION_TARGET_RATIO)
+            if db_bytes > max_bytes and rows:
+                avg_row_bytes = db_bytes / rows
+                to_evict = max(to_evict, int((db_bytes - max_bytes * CACHE_EVICTION_TARGET_RATIO) / avg_row_bytes) + 1)
+            to_evict = min(to_evict, rows)
+            
+            while to_evict > 0 and not self._stop_event.is_set():
+                batch = min(to_evict, CACHE_EVICTION_BATCH)
+                with conn:
+                    deleted = conn.execute(EVICT_LOCAL_CACHE_SQL, (CACHE_EVICTION_HALF_LIFE_DAYS, batch)).rowcount
+                if deleted <= 0:
+                    break
+                summary["evicted"] += deleted
+                to_evict -= deleted
+            
+            if summary["evicted"]:
+                self._evicted_total += summary["evicted"]
+                summary["vacuumed_pages"] = self._incremental_vacuum(conn)
+                summary["rows"], summary["bytes"] = self._get_cache_size(conn)
+                print(f"[Info] 로컬 캐시 크기 제한 초과로 {summary['evicted']}개 제거 "
+                      f"(현재 {summary['rows']}개, {summary['bytes'] // (1024 * 1024)}MB)")
+        except Exception as e:
+            print(f"[Warning] 로컬 캐시 크기 제한 처리 실패: {e}")
+        return summary
+    
+    def _get_cache_size(self, conn: sqlite3.Connection) -> tuple:
+        """(캐시 항목 수, 사용 중인 DB 크기(바이트)) 반환"""
+        rows = self._count_cache_rows(conn)
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return rows, (page_count - freelist_count) * page_size
+    
+    def _incremental_vacuum(self, conn: sqlite3.Connection) -> int:
+        """증분 VACUUM으로 빈 페이지를 파일에서 반환 (auto_vacuum=INCREMENTAL인 DB만)"""
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return 0  # 아직 전환되지 않은 DB: 빈 페이지는 새 항목 저장에 재사용됨
+        freelist_count = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        pages = min(freelist_count, CACHE_INCREMENTAL_VACUUM_PAGES)
+        if pages:
+            conn.execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+        return pages
+    
+    def flush_hit_counts(self) -> int:
+        """
+        메모리에 모인 히트 카운트/최근 접근 시각을 한 트랜잭션으로 반영합니다.
+        
+        Returns:
+            반영된 항목 수
+        """
+        with self._hits_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        if not pending:
+            return 0
+        
+        try:
+            with self._get_connection() as conn:
+                conn.executemany(FLUSH_HIT_COUNT_SQL, [
+                    (count, accessed_at, normalized_name, source_db)
+                    for (normalized_name, source_db), (count, accessed_at) in pending.items()
+                ])
+            return len(pending)
         except Exception as e:
-            print(f"[Warning] 히트 카운트 업데이트 실패: {e}")
+            print(f"[Warning] 히트 카운트 일괄 반영 실패 (다음 주기에 재시도): {e}")
+            # 반영하지 못한 증가분을 버퍼에 되돌림
+            with self._hits_lock:
+                for key, (count, accessed_at) in pending.items():
+                    entry = self._pending_hits.setdefault(key, [0, accessed_at])
+                    entry[0] += count
+                    entry[1] = max(entry[1], accessed_at)
+            return 0
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """로컬 캐시 통계 조회 (보안 친화적)"""
         try:
-            with sqlite3.connect(self.local_db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                
-                # 전체 캐시 수
-                total_cursor = conn.execute("SELECT COUNT(*) as total FROM local_species_cache")
-                total_count = total_cursor.fetchone()['total']
-                
-                # 만료되지 않은 캐시 수
-                valid_cursor = conn.execute("""
-                    SELECT COUNT(*) as valid FROM local_species_cache 
-                    WHERE expires_at > ?
-                """, (datetime.now().isoformat(),))
-                valid_count = valid_cursor.fetchone()['valid']
-                
-                # 인기 종 Top 5
-                popular_cursor = conn.execute("""
-                    SELECT scientific_name, source_db, hit_count 
-                    FROM local_species_cache 
-                    WHERE hit_count > 0
-                    ORDER BY hit_count DESC LIMIT 5
-                """)
-                popular_species = [dict(row) for row in popular_cursor.fetchall()]
-                
-                return {
-                    "mode": self.mode,
-                    "total_cached": total_count,
-                    "valid_cached": valid_count,
-                    "expired_cached": total_count - valid_count,
-                    "popular_species": popular_species,
-                    "local_db_path": self.local_db_path
+            # 인기 종 통계가 정확하도록 대기 중인 히트 카운트 먼저 반영
+            self.flush_hit_counts()
+            conn = self._get_connection()
+            # 전체 캐시 수 (카운터)
+            total_count = self._count_cache_rows(conn)
+            
+            now = datetime.now().isoformat()
+            
+            # 소스별 전체 항목 수 (카운터)
+            source_totals = {
+                row['name'][len('rows:'):]: row['value']
+                for row in conn.execute("SELECT name, value FROM local_cache_counters WHERE name LIKE 'rows:%'")
+                if row['value'] > 0
+            }
+            
+            # 소스별 만료된 캐시 수 (만료 시각 인덱스로 만료된 항목만 읽음)
+            expired_by_source = {
+                row['source_db']: row['expired']
+                for row in conn.execute("""
+                    SELECT source_db, COUNT(*) as expired FROM local_species_cache 
+                    WHERE expires_at <= ? GROUP BY source_db
+                """, (now,))
+            }
+            valid_count = total_count - sum(expired_by_source.values())
+            
+            # 소스별 만료되지 않은 네거티브 캐시 수 (찾지 못함/잘못된 입력, 네거티브 인덱스로 해당 항목만 읽음)
+            negative_by_source = {
+                row['source_db']: row['negative']
+                for row in conn.execute("""
+                    SELECT source_db, COUNT(*) as negative FROM local_species_cache 
+                    WHERE is_negative = 1 AND expires_at > ? GROUP BY source_db
+                """, (now,))
+            }
+            negative_count = sum(negative_by_source.values())
+            
+            # 인기 종 Top 5 (네거티브 캐시 제외)
+            popular_cursor = conn.execute("""
+                SELECT scientific_name, source_db, hit_count 
+                FROM local_species_cache 
+                WHERE is_negative = 0 AND hit_count > 0
+                ORDER BY hit_count DESC LIMIT 5
+            """)
+            popular_species = [dict(row) for row in popular_cursor.fetchall()]
+            
+            # 소스별 집계
+            source_stats = {
+                source_db: {
+                    "total_cached": source_total,
+                    "valid_cached": source_total - expired_by_source.get(source_db, 0),
+                    "expired_cached": expired_by_source.get(source_db, 0),
+                    "negative_cached": negative_by_source.get(source_db, 0),
                 }
+                for source_db, source_total in source_totals.items()
+            }
+            
+            return {
+                "mode": self.mode,
+                "total_cached": total_count,
+                "valid_cached": valid_count,
+                "expired_cached": total_count - valid_count,
+                "negative_cached": negative_count,
+                "negative_hits": self._negative_hits,
+                "stale_hits": self._stale_hits,
+                "evicted_total": self._evicted_total,
+                "max_rows": CACHE_MAX_ROWS,
+                "max_bytes": CACHE_MAX_BYTES,
+                "vacuum_conversion_pending": self._vacuum_conversion_pending,  # 증분 VACUUM 전환 대기 중인 기존 DB
+                "popular_species": popular_species,
+                "source_stats": source_stats,
+                "last_cleanup": dict(self._last_cleanup),
+                "local_db_path": self.local_db_path
+            }
                 
         except Exception as e:
             print(f"[Error] 캐시 통계 조회 실패: {e}")
             return {"error": str(e)}
     
-    def cleanup_expired_cache(self) -> int:
-        """만료된 로컬 캐시 정리"""
+    def cleanup_expired_cache(self, batch_size: int = CACHE_CLEANUP_BATCH,
+                              max_seconds: Optional[float] = None) -> int:
+        """
+        만료된 로컬 캐시 정리 (stale 허용 기간이 남은 항목은 유지, 네거티브 캐시는 만료 즉시 삭제)
+        
+        batch_size개씩 짧은 트랜잭션으로 삭제하므로 정리할 항목이 많아도 쓰기 잠금을 오래 잡지 않으며,
+        백그라운드 유지보수 스레드가 CACHE_CLEANUP_INTERVAL마다 호출합니다.
+        
+        Args:
+            batch_size: 트랜잭션당 삭제할 행 수
+            max_seconds: 최대 실행 시간 (초과 시 남은 항목은 다음 정리 때 삭제, None이면 제한 없음)
+            
+        Returns:
+            삭제된 항목 수
+        """
+        self._last_cleanup_run = time.monotonic()
+        start_time = time.monotonic()
+        deleted_count = 0
+        batches = 0
         try:
-            with sqlite3.connect(self.local_db_path) as conn:
-                cursor = conn.execute("""
-                    DELETE FROM local_species_cache 
-                    WHERE expires_at < ?
-                """, (datetime.now().isoformat(),))
-                
-                deleted_count = cursor.rowcount
-                conn.commit()
-                
-                print(f"[Info] 만료된 로컬 캐시 {deleted_count}개 정리 완료")
-                return deleted_count
-                
+            conn = self._get_connection()
+            now = datetime.now().isoformat()
+            stale_cutoff = self._stale_cutoff()
+            while not self._stop_event.is_set():
+                if max_seconds is not None and time.monotonic() - start_time >= max_seconds:
+                    break
+                with conn:
+                    deleted = conn.execute(CLEANUP_EXPIRED_CACHE_SQL, (now, stale_cutoff, batch_size)).rowcount
+                if deleted <= 0:
+                    break
+                deleted_count += deleted
+                batches += 1
+                if deleted < batch_size:
+                    break
+            
+            if deleted_count:
+                self._incremental_vacuum(conn)
         except Exception as e:
             print(f"[Error] 로컬 캐시 정리 실패: {e}")
-            return 0
+        
+        elapsed = time.monotonic() - start_time
+        self._last_cleanup = {
+            "deleted": deleted_count,
+            "batches": batches,
+            "elapsed_seconds": round(elapsed, 3),
+            "rows_per_second": round(deleted_count / elapsed) if elapsed > 0 else deleted_count,
+            "finished_at": datetime.now().isoformat(),
+        }
+        print(f"[Info] 만료된 로컬 캐시 {deleted_count}개 정리 완료 "
+              f"({batches}회, {elapsed:.2f}초, 초당 {self._last_cleanup['rows_per_second']}개)")
+        return deleted_count
 
 # 설정에 따른 보안 모드 결정
 def get_secure_database_mode() -> DatabaseMode:
@@ -9,6 +9,7 @@ from typing import List, Optional, Dict, Any
 from uuid import uuid4
 
 from .supabase_client import get_supabase_client
+from .log_shipper import get_log_shipper
 from .models import (
     VerificationSession, VerificationResult, UserFavorite, 
     VerificationStats, ApiUsageLog, VerificationType, SessionStatus
@@ -243,7 +244,7 @@ class DatabaseService:
         response_time_ms: Optional[int] = None,
         error_message: Optional[str] = None
     ):
-        """API 사용 로그 기록"""
+        """API 사용 로그 기록 (백그라운드 일괄 전송, 호출 경로에서 대기하지 않음)"""
         log_data = {
             "session_id": session_id,
             "api_name": api_name,
@@ -255,7 +256,7 @@ class DatabaseService:
             "created_at": datetime.now().isoformat()
         }
         
-        self.client.table("api_usage_logs").insert(log_data).execute()
+        get_log_shipper().enqueue("api_usage_logs", log_data)
     
     # === 검색 및 필터링 ===
     
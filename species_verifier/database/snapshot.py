@@ -0,0 +1,280 @@
+"""
+로컬 캐시 스냅샷 내보내기/가져오기 모듈
+
+워크스테이션마다 따로 쌓은 로컬 캐시(species_cache.db)를 하나의 압축 파일로 내보내고,
+다른 PC에서 가져와 병합할 수 있게 합니다. 클라우드 연결 없이 폐쇄망 실험실 간에
+예열된 캐시를 공유하는 용도입니다.
+
+- 파일 형식: gzip 압축 JSON Lines (첫 줄 헤더, 마지막 줄 항목 수 확인용 트레일러)
+- 내보내기: source_db, 최근 갱신 기간으로 일부만 고를 수 있음
+- 가져오기: 같은 (정규화 학명, source_db) 항목이 있으면 updated_at이 더 최신인 쪽을 유지
+"""
+import gzip
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from .secure_mode import (
+    SecureDatabaseManager,
+    _decode_payload,
+    _encode_payload,
+    get_secure_database_manager,
+)
+from ..utils.text_processor import normalize_lookup_key
+
+try:
+    from species_verifier.config import app_config
+    APP_VERSION = app_config.APP_VERSION
+except ImportError:
+    # 설정 파일이 없는 경우 기본값 사용
+    APP_VERSION = "unknown"
+
+SNAPSHOT_FORMAT = "species_cache_snapshot"
+SNAPSHOT_VERSION = 1  # 항목 필드가 바뀌면 올림 (가져오기는 이 버전 이하만 지원)
+SNAPSHOT_IMPORT_BATCH = 1000  # 가져오기 시 트랜잭션당 행 수
+
+# 더 최신인 항목만 덮어씀 (hit_count, last_accessed 등 PC별 사용 기록은 유지)
+MERGE_LOCAL_CACHE_SQL = """
+    INSERT INTO local_species_cache
+    (scientific_name, normalized_name, source_db, cache_data, payload_format, is_negative, created_at, updated_at,
+     expires_at, hit_count, data_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?)
+    ON CONFLICT(normalized_name, source_db) DO UPDATE SET
+        cache_data = excluded.cache_data,
+        payload_format = excluded.payload_format,
+        is_negative = excluded.is_negative,
+        updated_at = excluded.updated_at,
+        expires_at = excluded.expires_at,
+        data_hash = excluded.data_hash
+    WHERE excluded.updated_at > local_species_cache.updated_at
+"""
+
+
+def _build_export_query(source_dbs: Optional[Iterable[str]], max_age_days: Optional[float],
+                        include_expired: bool, include_negative: bool) -> tuple:
+    """내보내기 조건에 맞는 SELECT 문과 인자 생성"""
+    conditions: List[str] = []
+    params: List[Any] = []
+    if source_dbs:
+        source_dbs = list(source_dbs)
+        conditions.append(f"source_db IN ({','.join('?' * len(source_dbs))})")
+        params.extend(source_dbs)
+    if max_age_days is not None:
+        conditions.append("updated_at >= ?")
+        params.append((datetime.now() - timedelta(days=float(max_age_days))).isoformat())
+    if not include_expired:
+        conditions.append("expires_at > ?")
+        params.append(datetime.now().isoformat())
+    if not include_negative:
+        conditions.append("is_negative = 0")
+
+    sql = """
+        SELECT scientific_name, normalized_name, source_db, cache_data, payload_format, is_negative,
+               created_at, updated_at, expires_at, data_hash
+        FROM local_species_cache
+    """
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    return sql + " ORDER BY source_db, normalized_name", params
+
+
+def export_cache_snapshot(path: str, source_dbs: Optional[Iterable[str]] = None,
+                          max_age_days: Optional[float] = None, include_expired: bool = False,
+                          include_negative: bool = False,
+                          secure_db: Optional[SecureDatabaseManager] = None) -> Dict[str, Any]:
+    """
+    로컬 캐시를 스냅샷 파일로 내보냅니다.
+
+    Args:
+        path: 저장할 파일 경로 (예: cache_snapshot.jsonl.gz)
+        source_dbs: 내보낼 캐시 구분 목록 (None이면 전체)
+        max_age_days: 최근 이 기간 안에 갱신된 항목만 (None이면 전체)
+        include_expired: 만료된 항목도 포함할지 여부
+        include_negative: 찾지 못함/잘못된 입력 결과(네거티브 캐시)도 포함할지 여부
+        secure_db: 데이터베이스 매니저 (기본값: 전역 인스턴스)
+
+    Returns:
+        {'path', 'exported', 'source_counts'} 요약
+    """
+    secure_db = secure_db or get_secure_database_manager()
+    sql, params = _build_export_query(source_dbs, max_age_days, include_expired, include_negative)
+
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "app_version": APP_VERSION,
+        "created_at": datetime.now().isoformat(),
+        "filters": {
+            "source_dbs": list(source_dbs) if source_dbs else None,
+            "max_age_days": max_age_days,
+            "include_expired": include_expired,
+            "include_negative": include_negative,
+        },
+    }
+
+    # 임시 파일에 쓴 뒤 교체 (중간에 실패해도 기존 스냅샷을 망가뜨리지 않음)
+    temp_path = f"{path}.tmp"
+    exported = 0
+    source_counts: Dict[str, int] = {}
+    try:
+        with gzip.open(temp_path, "wt", encoding="utf-8") as f:
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+            for row in secure_db._get_connection().execute(sql, params):
+                try:
+                    data = _decode_payload(row['cache_data'], row['payload_format'])
+                except Exception as e:
+                    print(f"[Warning] 손상된 캐시 항목은 내보내지 않음: {row['scientific_name']} ({row['source_db']}) - {e}")
+                    continue
+                entry = {
+                    "scientific_name": row['scientific_name'],
+                    "source_db": row['source_db'],
+                    "data": data,
+                    "is_negative": bool(row['is_negative']),
+                    "created_at": row['created_at'],
+                    "updated_at": row['updated_at'],
+                    "expires_at": row['expires_at'],
+                }
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                exported += 1
+                source_counts[row['source_db']] = source_counts.get(row['source_db'], 0) + 1
+            f.write(json.dumps({"end": True, "count": exported}) + "\n")
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    print(f"[Info] 캐시 스냅샷 내보내기 완료: {exported}개 -> {path} {source_counts}")
+    return {"path": path, "exported": exported, "source_counts": source_counts}
+
+
+def _read_snapshot(path: str):
+    """스냅샷 헤더를 확인하고 (헤더, 항목 반복자)를 반환"""
+    f = gzip.open(path, "rt", encoding="utf-8")
+    try:
+        header = json.loads(f.readline() or "{}")
+    except (OSError, EOFError, json.JSONDecodeError):
+        f.close()
+        raise ValueError(f"캐시 스냅샷 파일이 아닙니다: {path}")
+    if header.get("format") != SNAPSHOT_FORMAT:
+        f.close()
+        raise ValueError(f"캐시 스냅샷 파일이 아닙니다: {path}")
+    if int(header.get("version", 0)) > SNAPSHOT_VERSION:
+        f.close()
+        raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {header.get('version')} (지원: {SNAPSHOT_VERSION} 이하)")
+
+    def entries():
+        with f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+    return header, entries()
+
+
+def import_cache_snapshot(path: str, source_dbs: Optional[Iterable[str]] = None,
+                          include_expired: bool = False,
+                          secure_db: Optional[SecureDatabaseManager] = None) -> Dict[str, Any]:
+    """
+    스냅샷 파일을 로컬 캐시에 병합합니다.
+    이미 있는 항목은 스냅샷 쪽 updated_at이 더 최신일 때만 덮어씁니다.
+
+    Args:
+        path: 스냅샷 파일 경로
+        source_dbs: 가져올 캐시 구분 목록 (None이면 전체)
+        include_expired: 이미 만료된 항목도 가져올지 여부 (기본값: 건너뜀)
+        secure_db: 데이터베이스 매니저 (기본값: 전역 인스턴스)
+
+    Returns:
+        {'read', 'inserted', 'updated', 'skipped', 'invalid', 'complete'} 요약
+        (complete가 False이면 파일이 중간에 잘린 것)
+    """
+    secure_db = secure_db or get_secure_database_manager()
+    allowed_sources = set(source_dbs) if source_dbs else None
+    now = datetime.now().isoformat()
+    header, entries = _read_snapshot(path)
+    print(f"[Info] 캐시 스냅샷 가져오기 시작: {path} (생성 {header.get('created_at')}, "
+          f"앱 버전 {header.get('app_version')})")
+
+    summary = {"read": 0, "inserted": 0, "updated": 0, "skipped": 0, "invalid": 0, "complete": False}
+    conn = secure_db._get_connection()
+    rows_before = secure_db._count_cache_rows(conn)
+    applied = 0
+    batch: List[tuple] = []
+
+    def flush():
+        nonlocal applied
+        if not batch:
+            return
+        with conn:
+            # rowcount는 트리거(항목 수 카운터) 변경을 제외한 실제 추가/갱신 행 수
+            applied += conn.executemany(MERGE_LOCAL_CACHE_SQL, batch).rowcount
+        batch.clear()
+
+    try:
+        for entry in entries:
+            if entry.get("end"):
+                summary["complete"] = entry.get("count") == summary["read"]
+                break
+            summary["read"] += 1
+            try:
+                scientific_name = entry["scientific_name"]
+                source_db = entry["source_db"]
+                lookup_key = normalize_lookup_key(scientific_name)
+                if not lookup_key or entry.get("data") is None:
+                    raise ValueError("학명 또는 데이터 없음")
+                if allowed_sources is not None and source_db not in allowed_sources:
+                    continue
+                if not include_expired and entry["expires_at"] <= now:
+                    continue
+                payload, payload_format, data_hash = _encode_payload(entry["data"])
+                batch.append((scientific_name, lookup_key, source_db, payload, payload_format,
+                              int(bool(entry.get("is_negative"))), entry.get("created_at") or entry["updated_at"],
+                              entry["updated_at"], entry["expires_at"], data_hash))
+            except (KeyError, TypeError, ValueError) as e:
+                summary["invalid"] += 1
+                print(f"[Warning] 잘못된 스냅샷 항목 건너뜀: {e}")
+                continue
+            if len(batch) >= SNAPSHOT_IMPORT_BATCH:
+                flush()
+        flush()
+    except (OSError, EOFError, json.JSONDecodeError) as e:
+        # 잘린 파일: 읽은 데까지는 반영
+        flush()
+        print(f"[Warning] 캐시 스냅샷을 끝까지 읽지 못했습니다: {e}")
+
+    summary["inserted"] = secure_db._count_cache_rows(conn) - rows_before
+    summary["updated"] = applied - summary["inserted"]
+    summary["skipped"] = summary["read"] - summary["invalid"] - applied  # 필터 제외 + 기존 항목이 더 최신
+    secure_db._record_writes(applied)
+
+    if not summary["complete"]:
+        print("[Warning] 스냅샷 파일이 완전하지 않습니다 (일부 항목만 가져옴)")
+    print(f"[Info] 캐시 스냅샷 가져오기 완료: 추가 {summary['inserted']}개, 갱신 {summary['updated']}개, "
+          f"건너뜀 {summary['skipped']}개, 오류 {summary['invalid']}개")
+    return summary
+
+
+if __name__ == "__main__":
+    # 사용법:
+    #   python -m species_verifier.database.snapshot export <파일> [marine|microbe|col ...] [--days N]
+    #   python -m species_verifier.database.snapshot import <파일>
+    if len(sys.argv) < 3 or sys.argv[1] not in ("export", "import"):
+        print("사용법: python -m species_verifier.database.snapshot export|import <파일> "
+              "[source_db ...] [--days N]")
+        sys.exit(1)
+
+    command, snapshot_path, options = sys.argv[1], sys.argv[2], sys.argv[3:]
+    days = None
+    if "--days" in options:
+        index = options.index("--days")
+        days = float(options[index + 1])
+        del options[index:index + 2]
+
+    if command == "export":
+        print(export_cache_snapshot(snapshot_path, source_dbs=options or None, max_age_days=days))
+    else:
+        print(import_cache_snapshot(snapshot_path, source_dbs=options or None))
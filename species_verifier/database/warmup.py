@@ -0,0 +1,206 @@
+"""
+로컬 캐시 예열(warm-up) 모듈
+
+현장 조사 전에 예상 학명 목록이나 이전 세션의 검증 기록으로 로컬 캐시를 미리 채워,
+당일 첫 검증도 네트워크 대기 없이 캐시에서 처리되도록 합니다.
+
+- 검증은 앱 배치 검증과 같은 VerificationPipeline(업스트림별 속도 제한 적용)을 사용합니다.
+- 캐시 구분(source_db)은 앱 배치 검증과 같은 'marine', 'microbe', 'col'을 사용합니다.
+- 결과는 묶음 단위로 저장하고, 유효한 캐시가 이미 있는 학명은 건너뛰므로
+  중단 후 다시 실행하면 남은 항목부터 이어서 진행합니다.
+"""
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .secure_mode import SecureDatabaseManager, get_secure_database_manager
+
+WARMUP_CHUNK_SIZE = int(os.getenv("CACHE_WARMUP_CHUNK_SIZE", "200"))  # 한 번에 검증/저장할 학명 수
+WARMUP_SOURCES = ("marine", "microbe", "col")
+
+
+def _query_name(item: Any) -> str:
+    """검증 항목(학명 또는 (표시 이름, 학명) 튜플)의 캐시 조회용 학명 (앱 배치 검증과 같은 규칙)"""
+    if isinstance(item, (tuple, list)):
+        return item[1] if len(item) > 1 and item[1] else item[0]
+    return item
+
+
+class CacheWarmer:
+    """학명 목록 또는 이전 세션 기록으로 로컬 캐시를 미리 채우는 작업"""
+
+    def __init__(self, secure_db: Optional[SecureDatabaseManager] = None,
+                 progress_callback: Optional[Callable[[float, int, int], None]] = None,
+                 status_callback: Optional[Callable[[str], None]] = None,
+                 check_cancelled: Optional[Callable[[], bool]] = None,
+                 chunk_size: int = WARMUP_CHUNK_SIZE):
+        """
+        초기화 함수
+
+        Args:
+            secure_db: 캐시를 저장할 데이터베이스 매니저 (기본값: 전역 인스턴스)
+            progress_callback: 진행률 콜백 (진행률, 처리한 항목 수, 전체 항목 수)
+            status_callback: 상태 메시지 콜백
+            check_cancelled: 취소 여부 확인 함수
+            chunk_size: 한 번에 검증/저장할 학명 수
+        """
+        self.secure_db = secure_db or get_secure_database_manager()
+        self.progress_callback = progress_callback
+        self.status_callback = status_callback
+        self.check_cancelled = check_cancelled
+        self.chunk_size = max(1, int(chunk_size))
+
+    def _is_cancelled(self) -> bool:
+        return bool(self.check_cancelled and self.check_cancelled())
+
+    def _report(self, done: int, total: int, message: Optional[str] = None):
+        """진행 상황 전달"""
+        if message:
+            print(f"[Info Warmup] {message}")
+            if self.status_callback:
+                self.status_callback(message)
+        if self.progress_callback and total:
+            self.progress_callback(min(done / total, 1.0), done, total)
+
+    def load_session_names(self, source_db: str = "marine", limit: Optional[int] = None) -> List[str]:
+        """
+        이전 세션(local_verification_results)에서 검증했던 입력 학명을 최근 순으로 가져옵니다.
+
+        Args:
+            source_db: 검증 유형 ('marine', 'microbe', 'col')
+            limit: 최대 학명 수 (None이면 전체)
+        """
+        sql = """
+            SELECT input_name FROM local_verification_results
+            WHERE verification_type = ?
+            GROUP BY input_name
+            ORDER BY MAX(created_at) DESC
+        """
+        params: List[Any] = [source_db]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        try:
+            rows = self.secure_db._get_connection().execute(sql, params).fetchall()
+            return [row['input_name'] for row in rows if row['input_name']]
+        except Exception as e:
+            print(f"[Error] 이전 세션 학명 조회 실패: {e}")
+            return []
+
+    def warm_up(self, names: List[Any], source_db: str = "marine") -> Dict[str, Any]:
+        """
+        학명 목록으로 로컬 캐시를 채웁니다.
+
+        Args:
+            names: 학명 문자열 또는 (표시 이름, 학명) 튜플 목록
+            source_db: 캐시 구분 ('marine', 'microbe', 'col')
+
+        Returns:
+            {'source_db', 'total', 'already_cached', 'verified', 'cached', 'failed',
+             'cancelled', 'elapsed_seconds'} 요약
+        """
+        if source_db not in WARMUP_SOURCES:
+            raise ValueError(f"지원하지 않는 캐시 구분입니다: {source_db} (사용 가능: {', '.join(WARMUP_SOURCES)})")
+
+        from ..core.memory_cache import is_cacheable_result
+        from ..core.pipeline import VerificationPipeline
+        from ..utils.text_processor import deduplicate_names
+
+        start_time = time.time()
+        unique_names, _ = deduplicate_names(names)
+        queries = [_query_name(item) for item in unique_names]
+
+        # 유효한 캐시가 있는 학명은 건너뜀 (중단 후 재실행 시 이어서 진행)
+        cached_names = self.secure_db.get_cached_names(queries, source_db)
+        pending = [item for item, query in zip(unique_names, queries) if query not in cached_names]
+
+        total = len(unique_names)
+        summary = {
+            "source_db": source_db,
+            "total": total,
+            "already_cached": total - len(pending),
+            "verified": 0,
+            "cached": 0,
+            "failed": 0,
+            "cancelled": False,
+        }
+        self._report(summary["already_cached"], total,
+                     f"{source_db} 캐시 예열 시작: 전체 {total}개 중 {summary['already_cached']}개는 이미 캐시됨, "
+                     f"{len(pending)}개 검증 예정")
+
+        for start in range(0, len(pending), self.chunk_size):
+            if self._is_cancelled():
+                summary["cancelled"] = True
+                break
+
+            chunk = pending[start:start + self.chunk_size]
+            done_before = summary["already_cached"] + start
+            pipeline = VerificationPipeline(
+                progress_callback=lambda _progress, completed, _total: self._report(done_before + completed, total),
+                check_cancelled=self.check_cancelled,
+            )
+            results = pipeline.run(chunk, default_source=source_db).get(source_db, [])
+
+            # 결과의 input_name은 표시 이름(한글명일 수 있음)이므로 앱 배치 검증이 조회하는 학명 키로 저장
+            # (같은 표시 이름이 서로 다른 학명을 가리키면 어느 쪽인지 알 수 없으므로 저장하지 않음)
+            query_by_display: Dict[str, Optional[str]] = {}
+            for item in chunk:
+                display = item[0] if isinstance(item, (tuple, list)) else item
+                query = _query_name(item)
+                query_by_display[display] = query if query_by_display.get(display, query) == query else None
+            records = [
+                {'scientific_name': query_by_display[result['input_name']], 'source_db': source_db, 'data': result}
+                for result in results
+                if isinstance(result.get('input_name'), str) and query_by_display.get(result['input_name'])
+                and is_cacheable_result(result)
+            ]
+            if records:
+                summary["cached"] += self.secure_db.set_many(records, update_reason="warmup")
+            summary["verified"] += len(results)
+            summary["failed"] += len(results) - len(records)
+
+            self._report(done_before + len(results), total,
+                         f"{source_db} 캐시 예열 진행: {done_before + len(results)}/{total} "
+                         f"(저장 {summary['cached']}개, 실패 {summary['failed']}개)")
+
+        if self._is_cancelled():
+            summary["cancelled"] = True
+        summary["elapsed_seconds"] = round(time.time() - start_time, 1)
+
+        state = "중단" if summary["cancelled"] else "완료"
+        self._report(summary["already_cached"] + summary["verified"], total,
+                     f"{source_db} 캐시 예열 {state}: 새로 저장 {summary['cached']}개, "
+                     f"실패 {summary['failed']}개, {summary['elapsed_seconds']}초")
+        return summary
+
+    def warm_up_from_sessions(self, source_db: str = "marine", limit: Optional[int] = None) -> Dict[str, Any]:
+        """이전 세션에서 검증했던 학명으로 로컬 캐시를 채웁니다."""
+        names = self.load_session_names(source_db, limit)
+        if not names:
+            print(f"[Info Warmup] 이전 세션 기록이 없습니다: {source_db}")
+        return self.warm_up(names, source_db)
+
+
+def warm_up_cache(names: List[Any], source_db: str = "marine",
+                  progress_callback: Optional[Callable[[float, int, int], None]] = None,
+                  check_cancelled: Optional[Callable[[], bool]] = None) -> Dict[str, Any]:
+    """학명 목록으로 로컬 캐시를 채우는 간편 함수 (CacheWarmer.warm_up 참고)"""
+    warmer = CacheWarmer(progress_callback=progress_callback, check_cancelled=check_cancelled)
+    return warmer.warm_up(names, source_db)
+
+
+if __name__ == "__main__":
+    # 사용법: python -m species_verifier.database.warmup [학명 목록 파일] [marine|microbe|col]
+    # 파일을 지정하지 않으면 이전 세션에서 검증했던 학명을 사용합니다.
+    names_file = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] not in WARMUP_SOURCES else None
+    source = next((arg for arg in sys.argv[1:] if arg in WARMUP_SOURCES), "marine")
+
+    warmer = CacheWarmer()
+    if names_file:
+        with open(names_file, encoding="utf-8") as f:
+            seed_names = [line.strip() for line in f if line.strip()]
+        result = warmer.warm_up(seed_names, source)
+    else:
+        result = warmer.warm_up_from_sessions(source)
+    print(result)
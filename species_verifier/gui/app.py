@@ -156,6 +156,7 @@ class SpeciesVerifierApp(ctk.CTk):
         self.duplicates_ignored_marine = 0   # 해양생물 탭 중복 무시 횟수
         self.duplicates_ignored_microbe = 0  # 미생물 탭 중복 무시 횟수
         self.duplicates_ignored_col = 0      # COL 탭 중복 무시 횟수
+        self.file_dedup_info = {}            # 탭별 파일 로드 시 사전 중복 제거 정보
         
         self.is_verifying = False # 현재 검증 작업 진행 여부 플래그
         self.is_cancelled = False # 작업 취소 요청 플래그 (추가)
@@ -687,8 +688,8 @@ class SpeciesVerifierApp(ctk.CTk):
         
         # 전체 처리 수 설정 (통계 표시용)
         self.total_processed_col = len(verification_list)
-        # 중복 카운터 초기화
-        self.duplicates_ignored_col = 0
+        # 네트워크 호출 전 중복 제거 (제거된 중복 수로 카운터 초기화)
+        verification_list, self.duplicates_ignored_col = self._preflight_dedupe(verification_list, "col")
         print(f"[Debug Stats] COL 탭 전체 처리 수 설정: {self.total_processed_col}")
         
         # 검증 중 플래그 설정
@@ -706,10 +707,7 @@ class SpeciesVerifierApp(ctk.CTk):
         thread.start()
 
     def _perform_col_verification(self, verification_list, use_realtime: bool = False):
-        """COL 글로벌 API를 이용한 검증 (백그라운드) - 실시간/배치 처리 구분"""
-        from species_verifier.core.col_api import verify_col_species
-        import time
-        
+        """COL 글로벌 API를 이용한 검증 (백그라운드) - 소스별 작업자 풀로 동시 처리"""
         try:
             # 취소 플래그 초기화
             self.is_cancelled = False
@@ -718,148 +716,7 @@ class SpeciesVerifierApp(ctk.CTk):
             self.total_verification_items = len(verification_list)
             print(f"[Debug COL] 전체 COL 항목 수 설정: {self.total_verification_items}")
             
-            # 설정 로드
-            from species_verifier.config import app_config, api_config
-            
-            # 실시간 처리 vs 배치 처리
-            if use_realtime:
-                # 실시간 처리 - 배치 지연 없이 빠르게 처리
-                print(f"[Info COL] 실시간 처리 시작: 총 {len(verification_list)}개 항목")
-                
-                # 실시간 처리 - 개별 항목 처리
-                processed_items = 0
-                for item_idx, name in enumerate(verification_list):
-                    # 항목별 취소 확인
-                    if self.is_cancelled:
-                        print(f"[Info COL] 실시간 처리 중 취소 감지")
-                        break
-                    
-                    input_name_display = name
-                    query = name
-                    if isinstance(name, (tuple, list)):
-                        input_name_display = name[0]
-                        query = name[1] if len(name) > 1 else name[0]
-                    
-                    # 항목별 진행률 업데이트
-                    current_item = item_idx + 1
-                    item_progress = current_item / len(verification_list)
-                    self.after(0, lambda p=item_progress, c=current_item: self.update_progress(p, c, len(verification_list)))
-                    self.after(0, lambda d=input_name_display, c=current_item: 
-                              self._update_progress_label(f"실시간: '{d[:20]}' 검증 중... ({c}/{len(verification_list)})"))
-                    
-                    # 검증 실행 (실시간 모드에서는 지연 시간 최소화)
-                    start_time = time.time()
-                    result = verify_col_species(query)
-                    duration = time.time() - start_time
-                    
-                    print(f"[Debug] COL 실시간 항목 {current_item}/{len(verification_list)} '{input_name_display[:20]}' 완료: 소요시간 {duration:.2f}초")
-                    
-                    # 결과 처리
-                    result['input_name'] = input_name_display
-                    if not self.is_cancelled:
-                        self.result_queue.put((result, 'col'))
-                        print(f"[Debug] COL 실시간 결과 추가: {result.get('input_name', '')}")
-                    
-                    processed_items += 1
-                    
-                    # 실시간 처리에서는 짧은 지연만 적용 (0.5초)
-                    if item_idx < len(verification_list) - 1 and not self.is_cancelled:
-                        time.sleep(api_config.REALTIME_REQUEST_DELAY)  # 0.5초
-                
-                print(f"[Info COL] 실시간 처리 완료: {processed_items}/{len(verification_list)}개 항목 처리됨")
-                
-            else:
-                # 배치 처리 - 기존 방식
-                BATCH_SIZE = app_config.BATCH_SIZE  # 100개
-                BATCH_DELAY = api_config.BATCH_DELAY  # 3.0초
-                
-                total_items = len(verification_list)
-                total_batches = (total_items + BATCH_SIZE - 1) // BATCH_SIZE  # 올림 나눗셈
-                
-                print(f"[Info COL] 배치 처리 시작: 총 {total_items}개 항목을 {total_batches}개 배치로 처리")
-                print(f"[Info COL] 배치 크기: {BATCH_SIZE}개, 배치간 지연: {BATCH_DELAY}초")
-                
-                # 배치별 처리
-                processed_items = 0
-                for batch_idx in range(total_batches):
-                    # 취소 확인
-                    if self.is_cancelled:
-                        print(f"[Info COL] 배치 {batch_idx + 1}/{total_batches} 처리 전 취소 감지")
-                        break
-                    
-                    # 현재 배치 생성
-                    start_idx = batch_idx * BATCH_SIZE
-                    end_idx = min(start_idx + BATCH_SIZE, total_items)
-                    current_batch = verification_list[start_idx:end_idx]
-                    
-                    print(f"[Info COL] 배치 {batch_idx + 1}/{total_batches} 처리 시작 ({start_idx + 1}-{end_idx})")
-                    
-                    # 배치 진행률 업데이트
-                    batch_progress = batch_idx / total_batches
-                    self.after(0, lambda p=batch_progress: self.update_progress(p, batch_idx * BATCH_SIZE, total_items))
-                    self.after(0, lambda: self._update_progress_label(f"배치 {batch_idx + 1}/{total_batches} 처리 중..."))
-                    
-                    # 현재 배치 내 개별 항목 처리
-                    try:
-                        for item_idx, name in enumerate(current_batch):
-                            # 항목별 취소 확인
-                            if self.is_cancelled:
-                                print(f"[Info COL] 배치 {batch_idx + 1} 내 항목 처리 중 취소 감지")
-                                break
-                            
-                            input_name_display = name
-                            query = name
-                            if isinstance(name, (tuple, list)):
-                                input_name_display = name[0]
-                                query = name[1] if len(name) > 1 else name[0]
-                            
-                            # 항목별 진행률 업데이트
-                            current_item = batch_idx * BATCH_SIZE + item_idx + 1
-                            item_progress = batch_progress + ((item_idx + 1) / len(current_batch)) / total_batches
-                            self.after(0, lambda p=item_progress, c=current_item: self.update_progress(p, c, total_items))
-                            self.after(0, lambda d=input_name_display, c=current_item: 
-                                      self._update_progress_label(f"배치 {batch_idx + 1}/{total_batches}: '{d[:20]}' 검증 중... ({c}/{total_items})"))
-                            
-                            # 검증 실행
-                            start_time = time.time()
-                            result = verify_col_species(query)
-                            duration = time.time() - start_time
-                            
-                            print(f"[Debug] COL 배치 항목 {current_item}/{total_items} '{input_name_display[:20]}' 완료: 소요시간 {duration:.2f}초")
-                            
-                            # 결과 처리
-                            result['input_name'] = input_name_display
-                            if not self.is_cancelled:
-                                self.result_queue.put((result, 'col'))
-                                print(f"[Debug] COL 배치 결과 추가: {result.get('input_name', '')}")
-                            
-                            processed_items += 1
-                            
-                            # 배치 처리에서는 기본 지연 적용 (1.0초)
-                            if not self.is_cancelled:
-                                time.sleep(api_config.REQUEST_DELAY)  # 1.0초
-                        
-                        print(f"[Info COL] 배치 {batch_idx + 1}/{total_batches} 완료, 처리된 항목: {processed_items}/{total_items}")
-                        
-                    except Exception as e:
-                        print(f"[Error COL] 배치 {batch_idx + 1} 처리 중 오류: {e}")
-                        import traceback
-                        traceback.print_exc()
-                    
-                    # 마지막 배치가 아니면 배치간 지연 시간 적용
-                    if batch_idx < total_batches - 1 and not self.is_cancelled:
-                        print(f"[Info COL] 배치간 지연 시간 적용: {BATCH_DELAY}초 대기")
-                        time.sleep(BATCH_DELAY)
-                    
-                    # 취소 확인 (지연 후)
-                    if self.is_cancelled:
-                        print(f"[Info COL] 배치 {batch_idx + 1}/{total_batches} 처리 후 취소 감지")
-                        break
-                
-                if not self.is_cancelled:
-                    print(f"[Info COL] 모든 배치 처리 완료: {processed_items}/{total_items}개 항목 처리됨")
-                else:
-                    print(f"[Info COL] 배치 처리 취소됨: {processed_items}/{total_items}개 항목 처리됨")
+            self._run_verification_pipeline(verification_list, "col", "COL", "COL", use_realtime)
             
             if not self.is_cancelled:
                 # 검증 완료 후 파일 캐시 삭제
@@ -899,7 +756,7 @@ class SpeciesVerifierApp(ctk.CTk):
         try:
             # 브릿지 모듈의 함수 호출
             from species_verifier.gui.bridge import process_file
-            names_list = process_file(file_path)
+            names_list, self.file_dedup_info["col"] = process_file(file_path, return_stats=True)
             
             # 취소 여부 확인
             if self.is_cancelled:
@@ -1187,8 +1044,8 @@ class SpeciesVerifierApp(ctk.CTk):
         
         # 전체 처리 수 설정 (통계 표시용)
         self.total_processed_marine = len(verification_list)
-        # 중복 카운터 초기화
-        self.duplicates_ignored_marine = 0
+        # 네트워크 호출 전 중복 제거 (제거된 중복 수로 카운터 초기화)
+        verification_list, self.duplicates_ignored_marine = self._preflight_dedupe(verification_list, "marine")
         print(f"[Debug Stats] 해양생물 탭 전체 처리 수 설정: {self.total_processed_marine}")
         
         # 처리 방식에 따른 진행 UI 표시
@@ -1225,8 +1082,8 @@ class SpeciesVerifierApp(ctk.CTk):
         
         # 전체 처리 수 설정 (통계 표시용)
         self.total_processed_marine = len(verification_list)
-        # 중복 카운터 초기화
-        self.duplicates_ignored_marine = 0
+        # 네트워크 호출 전 중복 제거 (제거된 중복 수로 카운터 초기화)
+        verification_list, self.duplicates_ignored_marine = self._preflight_dedupe(verification_list, "marine")
         print(f"[Debug Stats] 해양생물 탭 전체 처리 수 설정: {self.total_processed_marine}")
         
         # 검색 옵션 처리
@@ -1259,124 +1116,17 @@ class SpeciesVerifierApp(ctk.CTk):
              self.marine_tab.file_path_var.set("") # 파일 경로 초기화 (버튼 상태도 업데이트됨)
     
     def _perform_verification(self, verification_list_input, use_realtime: bool = False):
-        """해양생물 검증 수행 (백그라운드 스레드에서 실행) - 실시간/배치 처리 구분"""
+        """해양생물 검증 수행 (백그라운드 스레드에서 실행) - 소스별 작업자 풀로 동시 처리"""
         try:
             # 취소 플래그 초기화
             self.is_cancelled = False
             
-            # 취소 확인 함수 정의
-            def check_cancelled():
-                return self.is_cancelled
-            
             # 전체 항목 수 저장
             self.total_verification_items = len(verification_list_input)
             print(f"[Debug Marine] 전체 해양생물 항목 수 설정: {self.total_verification_items}")
             
-            # 설정 로드
-            from species_verifier.config import app_config, api_config
-            
-            # 실시간 처리 vs 배치 처리
-            if use_realtime:
-                # 실시간 처리 - 배치 지연 없이 빠르게 처리
-                print(f"[Info Marine] 실시간 처리 시작: 총 {len(verification_list_input)}개 항목")
-                
-                # 결과 콜백 함수 정의
-                def result_callback_wrapper(result, tab_type):
-                    if not self.is_cancelled:
-                        self.result_queue.put((result, tab_type))
-                        print(f"[Debug] 해양생물 실시간 결과 추가: {result.get('input_name', '')}")
-                
-                # 실시간 처리 - 개별 항목 처리
-                from species_verifier.gui.bridge import perform_verification
-                batch_results = perform_verification(
-                    verification_list_input,
-                    lambda p, curr=None, total=None: self.after(0, lambda: self.update_progress(
-                        p, curr, len(verification_list_input)
-                    )),
-                    lambda msg: self.after(0, lambda: self._update_progress_label(f"실시간: {msg}")),
-                    result_callback=result_callback_wrapper,
-                    check_cancelled=check_cancelled,
-                    realtime_mode=True  # 실시간 모드 플래그
-                )
-                
-                print(f"[Info Marine] 실시간 처리 완료: {len(verification_list_input)}개 항목")
-                
-            else:
-                # 배치 처리 - 기존 방식
-                BATCH_SIZE = app_config.BATCH_SIZE  # 100개
-                BATCH_DELAY = api_config.BATCH_DELAY  # 3.0초
-                
-                total_items = len(verification_list_input)
-                total_batches = (total_items + BATCH_SIZE - 1) // BATCH_SIZE  # 올림 나눗셈
-                
-                print(f"[Info Marine] 배치 처리 시작: 총 {total_items}개 항목을 {total_batches}개 배치로 처리")
-                print(f"[Info Marine] 배치 크기: {BATCH_SIZE}개, 배치간 지연: {BATCH_DELAY}초")
-                
-                # 결과 콜백 함수 정의
-                def result_callback_wrapper(result, tab_type):
-                    if not self.is_cancelled:
-                        self.result_queue.put((result, tab_type))
-                        print(f"[Debug] 해양생물 배치 결과 추가: {result.get('input_name', '')}")
-                    else:
-                        print(f"[Debug] 취소되어 결과 무시: {result.get('input_name', '')}")
-                
-                # 배치별 처리
-                processed_items = 0
-                for batch_idx in range(total_batches):
-                    # 취소 확인
-                    if self.is_cancelled:
-                        print(f"[Info Marine] 배치 {batch_idx + 1}/{total_batches} 처리 전 취소 감지")
-                        break
-                    
-                    # 현재 배치 생성
-                    start_idx = batch_idx * BATCH_SIZE
-                    end_idx = min(start_idx + BATCH_SIZE, total_items)
-                    current_batch = verification_list_input[start_idx:end_idx]
-                    
-                    print(f"[Info Marine] 배치 {batch_idx + 1}/{total_batches} 처리 시작 ({start_idx + 1}-{end_idx})")
-                    
-                    # 배치 진행률 업데이트
-                    batch_progress = batch_idx / total_batches
-                    self.after(0, lambda p=batch_progress: self.update_progress(p, batch_idx * BATCH_SIZE, total_items))
-                    self.after(0, lambda: self._update_progress_label(f"배치 {batch_idx + 1}/{total_batches} 처리 중..."))
-                    
-                    # 현재 배치 처리
-                    try:
-                        from species_verifier.gui.bridge import perform_verification
-                        batch_results = perform_verification(
-                            current_batch,
-                            lambda p, curr=None, total=None: self.after(0, lambda: self.update_progress(
-                                batch_progress + (p / total_batches), 
-                                processed_items + (curr or 0), 
-                                total_items
-                            )),
-                            lambda msg: self.after(0, lambda: self._update_progress_label(f"배치 {batch_idx + 1}/{total_batches}: {msg}")),
-                            result_callback=result_callback_wrapper,
-                            check_cancelled=check_cancelled
-                        )
-                        
-                        processed_items += len(current_batch)
-                        print(f"[Info Marine] 배치 {batch_idx + 1}/{total_batches} 완료, 처리된 항목: {processed_items}/{total_items}")
-                        
-                    except Exception as e:
-                        print(f"[Error Marine] 배치 {batch_idx + 1} 처리 중 오류: {e}")
-                        import traceback
-                        traceback.print_exc()
-                    
-                    # 마지막 배치가 아니면 배치간 지연 시간 적용
-                    if batch_idx < total_batches - 1 and not self.is_cancelled:
-                        print(f"[Info Marine] 배치간 지연 시간 적용: {BATCH_DELAY}초 대기")
-                        time.sleep(BATCH_DELAY)
-                    
-                    # 취소 확인 (지연 후)
-                    if self.is_cancelled:
-                        print(f"[Info Marine] 배치 {batch_idx + 1}/{total_batches} 처리 후 취소 감지")
-                        break
-                
-                if not self.is_cancelled:
-                    print(f"[Info Marine] 모든 배치 처리 완료: {processed_items}/{total_items}개 항목 처리됨")
-                else:
-                    print(f"[Info Marine] 배치 처리 취소됨: {processed_items}/{total_items}개 항목 처리됨")
+            # WoRMS 일괄 매칭 묶음 단위로 작업자 풀에서 처리 (호출 간격은 WoRMS 속도 제한이 담당)
+            self._run_verification_pipeline(verification_list_input, "marine", "Marine", "해양생물", use_realtime)
             
             if not self.is_cancelled:
                 # 검증 완료 후 파일 캐시 삭제
@@ -1481,8 +1231,8 @@ class SpeciesVerifierApp(ctk.CTk):
         
         # 전체 처리 수 설정 (통계 표시용)
         self.total_processed_microbe = len(microbe_names_list)
-        # 중복 카운터 초기화
-        self.duplicates_ignored_microbe = 0
+        # 네트워크 호출 전 중복 제거 (제거된 중복 수로 카운터 초기화)
+        microbe_names_list, self.duplicates_ignored_microbe = self._preflight_dedupe(microbe_names_list, "microbe")
         print(f"[Debug Stats] 미생물 탭 전체 처리 수 설정: {self.total_processed_microbe}")
         
         # 진행 UI 표시 (초기 메시지 개선)
@@ -1513,128 +1263,21 @@ class SpeciesVerifierApp(ctk.CTk):
             self.microbe_tab.file_path_var.set("") # 파일 경로 초기화 (버튼 상태도 업데이트됨)
     
     def _perform_microbe_verification(self, microbe_names_list, context: Union[List[str], str, None] = None, use_realtime: bool = False):
-        """미생물 검증 수행 (백그라운드 스레드에서 실행) - 실시간/배치 처리 구분"""
+        """미생물 검증 수행 (백그라운드 스레드에서 실행) - 소스별 작업자 풀로 동시 처리"""
         try:
             # 취소 플래그 초기화 및 취소 로깅 플래그 초기화
             self.is_cancelled = False
             if hasattr(self, '_cancel_logged'):
                 delattr(self, '_cancel_logged')
             
-            # 취소 확인 함수 정의
-            def check_cancelled():
-                return self.is_cancelled
-            
             # 전체 항목 수 저장
             self.total_verification_items = len(microbe_names_list)
             print(f"[Debug Microbe] 전체 미생물 항목 수 설정: {self.total_verification_items}")
+            if isinstance(context, str):  # 파일 경로인 경우
+                print(f"[Info Microbe] 파일 '{os.path.basename(context)}' 검증")
             
-            # 설정 로드
-            from species_verifier.config import app_config, api_config
-            
-            # 실시간 처리 vs 배치 처리
-            if use_realtime:
-                # 실시간 처리 - 배치 지연 없이 빠르게 처리
-                print(f"[Info Microbe] 실시간 처리 시작: 총 {len(microbe_names_list)}개 항목")
-                
-                # 결과 콜백 함수 정의
-                def result_callback_wrapper(result, *args):
-                    if not self.is_cancelled:
-                        self.result_queue.put((result, 'microbe'))
-                        print(f"[Debug] 미생물 실시간 결과 추가: {result.get('input_name', '')}")
-                
-                # 실시간 처리 - 개별 항목 처리
-                from species_verifier.gui.bridge import perform_microbe_verification
-                batch_results = perform_microbe_verification(
-                    microbe_names_list,
-                    lambda p, curr=None, total=None: self.after(0, lambda: self.update_progress(
-                        p, curr, len(microbe_names_list)
-                    )),
-                    lambda msg: self.after(0, lambda: self._update_progress_label(f"실시간: {msg}")),
-                    result_callback=result_callback_wrapper,
-                    context=context,
-                    check_cancelled=check_cancelled,
-                    realtime_mode=True  # 실시간 모드 플래그
-                )
-                
-                print(f"[Info Microbe] 실시간 처리 완료: {len(microbe_names_list)}개 항목")
-                
-            else:
-                # 배치 처리 - 기존 방식
-                BATCH_SIZE = app_config.BATCH_SIZE  # 100개
-                BATCH_DELAY = api_config.BATCH_DELAY  # 3.0초
-                
-                total_items = len(microbe_names_list)
-                total_batches = (total_items + BATCH_SIZE - 1) // BATCH_SIZE  # 올림 나눗셈
-                
-                print(f"[Info Microbe] 배치 처리 시작: 총 {total_items}개 항목을 {total_batches}개 배치로 처리")
-                print(f"[Info Microbe] 배치 크기: {BATCH_SIZE}개, 배치간 지연: {BATCH_DELAY}초")
-                
-                # 결과 콜백 함수 정의
-                def result_callback_wrapper(result, *args):
-                    if not self.is_cancelled:
-                        self.result_queue.put((result, 'microbe'))
-                        print(f"[Debug] 미생물 배치 결과 추가: {result.get('input_name', '')}")
-                    else:
-                        print(f"[Debug] 취소되어 결과 무시: {result.get('input_name', '')}")
-                
-                # 배치별 처리
-                processed_items = 0
-                for batch_idx in range(total_batches):
-                    # 취소 확인
-                    if self.is_cancelled:
-                        print(f"[Info Microbe] 배치 {batch_idx + 1}/{total_batches} 처리 전 취소 감지")
-                        break
-                    
-                    # 현재 배치 생성
-                    start_idx = batch_idx * BATCH_SIZE
-                    end_idx = min(start_idx + BATCH_SIZE, total_items)
-                    current_batch = microbe_names_list[start_idx:end_idx]
-                    
-                    print(f"[Info Microbe] 배치 {batch_idx + 1}/{total_batches} 처리 시작 ({start_idx + 1}-{end_idx})")
-                    
-                    # 배치 진행률 업데이트
-                    batch_progress = batch_idx / total_batches
-                    self.after(0, lambda p=batch_progress: self.update_progress(p, batch_idx * BATCH_SIZE, total_items))
-                    self.after(0, lambda: self._update_progress_label(f"배치 {batch_idx + 1}/{total_batches} 처리 중..."))
-                    
-                    # 현재 배치 처리
-                    try:
-                        from species_verifier.gui.bridge import perform_microbe_verification
-                        batch_results = perform_microbe_verification(
-                            current_batch,
-                            lambda p, curr=None, total=None: self.after(0, lambda: self.update_progress(
-                                batch_progress + (p / total_batches), 
-                                processed_items + (curr or 0), 
-                                total_items
-                            )),
-                            lambda msg: self.after(0, lambda: self._update_progress_label(f"배치 {batch_idx + 1}/{total_batches}: {msg}")),
-                            result_callback=result_callback_wrapper,
-                            context=context,
-                            check_cancelled=check_cancelled
-                        )
-                        
-                        processed_items += len(current_batch)
-                        print(f"[Info Microbe] 배치 {batch_idx + 1}/{total_batches} 완료, 처리된 항목: {processed_items}/{total_items}")
-                        
-                    except Exception as e:
-                        print(f"[Error Microbe] 배치 {batch_idx + 1} 처리 중 오류: {e}")
-                        import traceback
-                        traceback.print_exc()
-                    
-                    # 마지막 배치가 아니면 배치간 지연 시간 적용
-                    if batch_idx < total_batches - 1 and not self.is_cancelled:
-                        print(f"[Info Microbe] 배치간 지연 시간 적용: {BATCH_DELAY}초 대기")
-                        time.sleep(BATCH_DELAY)
-                    
-                    # 취소 확인 (지연 후)
-                    if self.is_cancelled:
-                        print(f"[Info Microbe] 배치 {batch_idx + 1}/{total_batches} 처리 후 취소 감지")
-                        break
-                
-                if not self.is_cancelled:
-                    print(f"[Info Microbe] 모든 배치 처리 완료: {processed_items}/{total_items}개 항목 처리됨")
-                else:
-                    print(f"[Info Microbe] 배치 처리 취소됨: {processed_items}/{total_items}개 항목 처리됨")
+            # 호출 간격은 LPSN 속도 제한이 담당
+            self._run_verification_pipeline(microbe_names_list, "microbe", "Microbe", "미생물", use_realtime)
             
             if not self.is_cancelled:
                 # 검증 완료 후 파일 캐시 삭제
@@ -1678,7 +1321,7 @@ class SpeciesVerifierApp(ctk.CTk):
         try:
             # 브릿지 모듈의 함수 호출
             from species_verifier.gui.bridge import process_file
-            names_list = process_file(file_path, korean_mode=False)  # 모든 탭에서 학명 모드로 처리
+            names_list, self.file_dedup_info[tab_name] = process_file(file_path, korean_mode=False, return_stats=True)  # 모든 탭에서 학명 모드로 처리
             
             # 파일에서 추출한 학명 수 저장 (진행률 표시용)
             self.current_file_item_count = len(names_list) if names_list else 0
@@ -1759,7 +1402,7 @@ class SpeciesVerifierApp(ctk.CTk):
         try:
             # 브릿지 모듈의 함수 호출
             from species_verifier.gui.bridge import process_microbe_file
-            names_list = process_microbe_file(file_path)
+            names_list, self.file_dedup_info["microbe"] = process_microbe_file(file_path, return_stats=True)
             
             # 취소 여부 확인
             if self.is_cancelled:
@@ -2541,6 +2184,156 @@ class SpeciesVerifierApp(ctk.CTk):
             self.after(3000, self._reset_status_ui)
 
     # --- 새로운 메서드: 단일 결과 업데이트 (수정: COL 탭 추가) --- 
+    def _preflight_dedupe(self, names, tab_type: str):
+        """
+        검증 시작 전(네트워크 호출 전) 이름 정규화 및 중복 제거
+        
+        Returns:
+            (고유 이름 목록, 제외된 중복 수 - 파일 로드 시 제거된 중복 포함)
+        """
+        if not isinstance(names, list) or not names:
+            return names, 0
+        
+        from species_verifier.utils.text_processor import deduplicate_names
+        unique_names, dedup_info = deduplicate_names(names)
+        duplicates = dedup_info['stats']['duplicates']
+        
+        # 파일에서 로드한 목록이면 파일 처리 단계에서 제거된 중복도 반영
+        file_info = self.file_dedup_info.get(tab_type)
+        if file_info and names is getattr(self, f"current_{tab_type}_names", None):
+            duplicates += file_info['stats']['duplicates']
+        
+        if duplicates:
+            print(f"[Info App] {tab_type} 사전 중복 제거: {len(names)}개 → {len(unique_names)}개 (중복 {duplicates}개 제외)")
+        return unique_names, duplicates
+    
+    def _run_verification_pipeline(self, items, source: str, log_tag: str, label: str, use_realtime: bool = False):
+        """
+        검증 항목을 소스별 작업자 풀(VerificationPipeline)로 처리합니다 (백그라운드 스레드에서 호출).
+        배치 모드에서는 네트워크 호출 전에 로컬 캐시를 일괄 조회하고, 새로 검증한 결과를 한 번에 저장합니다.
+        
+        Args:
+            items: 검증 항목 목록 (학명 또는 (표시 이름, 학명) 튜플)
+            source: 소스 이름 (탭 타입, 캐시 구분과 같은 'marine', 'microbe', 'col')
+            log_tag: 로그 태그 (예: 'Marine')
+            label: 진행 메시지에 표시할 이름 (예: '해양생물')
+            use_realtime: 실시간 모드 여부 (True이면 로컬 캐시를 사용하지 않음)
+            
+        Returns:
+            새로 검증한 결과 목록
+        """
+        import time
+        from species_verifier.config import api_config
+        from species_verifier.core.pipeline import VerificationPipeline
+        
+        mode_label = "실시간" if use_realtime else "배치"
+        if not use_realtime:
+            # 네트워크 호출 전에 로컬 캐시에서 전체 학명을 한 번에 조회 (적중 결과는 바로 표시)
+            items = self._resolve_local_cache(items, source, source)
+        total_items = len(items)
+        print(f"[Info {log_tag}] {mode_label} 처리 시작: 총 {total_items}개 항목 (동시 작업자 {api_config.PIPELINE_WORKERS.get(source, 1)}개)")
+        
+        def result_callback_wrapper(result, tab_type):
+            if not self.is_cancelled:
+                self.result_queue.put((result, tab_type))
+                print(f"[Debug] {label} {mode_label} 결과 추가: {result.get('input_name', '')}")
+        
+        def progress_wrapper(progress, current_item, total):
+            self.after(0, lambda p=progress, c=current_item: self.update_progress(p, c, total))
+            self.after(0, lambda c=current_item: self._update_progress_label(f"{mode_label}: {label} 검증 중... ({c}/{total})"))
+        
+        pipeline = VerificationPipeline(
+            result_callback=result_callback_wrapper,
+            progress_callback=progress_wrapper,
+            check_cancelled=lambda: self.is_cancelled
+        )
+        start_time = time.time()
+        results = pipeline.run(items, default_source=source).get(source, [])
+        duration = time.time() - start_time
+        if not use_realtime:
+            self._store_local_cache(results, source, items)
+        
+        if not self.is_cancelled:
+            print(f"[Info {log_tag}] {mode_label} 처리 완료: {len(results)}/{total_items}개 항목 처리됨 (소요시간 {duration:.2f}초)")
+        else:
+            print(f"[Info {log_tag}] {mode_label} 처리 취소됨: {len(results)}/{total_items}개 항목 처리됨")
+        return results
+    
+    @staticmethod
+    def _cache_query_name(item) -> str:
+        """검증 항목(학명 또는 (표시 이름, 학명) 튜플)의 캐시 조회용 학명"""
+        if isinstance(item, (tuple, list)):
+            return item[1] if len(item) > 1 and item[1] else item[0]
+        return item
+    
+    def _resolve_local_cache(self, items, source_db: str, tab_type: str):
+        """
+        배치 검증 전에 로컬 캐시(SQLite)에서 모든 학명을 한 번에 조회합니다.
+        적중한 결과는 바로 결과 큐에 넣고, 네트워크 검증이 필요한 항목만 반환합니다.
+        
+        Args:
+            items: 검증 항목 목록
+            source_db: 캐시 구분 이름 (탭 타입과 같은 'marine', 'microbe', 'col')
+            tab_type: 결과를 표시할 탭 타입
+        """
+        if not isinstance(items, list) or not items:
+            return items
+        try:
+            from species_verifier.database.secure_mode import get_secure_database_manager
+            queries = [self._cache_query_name(item) for item in items]
+            cached = get_secure_database_manager().get_many(queries, source_db)
+        except Exception as e:
+            print(f"[Warning] 로컬 캐시 일괄 조회 실패, 전체 항목을 검증합니다: {e}")
+            return items
+        
+        remaining = []
+        for item, query in zip(items, queries):
+            data = cached.get(query)
+            if data is None:
+                remaining.append(item)
+                continue
+            result = dict(data)
+            result['input_name'] = item[0] if isinstance(item, (tuple, list)) else item
+            self.result_queue.put((result, tab_type))
+        
+        if cached:
+            print(f"[Info App] {tab_type} 로컬 캐시 적중 {len(items) - len(remaining)}개, 네트워크 검증 {len(remaining)}개")
+        return remaining
+    
+    def _store_local_cache(self, results: List[Dict[str, Any]], source_db: str, items):
+        """
+        새로 검증한 결과를 로컬 캐시에 한 번에 저장합니다 (오류/취소 결과 제외).
+        
+        결과의 input_name은 표시 이름(한글명일 수 있음)이므로, 검증 항목에서 조회한 학명을 찾아
+        _resolve_local_cache와 같은 키로 저장합니다.
+        
+        Args:
+            results: 검증 결과 목록
+            source_db: 캐시 구분 이름
+            items: 결과를 만든 검증 항목 목록 (학명 또는 (표시 이름, 학명) 튜플)
+        """
+        if not results:
+            return
+        # 표시 이름 → 조회 학명 (같은 표시 이름이 서로 다른 학명을 가리키면 어느 쪽인지 알 수 없으므로 저장하지 않음)
+        query_by_display: Dict[str, Optional[str]] = {}
+        for item in items or []:
+            display = item[0] if isinstance(item, (tuple, list)) else item
+            query = self._cache_query_name(item)
+            query_by_display[display] = query if query_by_display.get(display, query) == query else None
+        try:
+            from species_verifier.core.memory_cache import is_cacheable_result
+            from species_verifier.database.secure_mode import get_secure_database_manager
+            records = [
+                {'scientific_name': query_by_display[result['input_name']], 'source_db': source_db, 'data': result}
+                for result in results
+                if isinstance(result.get('input_name'), str) and query_by_display.get(result['input_name'])
+                and is_cacheable_result(result)
+            ]
+            if records:
+                get_secure_database_manager().set_many(records)
+        except Exception as e:
+            print(f"[Warning] 로컬 캐시 일괄 저장 실패: {e}")
+    
     def _update_single_result(self, result: Dict[str, Any], tab_type: str):
         """개별 검증 결과를 받아 GUI에 업데이트 (메인 스레드에서 실행)"""
         if not result:
@@ -3062,6 +2855,7 @@ class SpeciesVerifierApp(ctk.CTk):
             self.current_microbe_names = []
         elif tab_type == "col":
             self.current_col_names = []
+        self.file_dedup_info.pop(tab_type, None)
     
     def _check_file_size_and_warn(self, file_path: str, tab_name: str) -> bool:
         """
@@ -3174,7 +2968,7 @@ class SpeciesVerifierApp(ctk.CTk):
         
         # 전체 처리 수 설정 (통계 표시용)
         self.total_processed_microbe = len(microbe_names_list)
-        self.duplicates_ignored_microbe = 0
+        microbe_names_list, self.duplicates_ignored_microbe = self._preflight_dedupe(microbe_names_list, "microbe")
         print(f"[Debug Stats] 미생물 탭 전체 처리 수 설정: {self.total_processed_microbe}")
         
         # 검색 옵션 처리
@@ -3290,7 +3084,7 @@ class SpeciesVerifierApp(ctk.CTk):
         
         # 전체 처리 수 설정 (통계 표시용)
         self.total_processed_col = len(verification_list)
-        self.duplicates_ignored_col = 0
+        verification_list, self.duplicates_ignored_col = self._preflight_dedupe(verification_list, "col")
         print(f"[Debug Stats] COL 탭 전체 처리 수 설정: {self.total_processed_col}")
         
         # 검색 옵션 처리
@@ -126,25 +126,32 @@ def perform_verification(
             # 캐시 미스가 있을 때만 실시간 검색 수행
             if cache_misses:
                 print(f"[Info Cache] {len(cache_misses)}개 항목에 대해 실시간 검색을 수행합니다")
+                # 실시간 결과는 모아 두었다가 검색 후 일괄 저장 (중단된 경우에도 받은 결과는 저장)
+                pending_cache_saves = []
                 # 실시간 검색 모드로 전환하여 재귀 호출
-                realtime_results = perform_verification(
-                    cache_misses, 
-                    update_progress=lambda progress, current, total: update_progress(
-                        (len(cache_results) + progress * len(cache_misses)) / len(verification_list_input),
-                        len(cache_results) + int(current or 0),
-                        len(verification_list_input)
-                    ) if update_progress else None,
-                    update_status=update_status,
-                    result_callback=lambda result, tab: (
-                        # 실시간 결과를 캐시에 저장
-                        cache_manager.save_realtime_result(result['input_name'], "marine", result),
-                        # 콜백 호출
-                        result_callback(result, tab) if result_callback else None
-                    ),
-                    check_cancelled=check_cancelled,
-                    realtime_mode=True,
-                    search_options={"search_mode": "realtime"}
-                )
+                try:
+                    realtime_results = perform_verification(
+                        cache_misses, 
+                        update_progress=lambda progress, current, total: update_progress(
+                            (len(cache_results) + progress * len(cache_misses)) / len(verification_list_input),
+                            len(cache_results) + int(current or 0),
+                            len(verification_list_input)
+                        ) if update_progress else None,
+                        update_status=update_status,
+                        result_callback=lambda result, tab: (
+                            # 실시간 결과를 캐시 저장 대기 목록에 추가
+                            pending_cache_saves.append(result),
+                            # 콜백 호출
+                            result_callback(result, tab) if result_callback else None
+                        ),
+                        check_cancelled=check_cancelled,
+                        realtime_mode=True,
+                        search_options={"search_mode": "realtime"}
+                    )
+                finally:
+                    # 검색 중 예외가 나도 이미 받은 실시간 결과는 저장
+                    if pending_cache_saves:
+                        cache_manager.save_realtime_results(pending_cache_saves, "marine")
                 
                 # 결과 병합
                 all_results = cache_results + (realtime_results or [])
@@ -159,9 +166,10 @@ def perform_verification(
             # 캐시 오류 시 실시간 검색으로 폴백
             search_mode = "realtime"
     
-    # API 지연 시간 확인 및 조정
-    from species_verifier.core.worms_api import API_DELAY
-    print(f"[Debug Bridge] 현재 API 지연 시간: {API_DELAY}초")
+    # 업스트림 속도 제한 확인 (호출 간격은 WoRMS 클라이언트의 토큰 버킷이 담당)
+    from species_verifier.core.rate_limiter import get_rate_limiter
+    worms_limit = get_rate_limiter().get("worms")
+    print(f"[Debug Bridge] WoRMS 속도 제한: 초당 {worms_limit.rate:.2f}회 (버스트 {worms_limit.burst})")
     
     # 수정: 클래스 존재 여부 확인
     if HAS_CORE_MODULES and MarineSpeciesVerifier:
@@ -172,23 +180,11 @@ def perform_verification(
             adapted_msv_callback = lambda r_dict, t="marine": result_callback(r_dict, t)
 
         try:
-            # 실시간 모드에 따른 설정 (차단 방지를 위한 안전 지연 시간 적용)
+            # 실시간/배치 모드 모두 같은 속도 제한을 사용 (고정 지연 없음)
             if realtime_mode:
                 print(f"[Bridge] 실시간 모드: {len(verification_list_input)}개 항목 빠르게 처리")
-                # 실시간 모드에서도 차단 방지를 위한 안전 지연 시간 적용
-                from species_verifier.config import api_config
-                api_delay = api_config.REALTIME_REQUEST_DELAY  # 0.8초 (차단 방지)
             else:
                 print(f"[Bridge] 배치 모드: {len(verification_list_input)}개 항목 안정적으로 처리")
-                # 배치 모드에서는 더 안전한 지연 시간 사용
-                from species_verifier.config import api_config
-                api_delay = api_config.REQUEST_DELAY  # 1.5초 (차단 방지)
-            
-            # API 지연 시간 적용
-            import species_verifier.core.worms_api as worms_api
-            original_delay = worms_api.API_DELAY
-            worms_api.API_DELAY = api_delay
-            print(f"[Debug Bridge] API 지연 시간 설정: {original_delay}초 -> {api_delay}초")
             
             # 수정: Verifier 인스턴스 생성 및 어댑터 콜백 전달
             verifier = MarineSpeciesVerifier(
@@ -258,13 +254,6 @@ def perform_verification(
                     except Exception as item_e:
                         print(f"[Error Bridge] 항목 '{item}' 검증 중 오류: {item_e}")
             
-            # API 지연 시간 복원
-            try:
-                worms_api.API_DELAY = original_delay
-                print(f"[Debug Bridge] API 지연 시간 복원: {api_delay}초 -> {original_delay}초")
-            except:
-                pass
-            
             # 결과 확인
             print(f"[Debug Bridge] 검증 결과 수: {len(results) if results else 0}")
             return results
@@ -419,15 +408,35 @@ def perform_microbe_verification(
         return original_perform_microbe_verification(microbe_names_list, update_progress, update_status, result_callback, check_cancelled)
 
 
-def process_file(file_path, korean_mode=False):
+def _deduplicate_file_names(names: List[Any], label: str) -> Tuple[List[Any], Dict[str, Any]]:
+    """
+    파일에서 추출한 이름을 네트워크 호출 전에 정규화하고 중복을 제거합니다.
+    
+    Returns:
+        (고유 이름 목록, 중복 제거 정보 - text_processor.deduplicate_names 참고)
+    """
+    from species_verifier.utils.text_processor import deduplicate_names
+    
+    unique_names, dedup_info = deduplicate_names(names)
+    stats = dedup_info['stats']
+    print(f"[Info Bridge] {label} 사전 중복 제거: 전체 {stats['total']}개 → 고유 {stats['unique']}개 "
+          f"(중복 {stats['duplicates']}개, 빈 항목 {stats['empty']}개)")
+    return unique_names, dedup_info
+
+
+def process_file(file_path, korean_mode=False, return_stats=False):
     """파일에서 학명 또는 한글명-학명 쌍을 추출합니다.
     
+    대소문자/공백/저자 표기만 다른 중복 학명은 API 호출 전에 하나로 합칩니다.
+    
     Args:
         file_path (str): 처리할 파일 경로
         korean_mode (bool): 한글명 모드 여부 (True=한글명 있음, False=학명만)
+        return_stats (bool): True이면 (목록, 중복 제거 정보) 튜플 반환
 
     Returns:
         List[str] 또는 List[Tuple[str, str]]: 추출된 학명 목록 또는 (한글명, 학명) 튜플 목록
+        (return_stats=True이면 (목록, 중복 제거 정보) 튜플)
     """
     print(f"[Info] 파일 '{file_path}' 처리 시작.")
     
@@ -771,7 +780,10 @@ def process_file(file_path, korean_mode=False):
         import traceback
         print(f"[Error Bridge] 파일 처리 중 예측 못한 오류 발생: {e}")
         print(traceback.format_exc())
-        return []
+        return ([], None) if return_stats else []
+    
+    # 네트워크 호출 전 정규화/중복 제거 (제한 개수는 고유 학명 기준으로 적용)
+    results, dedup_info = _deduplicate_file_names(results, "파일")
     
     # 결과 요약 로그
     print(f"[Info Bridge] 최종 추출된 학명 수: {len(results)}")
@@ -797,18 +809,22 @@ def process_file(file_path, korean_mode=False):
         print(f"[ℹ️ INFO Security] {file_count}개 처리 시 약 {file_count * 2 / 60:.1f}분 소요 예상")
         print(f"[ℹ️ INFO Security] API 서버에 부하를 주지 않도록 천천히 처리됩니다.")
     
+    if return_stats:
+        return results, dedup_info
     return results
 
 
-def process_microbe_file(file_path: str) -> List[str]:
+def process_microbe_file(file_path: str, return_stats: bool = False) -> Union[List[str], Tuple[List[str], Optional[Dict[str, Any]]]]:
     """
     파일에서 미생물 학명 추출을 위한 브릿지 함수
+    (대소문자/공백/저자 표기만 다른 중복 학명은 API 호출 전에 하나로 합침)
     
     Args:
         file_path: 파일 경로
+        return_stats: True이면 (목록, 중복 제거 정보) 튜플 반환
         
     Returns:
-        추출된 미생물 학명 목록
+        추출된 미생물 학명 목록 (return_stats=True이면 (목록, 중복 제거 정보) 튜플)
     """
     import os
     import pandas as pd
@@ -918,7 +934,7 @@ def process_microbe_file(file_path: str) -> List[str]:
                 microbe_names = df[0].dropna().astype(str).tolist()
             except Exception as e:
                 print(f"[Error Bridge] CSV 파일 처리 최종 실패: {e}")
-                return []
+                return ([], None) if return_stats else []
     
     # Excel 파일 처리
     elif file_ext in ['.xlsx', '.xls']:
@@ -949,7 +965,7 @@ def process_microbe_file(file_path: str) -> List[str]:
                 
         except Exception as e:
             print(f"[Error Bridge] Excel 파일 처리 중 오류: {e}")
-            return []
+            return ([], None) if return_stats else []
     
     # 텍스트 파일 처리
     elif file_ext in ['.txt', '.tsv']:
@@ -970,7 +986,7 @@ def process_microbe_file(file_path: str) -> List[str]:
             
             if not lines:
                 print("[Warning Bridge] 파일을 읽을 수 없거나 비어 있습니다.")
-                return []
+                return ([], None) if return_stats else []
             
             # 헤더 확인 (첫 줄이 헤더 키워드를 포함하는지 확인)
             header_keywords = ['scientific_name', 'scientificname', 'scientific name', 'name', '학명', 'species', 'microbe', 'bacteria']
@@ -985,27 +1001,29 @@ def process_microbe_file(file_path: str) -> List[str]:
                 
         except Exception as e:
             print(f"[Error Bridge] 텍스트 파일 처리 중 오류: {e}")
-            return []
+            return ([], None) if return_stats else []
     
     # 결과 후처리
     try:
-        # 빈 문자열 제거만 수행 (중복 제거 안함)
-        microbe_names = [name for name in microbe_names if name and str(name).strip()]
+        # 빈 항목 제거 및 정규화 기준 중복 제거 (네트워크 호출 전)
+        microbe_names, dedup_info = _deduplicate_file_names(microbe_names, "미생물 파일")
         
         print(f"[Info Bridge] 최종 추출된 미생물 학명 수: {len(microbe_names)}")
         if microbe_names:
             print(f"[Info Bridge] 미생물 학명 샘플: {microbe_names[:min(5, len(microbe_names))]}")
         
+        if return_stats:
+            return microbe_names, dedup_info
         return microbe_names
         
     except Exception as e:
         print(f"[Error Bridge] 결과 처리 중 오류: {e}")
-        return []
+        return ([], None) if return_stats else []
     
     # 처리할 수 없는 파일 형식인 경우
     else:
         print(f"[Error Bridge] 지원하지 않는 파일 형식: {file_ext}")
-        return []
+        return ([], None) if return_stats else []
 
 
 def get_wiki_summary(search_term: str) -> str:
@@ -1032,36 +1050,26 @@ def get_wiki_summary(search_term: str) -> str:
 # process_col_file 함수는 더 이상 사용되지 않으므로 제거하였습니다.
 # 통합된 process_file 함수로 대체되었습니다.
 
-# 네트워크 I/O 최적화를 위한 비동기 배치 처리 함수 (필요시 활용 가능)
-async def process_batch_async(names: List[str], callback: Callable[[Dict[str, Any]], None] = None) -> List[Dict[str, Any]]:
+# 네트워크 I/O 최적화를 위한 비동기 배치 처리 함수 (헤드리스 서비스 등에서 사용)
+async def process_batch_async(names: List[str], callback: Callable[[Dict[str, Any]], None] = None,
+                              source: str = "marine", concurrency: Optional[Dict[str, int]] = None) -> List[Dict[str, Any]]:
     """
     학명 목록을 비동기로 배치 처리합니다.
-    네트워크 I/O가 많은 경우 성능 향상을 위해 사용할 수 있습니다.
+    연결 풀을 공유하는 httpx 비동기 클라이언트로 요청을 겹쳐 보내며,
+    소스별 동시 요청 수와 속도 제한을 지킵니다. 작업(Task)을 취소하면 검증이 중단됩니다.
     
     Args:
         names: 처리할 학명 목록
         callback: 결과를 처리할 콜백 함수
+        source: 검증 소스 ('marine'/'worms', 'microbe'/'lpsn', 'col')
+        concurrency: 소스별 최대 동시 요청 수 (기본값: APIConfig.ASYNC_CONCURRENCY)
         
     Returns:
-        처리된 결과 목록
+        처리된 결과 목록 (입력 순서)
     """
-    results = []
-    for name in names:
-        try:
-            # 실제 비동기 API 호출이 구현되면 여기서 사용
-            # result = await verify_species_async(name)  # 비동기 검증 함수 호출
-            
-            # 현재는 동기 방식 사용
-            result = {"name": name, "status": "processed"}  # 플레이스홀더
-            if callback:
-                callback(result)
-            results.append(result)
-            
-            # API 호출 후 지연 시간 추가 (서버 과부하 방지)
-            await asyncio.sleep(api_config.REQUEST_DELAY)
-        except Exception as e:
-            print(f"[Error] 처리 중 오류 발생: {e}")
-            results.append({"name": name, "error": str(e)})
-            # 오류 발생 시에도 잠시 대기하여 연속 오류 방지
-            await asyncio.sleep(api_config.REQUEST_DELAY)
-    return results 
\ No newline at end of file
+    from species_verifier.core.async_client import AsyncVerificationClient
+    
+    async with AsyncVerificationClient(concurrency=concurrency) as client:
+        results = await client.verify_many(list(names), source=source, callback=callback)
+    print(f"[Info Bridge] 비동기 배치 처리 완료: {len(results)}/{len(names)}개 ({source})")
+    return results
@@ -4,7 +4,7 @@
 이 모듈은 학명 등의 텍스트 처리와 정제를 위한 유틸리티 함수들을 제공합니다.
 """
 import re
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 def clean_scientific_name(input_name: str) -> str:
     """학명 문자열을 정리하고 표준 형식으로 변환
@@ -43,6 +43,87 @@ def clean_scientific_name(input_name: str) -> str:
     
     return cleaned
 
+def normalize_lookup_key(name: str) -> str:
+    """조회/중복 판별용 학명 키 생성 (공백 정리 + 대소문자 무시)
+    
+    Args:
+        name: 입력 학명
+        
+    Returns:
+        비교용 정규화 키 (빈 입력은 빈 문자열)
+    """
+    if not name:
+        return ""
+    return re.sub(r'\s+', ' ', str(name)).strip().casefold()
+
+def canonicalize_names(names: Sequence[Any]):
+    """학명 목록을 clean_scientific_name 규칙으로 한 번에 정리 (pandas 벡터 연산)
+    
+    Args:
+        names: 학명 목록 (list 또는 pandas Series)
+        
+    Returns:
+        정리된 학명 pandas Series (비어 있거나 NaN인 항목은 빈 문자열)
+    """
+    import pandas as pd
+    
+    series = pd.Series(names, dtype=object).fillna("").astype(str)
+    cleaned = series.str.strip().str.replace(r'\s+', ' ', regex=True)
+    cleaned = cleaned.where(~cleaned.str.lower().isin(['nan', 'none']), "")
+    
+    # 저자/연도 정보 제거 (clean_scientific_name과 같은 규칙)
+    cleaned = cleaned.str.replace(r'\s+\([^)]+\)', '', regex=True)
+    cleaned = cleaned.str.replace(r'\s+[A-Z][a-zA-Z]+,?\s+\d{4}', '', regex=True)
+    cleaned = cleaned.str.replace(r'\s+[A-Z][a-zA-Z]+,?\s+\&\s+[A-Z][a-zA-Z]+,?\s+\d{4}', '', regex=True)
+    
+    # 속명 첫 글자 대문자, 종소명 소문자
+    parts = cleaned.str.extract(r'^(\S+) (\S+)(.*)$')
+    binomial = parts[0].notna()
+    cleaned[binomial] = (parts.loc[binomial, 0].str.capitalize() + ' '
+                         + parts.loc[binomial, 1].str.lower() + parts.loc[binomial, 2])
+    return cleaned
+
+def deduplicate_names(items: Sequence[Any]) -> Tuple[List[Any], Dict[str, Any]]:
+    """네트워크 호출 전 학명 정규화 및 중복 제거
+    
+    대소문자/공백/저자 표기만 다른 항목은 같은 학명으로 보고 첫 번째 항목만 남깁니다.
+    (한글명, 학명) 튜플은 학명 기준으로 비교합니다. 결과 화면은 고유 항목만 표시하고
+    제외된 중복 수는 통계(중복 무시)로 보여 주므로 원본 행 위치는 따로 돌려주지 않습니다.
+    
+    Args:
+        items: 학명 문자열 또는 (표시 이름, 학명) 튜플 목록
+        
+    Returns:
+        (고유 항목 목록, 정보 딕셔너리)
+        정보 딕셔너리:
+            'keys': 고유 항목별 정규화 키
+            'stats': {'total', 'unique', 'duplicates', 'empty'}
+    """
+    items = list(items or [])
+    queries = [
+        (item[1] if len(item) > 1 and item[1] else item[0]) if isinstance(item, (tuple, list)) and item else item
+        for item in items
+    ]
+    keys = canonicalize_names(queries).str.casefold()
+    valid = keys != ""
+    
+    # 키별 첫 등장 위치 (원본 순서 유지)
+    valid_keys = keys[valid]
+    first_rows = valid_keys[~valid_keys.duplicated()].index.tolist()
+    
+    unique_items = [items[row] for row in first_rows]
+    unique_keys = [keys.iat[row] for row in first_rows]
+    info = {
+        'keys': unique_keys,
+        'stats': {
+            'total': len(items),
+            'unique': len(unique_items),
+            'duplicates': int(valid.sum()) - len(unique_items),
+            'empty': int((~valid).sum()),
+        },
+    }
+    return unique_items, info
+
 def is_korean(char: str) -> bool:
     """주어진 문자가 한글인지 확인
     
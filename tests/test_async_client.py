@@ -0,0 +1,152 @@
+"""
+비동기 검증 클라이언트(AsyncVerificationClient) 테스트
+
+httpx.MockTransport로 WoRMS 응답을 흉내 내므로 네트워크 없이 실행됩니다.
+
+실행 방법:
+python -m pytest tests/test_async_client.py
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from species_verifier.core import async_client
+from species_verifier.core.async_client import AsyncVerificationClient
+from species_verifier.core.memory_cache import MemoryCache
+from species_verifier.core.rate_limiter import RateLimiterRegistry
+
+
+def _match_response(request: httpx.Request) -> httpx.Response:
+    """요청한 학명마다 정확 일치 레코드 하나를 돌려주는 AphiaRecordsByMatchNames 응답"""
+    names = request.url.params.get_list("scientificnames[]")
+    return httpx.Response(200, json=[
+        [{'AphiaID': 1000 + index, 'scientificname': name, 'match_type': 'exact', 'kingdom': 'Animalia'}]
+        for index, name in enumerate(names)
+    ])
+
+
+@pytest.fixture
+def transport(monkeypatch):
+    """
+    요청마다 handler를 호출하는 가짜 전송 계층을 연결하고, 속도 제한/메모리 캐시는 테스트 전용으로 교체
+    (handler를 바꾸려면 반환된 딕셔너리의 'handler' 값을 교체)
+    """
+    state = {"handler": _match_response}
+
+    async def dispatch(request):
+        result = state["handler"](request)
+        if asyncio.iscoroutine(result):
+            result = await result
+        return result
+
+    def get_client(self, verify):
+        client = self._clients.get(verify)
+        if client is None:
+            client = httpx.AsyncClient(transport=httpx.MockTransport(dispatch))
+            self._clients[verify] = client
+        return client
+
+    monkeypatch.setattr(AsyncVerificationClient, "_get_client", get_client)
+    monkeypatch.setattr(async_client, "get_memory_cache", lambda: MemoryCache())
+    monkeypatch.setattr(async_client, "get_rate_limiter", lambda: RateLimiterRegistry(
+        limits={"worms": {"rate": 1000.0, "burst": 100, "min_rate": 1.0, "max_rate": 1000.0}}, hosts={}
+    ))
+    monkeypatch.setattr(async_client, "MATCH_BATCH_SIZE", 2)
+    return state
+
+
+def test_verify_many_keeps_input_order(transport):
+    """먼저 보낸 묶음이 늦게 끝나도 결과는 입력 순서"""
+    names = ['Gadus morhua', 'Mola mola', 'Salmo salar', 'Thunnus thynnus', 'Homo sapiens']
+    completed = []
+
+    async def slow_first_batch(request):
+        requested = request.url.params.get_list("scientificnames[]")
+        if names[0] in requested:
+            await asyncio.sleep(0.1)
+        completed.append(requested[0])
+        return _match_response(request)
+
+    transport["handler"] = slow_first_batch
+
+    async def scenario():
+        async with AsyncVerificationClient() as client:
+            return await client.verify_many(names, source="marine")
+
+    results = asyncio.run(scenario())
+
+    assert completed[-1] == names[0]
+    assert [result['input_name'] for result in results] == names
+    assert all(result['is_verified'] for result in results)
+
+
+def test_cancel_propagates_to_in_flight_requests(transport):
+    """verify_many 작업을 취소하면 진행 중인 요청도 모두 취소됨"""
+    started, cancelled = [], []
+
+    async def hang(request):
+        started.append(request)
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(request)
+            raise
+
+    transport["handler"] = hang
+
+    async def scenario():
+        async with AsyncVerificationClient() as client:
+            task = asyncio.ensure_future(client.verify_many(['Gadus morhua', 'Mola mola', 'Salmo salar'],
+                                                            source="worms"))
+            while len(started) < 2:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return len(started), len(cancelled)
+
+    assert asyncio.run(scenario()) == (2, 2)
+
+
+def test_unit_error_cancels_remaining_units(transport):
+    """한 묶음의 콜백이 예외를 내면 예외를 전달하고, 다른 묶음의 요청은 취소됨"""
+    cancelled = []
+
+    async def slow_second_batch(request):
+        if 'Salmo salar' in request.url.params.get_list("scientificnames[]"):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(request)
+                raise
+        return _match_response(request)
+
+    transport["handler"] = slow_second_batch
+
+    def failing_callback(result):
+        raise RuntimeError("콜백 오류")
+
+    async def scenario():
+        async with AsyncVerificationClient() as client:
+            with pytest.raises(RuntimeError):
+                await client.verify_many(['Gadus morhua', 'Mola mola', 'Salmo salar'],
+                                         source="worms", callback=failing_callback)
+            # 예외가 전달될 때는 이미 취소가 끝나 있어야 함 (asyncio.run 종료 시 정리에 기대지 않음)
+            return len(cancelled)
+
+    assert asyncio.run(scenario()) == 1
+
+
+def test_process_batch_async_returns_results(transport):
+    """process_batch_async는 가짜 전송 계층의 응답으로 만든 실제 검증 결과를 입력 순서로 반환"""
+    from species_verifier.gui.bridge import process_batch_async
+
+    received = []
+    results = asyncio.run(process_batch_async(['Gadus morhua', 'Mola mola', 'Salmo salar'],
+                                              callback=received.append, source="marine"))
+
+    assert [result['input_name'] for result in results] == ['Gadus morhua', 'Mola mola', 'Salmo salar']
+    assert [result['worms_id'] for result in results] == ['1000', '1001', '1000']
+    assert all(result['worms_status'] == 'WoRMS 등재 확인됨' for result in results)
+    assert len(received) == 3
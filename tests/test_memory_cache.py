@@ -0,0 +1,123 @@
+"""
+L1 메모리 캐시와 네거티브 캐시 TTL 테스트
+
+실행 방법:
+python -m pytest tests/test_memory_cache.py
+"""
+import time
+
+import pytest
+
+from species_verifier.core import worms_api
+from species_verifier.core.memory_cache import MemoryCache, is_negative_result
+from species_verifier.database.secure_mode import _is_negative_payload
+
+TTL = 6 * 3600
+NEGATIVE_TTL = 30 * 60
+
+# 소스별 찾지 못함/잘못된 입력 결과 (짧은 네거티브 TTL 대상)
+NEGATIVE_RESULTS = [
+    {'input_name': 'Fakeus fakeus', 'is_verified': False, 'worms_status': 'WoRMS 등록되지 않음'},
+    {'input_name': 'Fakeus fakeus', 'is_verified': False, 'col_status': 'Not Found'},
+    {'input_name': 'Fakeus fakeus', 'is_verified': False, 'status': 'Not found in LPSN'},
+    {'input_name': 'Fakeus fakeus', 'is_verified': False, 'status': 'LPSN 검색됨: 결과 없음'},
+    {'input_name': 'Fa', 'is_verified': False, 'status': 'Invalid input'},
+]
+
+
+def _remaining_ttl(cache: MemoryCache, source_db: str, name: str) -> float:
+    expires_at, _, _ = cache._entries[cache.make_key(source_db, name)]
+    return expires_at - time.monotonic()
+
+
+@pytest.mark.parametrize("result", NEGATIVE_RESULTS)
+def test_negative_results_use_negative_ttl(result):
+    """찾지 못함/잘못된 입력 결과는 네거티브 TTL로 저장 (SQLite 캐시도 네거티브로 분류)"""
+    cache = MemoryCache(ttl_seconds=TTL, negative_ttl_seconds=NEGATIVE_TTL)
+
+    assert cache.set("worms", result['input_name'], result) is True
+    assert is_negative_result(result) and _is_negative_payload(result)
+    assert NEGATIVE_TTL - 5 < _remaining_ttl(cache, "worms", result['input_name']) <= NEGATIVE_TTL
+    assert cache.get_stats()["negative_size"] == 1
+
+
+def test_verified_result_uses_normal_ttl():
+    """검증된 결과는 기본 TTL로 저장"""
+    cache = MemoryCache(ttl_seconds=TTL, negative_ttl_seconds=NEGATIVE_TTL)
+    result = {'input_name': 'Gadus morhua', 'is_verified': True, 'worms_status': 'WoRMS 등재 확인됨'}
+
+    assert cache.set("worms", 'Gadus morhua', result) is True
+    assert not is_negative_result(result)
+    assert _remaining_ttl(cache, "worms", 'Gadus morhua') > NEGATIVE_TTL
+    assert cache.get_stats()["negative_size"] == 0
+
+
+@pytest.mark.parametrize("result", [
+    {'error': '작업 취소됨', 'status': 'cancelled'},
+    {'input_name': 'Gadus morhua', 'is_verified': False, 'worms_status': 'WoRMS 네트워크 오류 (AphiaID): timeout'},
+    {'input_name': 'Gadus morhua', 'is_verified': False, 'status': 'LPSN 연결 타임아웃'},
+])
+def test_error_results_are_not_cached(result):
+    """오류/취소/연결 실패 결과는 저장하지 않음"""
+    cache = MemoryCache()
+    assert cache.set("worms", 'Gadus morhua', result) is False
+    assert cache.get("worms", 'Gadus morhua') is None
+
+
+class _FakeResponse:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self._payload = payload
+        self.content = b"" if payload is None else str(payload).encode()
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+@pytest.mark.parametrize("response", [_FakeResponse(200, -999), _FakeResponse(204)])
+def test_worms_unmatched_aphia_id_is_negative(monkeypatch, response):
+    """WoRMS AphiaID -999 / 204 응답은 '등록되지 않음' 네거티브 결과"""
+    monkeypatch.setattr(worms_api, "_worms_get", lambda url, **kwargs: response)
+    verify = worms_api.verify_single_species.__wrapped__.__wrapped__  # 메모리 캐시/요청 병합 제외
+
+    result = verify('Fakeus fakeus')
+
+    assert result['worms_status'] == 'WoRMS 등록되지 않음'
+    assert is_negative_result(result)
+
+
+@pytest.mark.parametrize("error", [
+    "WoRMS 예상치 못한 응답 형식 (AphiaRecordsByMatchNames)",
+    "WoRMS 일괄 매칭 최대 50개 초과 (51개)",
+])
+def test_worms_chunk_error_is_not_cached_or_persisted(monkeypatch, tmp_path, error):
+    """청크 전체 실패 결과는 상태 문구와 관계없이 메모리 캐시/로컬 캐시에 저장하지 않음"""
+    import queue
+    import types
+
+    from species_verifier.core.memory_cache import get_memory_cache, is_cacheable_result
+    from species_verifier.database import secure_mode
+    from species_verifier.gui.app import SpeciesVerifierApp
+
+    name = 'Chunkerrorus testus'
+    monkeypatch.setattr(worms_api, "get_aphia_records_by_match_names", lambda names, *args: {"error": error})
+
+    results = worms_api.verify_species_list([name])
+
+    assert results[0]['worms_status'] == error
+    assert not is_cacheable_result(results[0]) and not is_negative_result(results[0])
+    assert get_memory_cache().get("worms", name) is None
+
+    manager = secure_mode.SecureDatabaseManager(mode="local", local_db_path=str(tmp_path / "species_cache.db"))
+    manager.set_stale_handler(None)
+    try:
+        monkeypatch.setattr(secure_mode, "get_secure_database_manager", lambda: manager)
+        app = types.SimpleNamespace(result_queue=queue.Queue(), _cache_query_name=SpeciesVerifierApp._cache_query_name)
+        SpeciesVerifierApp._store_local_cache(app, results, 'marine', [name])
+
+        assert manager.get_many([name], 'marine') == {}
+    finally:
+        manager.close()
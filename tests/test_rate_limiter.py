@@ -0,0 +1,82 @@
+"""
+업스트림별 속도 제한(AIMD, Retry-After) 테스트
+
+실행 방법:
+python -m pytest tests/test_rate_limiter.py
+"""
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+
+from species_verifier.core.rate_limiter import RateLimiterRegistry, TokenBucket, parse_retry_after
+
+LIMITS = {"worms": {"rate": 1.0, "burst": 1, "min_rate": 0.1, "max_rate": 1.2}}
+
+
+def test_throttle_response_halves_rate_down_to_min():
+    """429/503 응답마다 속도를 배수로 낮추되 min_rate 아래로는 내려가지 않음"""
+    limiter = RateLimiterRegistry(limits=LIMITS, hosts={})
+
+    assert limiter.record_response("worms", 429) == 0.5
+    assert limiter.record_response("worms", 503) == 0.25
+    for _ in range(5):
+        limiter.record_response("worms", 429)
+    assert limiter.get("worms").rate == 0.1
+
+
+def test_success_response_increases_rate_up_to_max():
+    """정상 응답마다 속도를 조금씩 올리되 max_rate를 넘지 않음"""
+    limiter = RateLimiterRegistry(limits=LIMITS, hosts={})
+
+    assert abs(limiter.record_response("worms", 200) - 1.05) < 1e-9
+    for _ in range(10):
+        limiter.record_response("worms", 200)
+    assert limiter.get("worms").rate == 1.2
+
+    # 5xx(503 제외)는 속도를 바꾸지 않음
+    assert limiter.record_response("worms", 500) == 1.2
+
+
+def test_retry_after_pauses_bucket():
+    """Retry-After 동안 새 토큰을 내주지 않음"""
+    limiter = RateLimiterRegistry(limits=LIMITS, hosts={})
+    limiter.record_response("worms", 429, retry_after="10")
+
+    wait = limiter.get("worms").reserve()
+    assert wait >= 10
+
+
+def test_parse_retry_after_seconds_and_http_date():
+    """Retry-After 값은 초 또는 HTTP 날짜 모두 지원"""
+    assert parse_retry_after("30") == 30.0
+    assert parse_retry_after("-5") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("잘못된 값") is None
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 55 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 60
+
+
+def test_token_bucket_reserve_and_cancel():
+    """버킷이 비면 대기 시간을 돌려주고, 대기 중 취소하면 토큰을 반환"""
+    bucket = TokenBucket(rate=1.0, burst=1)
+    assert bucket.reserve() == 0.0
+    assert bucket.acquire(check_cancelled=lambda: True) is False
+    assert 0.9 <= bucket.reserve() <= 1.0
+
+
+def test_throttled_lpsn_client_records_responses(monkeypatch):
+    """LPSN 클라이언트 응답도 속도 조절에 반영 (429는 속도를 낮추고 Retry-After 동안 대기)"""
+    import types
+
+    from species_verifier.core import rate_limiter
+    from species_verifier.core.verifier import _throttle_lpsn_client
+
+    limiter = RateLimiterRegistry(limits={"lpsn": {"rate": 100.0, "burst": 10, "min_rate": 0.1, "max_rate": 200.0}},
+                                  hosts={})
+    monkeypatch.setattr(rate_limiter, "_rate_limiter", limiter)
+    response = types.SimpleNamespace(status_code=429, headers={"Retry-After": "10"})
+    client = _throttle_lpsn_client(types.SimpleNamespace(do_request=lambda url: response))
+
+    assert client.do_request("https://api.lpsn.dsmz.de/fetch/1") is response
+    assert limiter.get("lpsn").rate == 50.0
+    assert limiter.get("lpsn").reserve() >= 10
@@ -0,0 +1,177 @@
+"""
+로컬 SQLite 캐시(SecureDatabaseManager) 테스트
+
+실행 방법:
+python -m pytest tests/test_secure_mode.py
+"""
+import queue
+import sqlite3
+import types
+from datetime import datetime, timedelta
+
+import pytest
+
+from species_verifier.database import secure_mode
+from species_verifier.database.secure_mode import SecureDatabaseManager
+
+VERIFIED = {'input_name': 'Gadus morhua', 'is_verified': True, 'worms_status': 'WoRMS 등재 확인됨'}
+
+
+@pytest.fixture
+def secure_db(tmp_path):
+    """임시 경로의 로컬 모드 캐시 (재검증 스케줄러는 불러오지 않음)"""
+    manager = SecureDatabaseManager(mode="local", local_db_path=str(tmp_path / "species_cache.db"))
+    manager.set_stale_handler(None)
+    yield manager
+    manager.close()
+
+
+def test_set_many_get_many_round_trip_with_normalized_keys(secure_db):
+    """표기(대소문자/공백)만 다른 학명도 같은 캐시 항목으로 조회"""
+    saved = secure_db.set_many([
+        {'scientific_name': 'Gadus morhua', 'source_db': 'marine', 'data': VERIFIED},
+        {'scientific_name': 'Mola mola', 'source_db': 'marine', 'data': dict(VERIFIED, input_name='Mola mola')},
+    ])
+    assert saved == 2
+
+    found = secure_db.get_many(['gadus  morhua', 'GADUS MORHUA', 'Mola mola', 'Homo sapiens'], 'marine')
+
+    assert set(found) == {'gadus  morhua', 'GADUS MORHUA', 'Mola mola'}
+    assert found['GADUS MORHUA']['worms_status'] == 'WoRMS 등재 확인됨'
+    assert secure_db.get_many(['Gadus morhua'], 'col') == {}
+
+
+def test_set_many_overwrites_normalized_duplicate(secure_db):
+    """같은 정규화 키로 다시 저장하면 기존 항목을 갱신 (행이 늘지 않음)"""
+    secure_db.set_many([{'scientific_name': 'Gadus morhua', 'source_db': 'marine', 'data': VERIFIED}])
+    secure_db.set_many([{'scientific_name': 'gadus morhua', 'source_db': 'marine',
+                         'data': dict(VERIFIED, worms_id='126436')}])
+
+    assert secure_db._count_cache_rows(secure_db._get_connection()) == 1
+    assert secure_db.get_many(['Gadus morhua'], 'marine')['Gadus morhua']['worms_id'] == '126436'
+
+
+def test_app_stores_korean_name_input_under_scientific_name(secure_db, monkeypatch):
+    """(한글명, 학명) 입력 결과는 학명 키로 저장되어 다음 검증에서 로컬 캐시에 적중"""
+    from species_verifier.gui.app import SpeciesVerifierApp
+
+    monkeypatch.setattr(secure_mode, "get_secure_database_manager", lambda: secure_db)
+    app = types.SimpleNamespace(result_queue=queue.Queue(), _cache_query_name=SpeciesVerifierApp._cache_query_name)
+    items = [('대구', 'Gadus morhua')]
+
+    SpeciesVerifierApp._store_local_cache(app, [dict(VERIFIED, input_name='대구')], 'marine', items)
+    remaining = SpeciesVerifierApp._resolve_local_cache(app, items, 'marine', 'marine')
+
+    assert remaining == []
+    result, tab_type = app.result_queue.get_nowait()
+    assert (result['input_name'], tab_type) == ('대구', 'marine')
+
+
+def test_stale_handler_is_registered_on_own_instance(tmp_path):
+    """전역이 아닌 매니저도 자기 자신에게 재검증 훅을 등록 (전역 매니저/DB를 새로 만들지 않음)"""
+    manager = SecureDatabaseManager(mode="local", local_db_path=str(tmp_path / "species_cache.db"))
+    try:
+        handler = manager._get_stale_handler()
+
+        assert handler is not None
+        assert handler.__self__.secure_db is manager
+        assert secure_mode.secure_db_manager is not manager
+    finally:
+        manager.close()
+
+
+def test_evict_cache_removes_lowest_aged_hit_score_first(secure_db):
+    """LFU + 에이징: 오래 접근하지 않은 인기 항목이 최근의 적은 히트 항목보다 먼저 제거"""
+    now = datetime.now()
+    entries = {  # 학명: (히트 수, 마지막 접근)
+        'Gadus morhua': (10, now),
+        'Mola mola': (10, now - timedelta(days=300)),
+        'Homo sapiens': (0, now),
+        'Salmo salar': (3, now),
+        'Thunnus thynnus': (1, now),
+    }
+    secure_db.set_many([
+        {'scientific_name': name, 'source_db': 'marine', 'data': dict(VERIFIED, input_name=name)}
+        for name in entries
+    ])
+    conn = secure_db._get_connection()
+    with conn:
+        conn.executemany(
+            "UPDATE local_species_cache SET hit_count = ?, last_accessed = ? WHERE scientific_name = ?",
+            [(hits, accessed.isoformat(), name) for name, (hits, accessed) in entries.items()]
+        )
+
+    summary = secure_db.evict_cache(max_rows=4)
+
+    assert summary["evicted"] == 2  # 한도의 90%(3개)까지 줄임
+    remaining = set(secure_db.get_many(list(entries), 'marine'))
+    assert remaining == {'Gadus morhua', 'Salmo salar', 'Thunnus thynnus'}
+
+
+def test_existing_database_switches_to_incremental_vacuum_when_idle(tmp_path, monkeypatch):
+    """auto_vacuum이 꺼진 기존 DB는 초기화 때 모드만 확인하고, 저장이 한동안 없을 때 한 번 전환"""
+    db_path = str(tmp_path / "legacy_cache.db")
+    legacy = sqlite3.connect(db_path)
+    legacy.execute("CREATE TABLE legacy_marker (id INTEGER PRIMARY KEY)")
+    legacy.commit()
+    assert legacy.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+    legacy.close()
+
+    manager = SecureDatabaseManager(mode="local", local_db_path=db_path)
+    manager.set_stale_handler(None)
+    try:
+        conn = manager._get_connection()
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0  # 초기화에서는 VACUUM 하지 않음
+        assert manager.get_cache_stats()["vacuum_conversion_pending"] is True
+
+        manager.set_many([{'scientific_name': 'Gadus morhua', 'source_db': 'marine', 'data': VERIFIED}])
+        assert manager._is_vacuum_conversion_due() is False  # 방금 저장함
+
+        monkeypatch.setattr(secure_mode, "CACHE_VACUUM_IDLE_SECONDS", 0)
+        assert manager._is_vacuum_conversion_due() is True
+        assert manager.enable_incremental_vacuum() is True
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert manager._is_vacuum_conversion_due() is False
+    finally:
+        manager.close()
+
+
+def test_warmup_stores_korean_name_input_under_scientific_name(secure_db, monkeypatch):
+    """캐시 예열도 (한글명, 학명) 입력 결과를 학명 키로 저장"""
+    from species_verifier.core.pipeline import VerificationPipeline
+    from species_verifier.database.warmup import CacheWarmer
+
+    def fake_run(self, items, default_source=None):
+        return {default_source: [dict(VERIFIED, input_name=item[0]) for item in items]}
+
+    monkeypatch.setattr(VerificationPipeline, "run", fake_run)
+    summary = CacheWarmer(secure_db=secure_db).warm_up([('대구', 'Gadus morhua')], 'marine')
+
+    assert summary["cached"] == 1
+    assert set(secure_db.get_many(['Gadus morhua', '대구'], 'marine')) == {'Gadus morhua'}
+
+
+def test_cache_stats_per_source_counters(secure_db):
+    """소스별 항목 수는 트리거 카운터로 유지되고, 만료/네거티브 수와 함께 통계에 반영"""
+    not_found = {'input_name': 'Fakeus fakeus', 'is_verified': False, 'col_status': 'Not Found'}
+    secure_db.set_many([
+        {'scientific_name': 'Gadus morhua', 'source_db': 'marine', 'data': VERIFIED},
+        {'scientific_name': 'Mola mola', 'source_db': 'marine', 'data': dict(VERIFIED, input_name='Mola mola')},
+        {'scientific_name': 'Homo sapiens', 'source_db': 'col', 'data': dict(VERIFIED, input_name='Homo sapiens')},
+        {'scientific_name': 'Fakeus fakeus', 'source_db': 'col', 'data': not_found},
+    ])
+    conn = secure_db._get_connection()
+    with conn:
+        conn.execute("UPDATE local_species_cache SET expires_at = ? WHERE scientific_name = 'Mola mola'",
+                     ((datetime.now() - timedelta(days=1)).isoformat(),))
+        conn.execute("DELETE FROM local_species_cache WHERE scientific_name = 'Homo sapiens'")
+
+    stats = secure_db.get_cache_stats()
+
+    assert stats["total_cached"] == 3
+    assert stats["expired_cached"] == 1
+    assert stats["negative_cached"] == 1
+    assert stats["source_stats"] == {
+        'marine': {"total_cached": 2, "valid_cached": 1, "expired_cached": 1, "negative_cached": 0},
+        'col': {"total_cached": 1, "valid_cached": 1, "expired_cached": 0, "negative_cached": 1},
+    }
@@ -0,0 +1,129 @@
+"""
+중복 요청 병합(single-flight) 테스트
+
+실행 방법:
+python -m pytest tests/test_single_flight.py
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from species_verifier.core.single_flight import AsyncSingleFlight, SingleFlight, _copy_for_caller
+
+
+def _run_concurrently(flight, key, func, count=2):
+    """같은 키로 count번 동시에 호출하고 (결과, 공유 여부) 또는 예외 목록을 반환"""
+    outcomes = [None] * count
+
+    def call(index):
+        try:
+            outcomes[index] = flight.do(key, func, index)
+        except Exception as e:
+            outcomes[index] = e
+
+    threads = [threading.Thread(target=call, args=(index,)) for index in range(count)]
+    threads[0].start()
+    time.sleep(0.05)  # 첫 호출이 먼저 진행 중이 되도록
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return outcomes
+
+
+def test_copy_for_caller_is_independent():
+    """호출자별 복사본은 서로 영향을 주지 않고 input_name만 바뀜"""
+    original = {'input_name': 'Gadus morhua', 'taxonomy': {'genus': 'Gadus'}}
+    copied = _copy_for_caller(original, 'gadus  morhua')
+
+    copied['taxonomy']['genus'] = '변경됨'
+    assert copied['input_name'] == 'gadus  morhua'
+    assert original['input_name'] == 'Gadus morhua'
+    assert original['taxonomy']['genus'] == 'Gadus'
+
+
+def test_concurrent_calls_share_one_result():
+    """진행 중인 호출이 있으면 업스트림을 한 번만 호출하고 결과를 공유"""
+    flight = SingleFlight()
+    calls = []
+
+    def verify(index):
+        calls.append(index)
+        time.sleep(0.2)
+        return {'input_name': 'Gadus morhua', 'is_verified': True, 'worms_status': 'WoRMS 등재 확인됨'}
+
+    outcomes = _run_concurrently(flight, ('worms', 'gadus morhua'), verify, count=3)
+
+    assert calls == [0]
+    assert sorted(shared for _, shared in outcomes) == [False, True, True]
+    assert flight.stats == {"calls": 1, "shared": 2, "retried": 0}
+
+
+def test_waiters_retry_after_cancelled_or_error_result():
+    """먼저 시작한 호출이 취소/연결 오류 결과로 끝나면 기다리던 호출자는 직접 다시 호출"""
+    flight = SingleFlight()
+    calls = []
+
+    def verify(index):
+        calls.append(index)
+        if index == 0:
+            time.sleep(0.2)
+            return {'input_name': 'Gadus morhua', 'status': 'cancelled', 'worms_status': '작업 취소됨'}
+        return {'input_name': 'Gadus morhua', 'is_verified': True, 'worms_status': 'WoRMS 등재 확인됨'}
+
+    outcomes = _run_concurrently(flight, ('worms', 'gadus morhua'), verify)
+
+    assert sorted(calls) == [0, 1]
+    assert outcomes[1] == ({'input_name': 'Gadus morhua', 'is_verified': True,
+                            'worms_status': 'WoRMS 등재 확인됨'}, False)
+    assert flight.stats["retried"] == 1
+
+
+def test_waiters_retry_after_connection_error_but_reraise_other_errors():
+    """연결 오류는 직접 다시 시도하고, 그 외 예외는 기다리던 호출자에게도 전달"""
+    def failing(error):
+        def verify(index):
+            if index == 0:
+                time.sleep(0.2)
+                raise error
+            return {'input_name': 'Gadus morhua', 'is_verified': True}
+        return verify
+
+    outcomes = _run_concurrently(SingleFlight(), 'key', failing(ConnectionError("연결 실패")))
+    assert isinstance(outcomes[0], ConnectionError)
+    assert outcomes[1] == ({'input_name': 'Gadus morhua', 'is_verified': True}, False)
+
+    outcomes = _run_concurrently(SingleFlight(), 'key', failing(ValueError("잘못된 응답")))
+    assert isinstance(outcomes[0], ValueError)
+    assert outcomes[1] is outcomes[0]
+
+
+def test_async_waiter_retries_when_leader_is_cancelled():
+    """비동기: 먼저 시작한 작업이 취소되면 기다리던 쪽은 직접 다시 실행"""
+    async def scenario():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def verify():
+            calls.append(len(calls))
+            await asyncio.sleep(0.1)
+            return {'input_name': 'Mola mola', 'is_verified': True}
+
+        leader = asyncio.ensure_future(flight.do('mola mola', verify))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do('mola mola', verify))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        result, shared = await follower
+        return calls, result, shared, flight.stats
+
+    calls, result, shared, stats = asyncio.run(scenario())
+    assert calls == [0, 1]
+    assert result == {'input_name': 'Mola mola', 'is_verified': True}
+    assert shared is False
+    assert stats["retried"] == 1
@@ -0,0 +1,82 @@
+"""
+로컬 캐시 스냅샷 내보내기/가져오기 테스트
+
+실행 방법:
+python -m pytest tests/test_snapshot.py
+"""
+import gzip
+from datetime import datetime, timedelta
+
+import pytest
+
+from species_verifier.database.secure_mode import SecureDatabaseManager
+from species_verifier.database.snapshot import export_cache_snapshot, import_cache_snapshot
+
+
+def _manager(path):
+    manager = SecureDatabaseManager(mode="local", local_db_path=str(path))
+    manager.set_stale_handler(None)
+    return manager
+
+
+@pytest.fixture
+def source_db(tmp_path):
+    """스냅샷을 내보낼 PC의 캐시"""
+    manager = _manager(tmp_path / "source_cache.db")
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def target_db(tmp_path):
+    """스냅샷을 가져올 PC의 캐시"""
+    manager = _manager(tmp_path / "target_cache.db")
+    yield manager
+    manager.close()
+
+
+def _store(manager, name, worms_id, updated_at):
+    """학명 하나를 저장하고 updated_at을 지정한 시각으로 맞춤"""
+    data = {'input_name': name, 'is_verified': True, 'worms_status': 'WoRMS 등재 확인됨', 'worms_id': worms_id}
+    manager.set_many([{'scientific_name': name, 'source_db': 'marine', 'data': data}])
+    conn = manager._get_connection()
+    with conn:
+        conn.execute("UPDATE local_species_cache SET updated_at = ? WHERE scientific_name = ?",
+                     (updated_at.isoformat(), name))
+
+
+def test_import_merges_by_updated_at(source_db, target_db, tmp_path):
+    """가져오기는 없는 항목은 추가하고, 이미 있는 항목은 스냅샷 쪽이 더 최신일 때만 덮어씀"""
+    now = datetime.now()
+    _store(source_db, 'Gadus morhua', 'snapshot', now)
+    _store(source_db, 'Mola mola', 'snapshot', now - timedelta(days=10))
+    _store(source_db, 'Salmo salar', 'snapshot', now)
+
+    _store(target_db, 'gadus morhua', 'local', now - timedelta(days=10))  # 표기만 다른 오래된 항목
+    _store(target_db, 'Mola mola', 'local', now)  # 이 PC 쪽이 더 최신
+
+    path = str(tmp_path / "cache_snapshot.jsonl.gz")
+    assert export_cache_snapshot(path, secure_db=source_db)["exported"] == 3
+    summary = import_cache_snapshot(path, secure_db=target_db)
+
+    assert summary == {"read": 3, "inserted": 1, "updated": 1, "skipped": 1, "invalid": 0, "complete": True}
+    found = target_db.get_many(['Gadus morhua', 'Mola mola', 'Salmo salar'], 'marine')
+    assert {name: data['worms_id'] for name, data in found.items()} == {
+        'Gadus morhua': 'snapshot', 'Mola mola': 'local', 'Salmo salar': 'snapshot'
+    }
+
+
+def test_truncated_snapshot_is_reported_incomplete(source_db, target_db, tmp_path):
+    """끝 트레일러가 없는 잘린 파일은 읽은 항목까지만 반영하고 complete=False"""
+    _store(source_db, 'Gadus morhua', 'snapshot', datetime.now())
+    path = str(tmp_path / "cache_snapshot.jsonl.gz")
+    export_cache_snapshot(path, secure_db=source_db)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = f.readlines()
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.writelines(lines[:-1])
+
+    summary = import_cache_snapshot(path, secure_db=target_db)
+    assert summary["complete"] is False
+    assert summary["inserted"] == 1
@@ -0,0 +1,53 @@
+"""
+WoRMS 일괄 매칭 결과 변환 테스트
+
+실행 방법:
+python -m pytest tests/test_worms_api.py
+"""
+from species_verifier.core.worms_api import _build_match_results
+
+
+def _record(aphia_id, name, match_type):
+    return {'AphiaID': aphia_id, 'scientificname': name, 'match_type': match_type, 'kingdom': 'Animalia'}
+
+
+def test_exact_match_is_verified():
+    """정확 일치(exact) 레코드만 검증됨으로 처리"""
+    results = _build_match_results(['Gadus morhua'], [[_record(126436, 'Gadus morhua', 'exact')]])
+
+    assert results[0]['is_verified'] is True
+    assert results[0]['worms_id'] == '126436'
+    assert results[0]['worms_status'] == 'WoRMS 등재 확인됨'
+
+
+def test_fuzzy_match_is_only_suggested():
+    """유사 일치(phonetic, near_*)는 검증하지 않고 유사 학명으로만 제안"""
+    results = _build_match_results(
+        ['Gadus morua'],
+        [[_record(126436, 'Gadus morhua', 'phonetic'), _record(126437, 'Gadus macrocephalus', 'near_2')]]
+    )
+
+    assert results[0]['is_verified'] is False
+    assert results[0]['worms_status'] == 'WoRMS 등록되지 않음'
+    assert results[0]['similar_name'] == 'Gadus morhua'
+    assert results[0]['worms_id'] == '-'
+
+
+def test_exact_match_preferred_over_fuzzy():
+    """정확 일치가 뒤에 있어도 정확 일치 레코드를 사용"""
+    results = _build_match_results(
+        ['Gadus morhua'],
+        [[_record(1, 'Gadus marhua', 'near_1'), _record(126436, 'Gadus morhua', 'exact')]]
+    )
+
+    assert results[0]['is_verified'] is True
+    assert results[0]['worms_id'] == '126436'
+
+
+def test_no_match_and_chunk_error():
+    """매칭 없음은 등록되지 않음, 청크 전체 오류는 오류 상태로 표시"""
+    assert _build_match_results(['Nonexistus fakeus'], [[]])[0]['worms_status'] == 'WoRMS 등록되지 않음'
+
+    results = _build_match_results(['Gadus morhua'], {"error": "WoRMS 네트워크 오류"})
+    assert results[0]['is_verified'] is False
+    assert results[0]['worms_status'] == "WoRMS 네트워크 오류"